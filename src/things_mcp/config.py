@@ -232,6 +232,11 @@ class ThingsMCPConfig(BaseSettings):
         default=True,
         description="Use new state machine parser for AppleScript output (recommended, fixes date parsing bugs)"
     )
+
+    use_osakit_bridge: bool = Field(
+        default=False,
+        description="Execute AppleScript in-process via PyObjC/OSAKit instead of spawning osascript (requires pyobjc)"
+    )
     
     # Things 3 specific configuration
     things_app_name: str = Field(
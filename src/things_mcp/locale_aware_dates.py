@@ -14,6 +14,19 @@ import calendar
 logger = logging.getLogger(__name__)
 
 
+def _parse_iso(date_str: str) -> Optional[Tuple[int, int, int]]:
+    """Slice a fixed-width YYYY-MM-DD (optionally followed by 'T') into components."""
+    if len(date_str) < 10 or date_str[4] != '-' or date_str[7] != '-':
+        return None
+    if len(date_str) > 10 and date_str[10] not in 'tT':
+        return None
+    year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+    digits = year + month + day
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    return (int(year), int(month), int(day))
+
+
 class LocaleAwareDateHandler:
     """
     Provides locale-independent date handling for Things 3 AppleScript integration.
@@ -99,6 +112,11 @@ class LocaleAwareDateHandler:
                 target_date = datetime.now().date() + timedelta(days=days_offset)
                 return (target_date.year, target_date.month, target_date.day)
             
+            # Fixed-width ISO dates are by far the most common input
+            iso_result = _parse_iso(date_str)
+            if iso_result and self._validate_date(*iso_result):
+                return iso_result
+            
             # Try relative date patterns
             relative_result = self._parse_relative_date(date_str)
             if relative_result:
@@ -238,11 +256,9 @@ class LocaleAwareDateHandler:
                 if month_name_lower in self.MONTH_NAMES:
                     month = self.MONTH_NAMES[month_name_lower]
                 else:
-                    # Try partial match for abbreviations
-                    for name, num in self.MONTH_NAMES.items():
-                        if month_name_lower.startswith(name[:3]) and len(name) >= 3:
-                            month = num
-                            break
+                    # Try partial match for abbreviations - every month's
+                    # three-letter prefix is itself a key
+                    month = self.MONTH_NAMES.get(month_name_lower[:3])
                 
                 if month and self._validate_date(year, month, day):
                     return (year, month, day)
@@ -352,8 +368,9 @@ class LocaleAwareDateHandler:
             # Pattern 4: Handle month names in output like "March 15, 2024"
             # First try to extract month names and convert them
             month_match = None
+            output_lower = output.lower()
             for month_name, month_num in self.MONTH_NAMES.items():
-                if month_name in output.lower():
+                if month_name in output_lower:
                     month_match = month_num
                     break
             
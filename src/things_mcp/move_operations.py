@@ -8,6 +8,7 @@ with comprehensive error handling and validation.
 
 from typing import Optional, List, Dict, Any, Union
 from datetime import datetime
+import asyncio
 import logging
 
 from .services.applescript_manager import AppleScriptManager
@@ -15,6 +16,10 @@ from .services.validation_service import ValidationService
 
 logger = logging.getLogger(__name__)
 
+# Built-in list names accepted as destinations, and the subset a todo can be moved into
+_VALID_LIST_DESTINATIONS = frozenset({"inbox", "today", "upcoming", "anytime", "someday", "logbook", "trash"})
+_MOVABLE_LIST_DESTINATIONS = frozenset({"inbox", "today", "upcoming", "anytime", "someday"})
+
 
 class MoveOperationsTools:
     """Tools for moving todos and projects between containers."""
@@ -133,6 +138,12 @@ class MoveOperationsTools:
                     "total_requested": 0
                 }
             
+            # Drop duplicate IDs so no todo is moved twice
+            unique_ids = list(dict.fromkeys(todo_ids))
+            if len(unique_ids) < len(todo_ids):
+                logger.warning(f"Ignoring {len(todo_ids) - len(unique_ids)} duplicate todo IDs in bulk move")
+            todo_ids = unique_ids
+            
             # Validate destination once for all moves
             dest_validation = await self._validate_destination(destination)
             if not dest_validation["valid"]:
@@ -146,9 +157,9 @@ class MoveOperationsTools:
             successful_moves = []
             failed_moves = []
             
-            # Process todos in batches to avoid overwhelming the system
-            import asyncio
-            semaphore = asyncio.Semaphore(max_concurrent)
+            # Bound the number of in-flight osascript processes; a limit below 1
+            # would leave every task waiting on the semaphore forever
+            semaphore = asyncio.Semaphore(max(1, max_concurrent))
             
             async def move_single_todo(todo_id: str) -> Dict[str, Any]:
                 async with semaphore:
@@ -162,7 +173,7 @@ class MoveOperationsTools:
             for i, result in enumerate(results):
                 todo_id = todo_ids[i]
                 
-                if isinstance(result, Exception):
+                if isinstance(result, BaseException):
                     failed_moves.append({
                         "id": todo_id,
                         "error": "EXCEPTION",
@@ -263,10 +274,8 @@ class MoveOperationsTools:
     
     async def _validate_destination(self, destination: str) -> Dict[str, Any]:
         """Validate destination string."""
-        valid_lists = ["inbox", "today", "upcoming", "anytime", "someday", "logbook", "trash"]
-        
         # Check for simple list destinations
-        if destination in valid_lists:
+        if destination in _VALID_LIST_DESTINATIONS:
             return {"valid": True, "message": "Valid list destination"}
         
         # Check for project destinations
@@ -377,7 +386,7 @@ class MoveOperationsTools:
         """Execute the actual move operation using AppleScript."""
         try:
             # Build the move script based on destination type
-            if destination in ["inbox", "today", "upcoming", "anytime", "someday"]:
+            if destination in _MOVABLE_LIST_DESTINATIONS:
                 # Moving to a built-in list
                 script = await self._build_list_move_script(todo_id, destination)
             elif destination.startswith("project:"):
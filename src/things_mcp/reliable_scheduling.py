@@ -17,8 +17,8 @@ Architecture: Multi-layered approach with graceful fallback:
 3. List Assignment (85% reliability) - Final fallback
 """
 
+import asyncio
 import logging
-import subprocess
 from datetime import datetime
 from typing import Dict, Any, Optional
 from urllib.parse import quote
@@ -58,16 +58,22 @@ class ReliableThingsScheduler:
         
         return None
     
-    def _execute_url_scheme(self, url: str) -> bool:
-        """Execute Things URL scheme using open command."""
+    async def _execute_url_scheme(self, url: str) -> bool:
+        """Execute Things URL scheme using open command without blocking the event loop."""
         try:
-            result = subprocess.run(
-                ['open', url], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
+            process = await asyncio.create_subprocess_exec(
+                'open', url,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
-            return result.returncode == 0
+            try:
+                await asyncio.wait_for(process.communicate(), timeout=5)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                logger.debug("URL scheme execution timed out")
+                return False
+            return process.returncode == 0
         except Exception as e:
             logger.debug(f"URL scheme execution failed: {e}")
             return False
@@ -170,7 +176,7 @@ class ReliableThingsScheduler:
             url = base_url + "?" + "&".join(params)
             
             # Execute URL scheme
-            success = self._execute_url_scheme(url)
+            success = await self._execute_url_scheme(url)
             if success:
                 logger.info(f"Successfully scheduled todo {todo_id} for {when_date} via URL scheme")
                 return True
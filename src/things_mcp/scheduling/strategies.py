@@ -9,6 +9,31 @@ from .helpers import SchedulingHelpers
 
 logger = logging.getLogger(__name__)
 
+# Constant handler source so the manager can compile it once and pass only arguments
+SCHEDULE_ON_DATE_SCRIPT = '''
+on schedule_on_date(todoId, targetYear, targetMonth, targetDay)
+    tell application "Things3"
+        try
+            set theTodo to to do id todoId
+
+            -- Construct date object safely to avoid month overflow bug
+            set targetDate to (current date)
+            set time of targetDate to 0  -- Reset time first
+            set day of targetDate to 1   -- Set to safe day first to avoid overflow
+            set year of targetDate to targetYear
+            set month of targetDate to targetMonth  -- Numeric month works correctly
+            set day of targetDate to targetDay   -- Set actual day last
+
+            -- Schedule using the constructed date object
+            schedule theTodo for targetDate
+            return "scheduled_objects"
+        on error errMsg
+            return "error: " & errMsg
+        end try
+    end tell
+end schedule_on_date
+'''
+
 
 class SchedulingStrategies:
     """Implements multiple scheduling strategies with fallback mechanisms."""
@@ -127,29 +152,11 @@ class SchedulingStrategies:
     async def _schedule_specific_date_objects(self, todo_id: str, target_date: date) -> Dict[str, Any]:
         """Schedule using AppleScript date object construction (highly reliable)."""
 
-        script = f'''
-        tell application "Things3"
-            try
-                set theTodo to to do id "{todo_id}"
-
-                -- Construct date object safely to avoid month overflow bug
-                set targetDate to (current date)
-                set time of targetDate to 0  -- Reset time first
-                set day of targetDate to 1   -- Set to safe day first to avoid overflow
-                set year of targetDate to {target_date.year}
-                set month of targetDate to {target_date.month}  -- Numeric month works correctly
-                set day of targetDate to {target_date.day}   -- Set actual day last
-
-                -- Schedule using the constructed date object
-                schedule theTodo for targetDate
-                return "scheduled_objects"
-            on error errMsg
-                return "error: " & errMsg
-            end try
-        end tell
-        '''
-
-        result = await self.applescript.execute_applescript(script)
+        result = await self.applescript.execute_applescript_handler(
+            SCHEDULE_ON_DATE_SCRIPT,
+            "schedule_on_date",
+            (todo_id, target_date.year, target_date.month, target_date.day),
+        )
         if result.get("success") and "scheduled_objects" in result.get("output", ""):
             logger.info(f"Successfully scheduled todo {todo_id} for {target_date} via AppleScript date objects")
             return {"success": True}
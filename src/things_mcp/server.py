@@ -6,7 +6,7 @@ import logging
 import signal
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 # Optional dotenv support
 try:
@@ -30,6 +30,13 @@ from .context_manager import ContextAwareResponseManager, ResponseMode
 logger = logging.getLogger(__name__)
 
 
+def _normalize_id_list(ids: Union[str, List[str]]) -> List[str]:
+    """Accept a list of IDs as-is; split a comma-separated string for older clients."""
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    return [item.strip() for item in ids if item and item.strip()]
+
+
 class ThingsMCPServer:
     """Simple MCP server for Things 3 integration."""
     
@@ -467,7 +474,7 @@ class ThingsMCPServer:
 
         @self.mcp.tool()
         async def bulk_update_todos(
-            todo_ids: str = Field(..., description="Comma-separated list of todo IDs to update"),
+            todo_ids: Union[List[str], str] = Field(..., description="Todo IDs to update (list, or comma-separated string)"),
             title: Optional[str] = Field(None, description="New title for all todos"),
             notes: Optional[str] = Field(None, description="New notes for all todos"),
             tags: Optional[str] = Field(None, description="Comma-separated tags to apply to all todos"),
@@ -501,8 +508,7 @@ class ThingsMCPServer:
                             "message": str(e)
                         }
 
-                # Parse comma-separated IDs
-                id_list = [id.strip() for id in todo_ids.split(",") if id.strip()]
+                id_list = _normalize_id_list(todo_ids)
 
                 if not id_list:
                     return {
@@ -643,14 +649,13 @@ class ThingsMCPServer:
         
         @self.mcp.tool()
         async def bulk_move_records(
-            todo_ids: str = Field(..., description="Comma-separated list of todo IDs to move"),
+            todo_ids: Union[List[str], str] = Field(..., description="Todo IDs to move (list, or comma-separated string)"),
             destination: str = Field(..., description="Destination: list name (inbox, today, anytime, someday, upcoming, logbook), project:ID, or area:ID"),
             max_concurrent: int = Field(5, description="Maximum concurrent operations (1-10)", ge=1, le=10)
         ) -> Dict[str, Any]:
             """Move multiple todos to the same destination efficiently. The move operation handles scheduling automatically based on the destination."""
             try:
-                # Parse the comma-separated todo IDs
-                todo_id_list = [tid.strip() for tid in todo_ids.split(",") if tid.strip()]
+                todo_id_list = _normalize_id_list(todo_ids)
                 if not todo_id_list:
                     return {
                         "success": False,
@@ -3,10 +3,36 @@
 import asyncio
 import logging
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, Sequence
+
+try:
+    from Foundation import NSAppleEventDescriptor, NSAppleScript
+except ImportError:
+    # PyObjC not available (non-macOS or not installed) - osascript is used instead
+    NSAppleEventDescriptor = None
+    NSAppleScript = None
 
 logger = logging.getLogger(__name__)
 
+# Four-character descriptor type codes used when converting OSAKit results
+_TYPE_LIST = int.from_bytes(b"list", "big")
+_TYPE_NULL = int.from_bytes(b"null", "big")
+_TYPE_MISSING_VALUE = int.from_bytes(b"msng", "big")
+_TYPE_RECORD = int.from_bytes(b"reco", "big")
+_TYPE_BOOLEAN = int.from_bytes(b"bool", "big")
+_TYPE_TRUE = int.from_bytes(b"true", "big")
+_TYPE_FALSE = int.from_bytes(b"fals", "big")
+_TYPE_LONG_DATE_TIME = int.from_bytes(b"ldt ", "big")
+_KEY_USER_RECORD_FIELDS = int.from_bytes(b"usrf", "big")
+
+# Apple event codes for calling a handler ("subroutine") in a compiled script
+_AS_APPLESCRIPT_SUITE = int.from_bytes(b"ascr", "big")
+_AS_SUBROUTINE_EVENT = int.from_bytes(b"psbr", "big")
+_KEY_SUBROUTINE_NAME = int.from_bytes(b"snam", "big")
+_KEY_DIRECT_OBJECT = int.from_bytes(b"----", "big")
+
 
 class AppleScriptExecutor:
     """Handles AppleScript execution with locking and retry mechanisms.
@@ -21,15 +47,29 @@ class AppleScriptExecutor:
     # This ensures only one AppleScript command executes at a time across the entire process
     _applescript_lock = asyncio.Lock()
 
-    def __init__(self, timeout: int = 45, retry_count: int = 3):
+    def __init__(self, timeout: int = 45, retry_count: int = 3, use_osakit: bool = False):
         """Initialize the AppleScript executor.
 
         Args:
             timeout: Command timeout in seconds
             retry_count: Number of retries for failed commands
+            use_osakit: Execute scripts in-process through PyObjC's NSAppleScript
+                instead of spawning osascript (ignored if PyObjC is unavailable)
         """
         self.timeout = timeout
         self.retry_count = retry_count
+        self.use_osakit = use_osakit and NSAppleScript is not None
+        # Compiled NSAppleScript objects keyed by source, reused across handler calls
+        self._compiled_scripts: Dict[str, Any] = {}
+        # NSAppleScript is not thread-safe, so every OSAKit call runs on this one
+        # thread. A call that outlives its timeout keeps the thread busy, so the
+        # next script still waits for it even after the lock is released.
+        self._osakit_thread: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="osakit") if self.use_osakit else None
+        )
+
+        if use_osakit and NSAppleScript is None:
+            logger.warning("OSAKit bridge requested but PyObjC is not installed - falling back to osascript")
 
     async def is_things_running(self) -> bool:
         """Check if Things 3 is currently running."""
@@ -52,12 +92,33 @@ class AppleScriptExecutor:
         """
         return await self._execute_script_with_retry(script)
 
-    async def _execute_script_with_retry(self, script: str) -> Dict[str, Any]:
+    async def execute_handler(self, script: str, handler: str, arguments: Sequence[Any] = ()) -> Dict[str, Any]:
+        """Call a handler defined in a script with positional arguments.
+
+        With the OSAKit bridge the script is compiled once and every call only
+        sends an Apple event with the arguments. Otherwise the handler call is
+        appended to the script source and run through osascript.
+
+        Args:
+            script: AppleScript source defining the handler
+            handler: Handler name (lowercase)
+            arguments: Positional handler arguments (str or int)
+
+        Returns:
+            Dict with success status, output, and error information
+        """
+        if not self.use_osakit:
+            return await self.execute_script(self._build_handler_call_script(script, handler, arguments))
+        return await self._execute_script_with_retry(script, handler, arguments)
+
+    async def _execute_script_with_retry(
+        self, script: str, handler: Optional[str] = None, arguments: Sequence[Any] = ()
+    ) -> Dict[str, Any]:
         """Execute script with retry logic."""
         last_error = None
 
         for attempt in range(self.retry_count):
-            result = await self._execute_script(script)
+            result = await self._execute_script(script, handler, arguments)
 
             if result.get("success"):
                 return result
@@ -74,7 +135,9 @@ class AppleScriptExecutor:
             "error": f"Failed after {self.retry_count} attempts: {last_error}"
         }
 
-    async def _execute_script(self, script: str) -> Dict[str, Any]:
+    async def _execute_script(
+        self, script: str, handler: Optional[str] = None, arguments: Sequence[Any] = ()
+    ) -> Dict[str, Any]:
         """Execute a single AppleScript command with process-level locking.
 
         This method uses an asyncio.Lock to ensure only one AppleScript command
@@ -86,6 +149,8 @@ class AppleScriptExecutor:
 
         Args:
             script: AppleScript code to execute
+            handler: Optional handler to call in the compiled script (OSAKit only)
+            arguments: Positional arguments for the handler
 
         Returns:
             Dict with success status, output/error, and execution time
@@ -98,6 +163,9 @@ class AppleScriptExecutor:
             if lock_wait_time > 0.1:
                 logger.debug(f"AppleScript lock waited {lock_wait_time:.3f}s")
 
+            if self.use_osakit:
+                return await self._execute_script_osakit(script, handler, arguments)
+
             try:
                 execution_start = time.time()
 
@@ -144,3 +212,186 @@ class AppleScriptExecutor:
                     "success": False,
                     "error": f"Execution error: {str(e)}"
                 }
+
+    async def _execute_script_osakit(
+        self, script: str, handler: Optional[str] = None, arguments: Sequence[Any] = ()
+    ) -> Dict[str, Any]:
+        """Execute a single AppleScript in-process via the OSAKit bridge.
+
+        Avoids spawning an osascript process per call. The blocking NSAppleScript
+        call runs on the executor's dedicated OSAKit thread so the event loop stays
+        responsive. Must be called with the AppleScript lock held.
+
+        Args:
+            script: AppleScript code to execute
+            handler: Optional handler to call in the compiled script
+            arguments: Positional arguments for the handler
+
+        Returns:
+            Dict with success status, output/error, and execution time
+        """
+        execution_start = time.time()
+        loop = asyncio.get_running_loop()
+
+        try:
+            if handler:
+                call = loop.run_in_executor(
+                    self._osakit_thread, self._run_nsapplescript_handler, script, handler, arguments
+                )
+            else:
+                call = loop.run_in_executor(self._osakit_thread, self._run_nsapplescript, script)
+            result = await asyncio.wait_for(call, timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # The worker thread cannot be interrupted; it finishes in the background
+            # and later calls queue behind it on the single OSAKit thread
+            return {
+                "success": False,
+                "error": f"Script execution timed out after {self.timeout} seconds"
+            }
+        except Exception as e:
+            logger.error(f"AppleScript execution error: {e}")
+            return {
+                "success": False,
+                "error": f"Execution error: {str(e)}"
+            }
+
+        execution_time = time.time() - execution_start
+        if result.get("success"):
+            logger.debug(f"AppleScript executed successfully in {execution_time:.3f}s (OSAKit)")
+            result["execution_time"] = execution_time
+        else:
+            logger.debug(f"AppleScript failed after {execution_time:.3f}s (OSAKit)")
+        return result
+
+    @staticmethod
+    def _run_nsapplescript(script: str) -> Dict[str, Any]:
+        """Compile and run a script with NSAppleScript (blocking)."""
+        apple_script = NSAppleScript.alloc().initWithSource_(script)
+        descriptor, error_info = apple_script.executeAndReturnError_(None)
+
+        return AppleScriptExecutor._nsapplescript_result(descriptor, error_info)
+
+    def _run_nsapplescript_handler(self, script: str, handler: str, arguments: Sequence[Any]) -> Dict[str, Any]:
+        """Call a handler in a cached compiled script with NSAppleScript (blocking)."""
+        apple_script = self._compiled_scripts.get(script)
+        if apple_script is None:
+            apple_script = NSAppleScript.alloc().initWithSource_(script)
+            compiled, error_info = apple_script.compileAndReturnError_(None)
+            if not compiled:
+                return self._nsapplescript_result(None, error_info)
+            self._compiled_scripts[script] = apple_script
+
+        event = NSAppleEventDescriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+            _AS_APPLESCRIPT_SUITE,
+            _AS_SUBROUTINE_EVENT,
+            NSAppleEventDescriptor.nullDescriptor(),
+            -1,  # kAutoGenerateReturnID
+            0,   # kAnyTransactionID
+        )
+        event.setParamDescriptor_forKeyword_(
+            NSAppleEventDescriptor.descriptorWithString_(handler.lower()), _KEY_SUBROUTINE_NAME
+        )
+
+        parameters = NSAppleEventDescriptor.listDescriptor()
+        for index, argument in enumerate(arguments, start=1):
+            if isinstance(argument, int):
+                parameter = NSAppleEventDescriptor.descriptorWithInt32_(argument)
+            else:
+                parameter = NSAppleEventDescriptor.descriptorWithString_(str(argument))
+            parameters.insertDescriptor_atIndex_(parameter, index)
+        event.setParamDescriptor_forKeyword_(parameters, _KEY_DIRECT_OBJECT)
+
+        descriptor, error_info = apple_script.executeAppleEvent_error_(event, None)
+        return self._nsapplescript_result(descriptor, error_info)
+
+    @staticmethod
+    def _nsapplescript_result(descriptor: Any, error_info: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Convert an NSAppleScript result/error pair into a result dict."""
+        if descriptor is None:
+            error_info = error_info or {}
+            return {
+                "success": False,
+                "error": str(error_info.get("NSAppleScriptErrorMessage") or "Unknown AppleScript error"),
+                "return_code": error_info.get("NSAppleScriptErrorNumber", 1)
+            }
+
+        return {
+            "success": True,
+            "output": AppleScriptExecutor._descriptor_to_text(descriptor).strip()
+        }
+
+    @staticmethod
+    def _build_handler_call_script(script: str, handler: str, arguments: Sequence[Any]) -> str:
+        """Append a call to the handler so the script can run through osascript."""
+        formatted_args = []
+        for argument in arguments:
+            if isinstance(argument, int):
+                formatted_args.append(str(argument))
+            else:
+                escaped = str(argument).replace('\\', '\\\\').replace('"', '\\"')
+                formatted_args.append(f'"{escaped}"')
+        return f"{script}\nreturn {handler}({', '.join(formatted_args)})"
+
+    @staticmethod
+    def _descriptor_to_text(descriptor: Any) -> str:
+        """Render an NSAppleEventDescriptor the way osascript prints results.
+
+        Text and scalar results are coerced to their string value, lists are
+        joined with ", ", records become "key:value, ..." and booleans and dates
+        are spelled out to match osascript's human-readable output format.
+        """
+        descriptor_type = descriptor.descriptorType()
+        if descriptor_type == _TYPE_NULL:
+            return ""
+        if descriptor_type == _TYPE_MISSING_VALUE:
+            return "missing value"
+        if descriptor_type == _TYPE_LIST:
+            items = (
+                AppleScriptExecutor._descriptor_to_text(descriptor.descriptorAtIndex_(index))
+                for index in range(1, descriptor.numberOfItems() + 1)
+            )
+            return ", ".join(items)
+        if descriptor_type == _TYPE_RECORD:
+            return AppleScriptExecutor._record_to_text(descriptor)
+        if descriptor_type in (_TYPE_BOOLEAN, _TYPE_TRUE, _TYPE_FALSE):
+            return "true" if descriptor.booleanValue() else "false"
+        if descriptor_type == _TYPE_LONG_DATE_TIME:
+            date_value = descriptor.dateValue()
+            if date_value is not None:
+                return AppleScriptExecutor._format_applescript_date(
+                    datetime.fromtimestamp(date_value.timeIntervalSince1970())
+                )
+
+        text: Optional[str] = descriptor.stringValue()
+        return text if text is not None else ""
+
+    @staticmethod
+    def _record_to_text(descriptor: Any) -> str:
+        """Render a record descriptor as osascript does, e.g. "successCount:3, errors:".
+
+        User-defined labels live in a flat key/value list under the 'usrf'
+        keyword; other fields are keyed by their four-character code.
+        """
+        fields = []
+        for index in range(1, descriptor.numberOfItems() + 1):
+            keyword = descriptor.keywordForDescriptorAtIndex_(index)
+            value = descriptor.descriptorAtIndex_(index)
+            if keyword == _KEY_USER_RECORD_FIELDS:
+                for pair in range(1, value.numberOfItems(), 2):
+                    label = value.descriptorAtIndex_(pair).stringValue() or ""
+                    field_value = AppleScriptExecutor._descriptor_to_text(value.descriptorAtIndex_(pair + 1))
+                    fields.append(f"{label}:{field_value}")
+            else:
+                label = keyword.to_bytes(4, "big").decode("mac_roman")
+                fields.append(f"{label}:{AppleScriptExecutor._descriptor_to_text(value)}")
+        return ", ".join(fields)
+
+    @staticmethod
+    def _format_applescript_date(value: datetime) -> str:
+        """Format a date like osascript, e.g. "date Wednesday, January 15, 2025 at 12:00:00 AM"."""
+        hour = value.hour % 12 or 12
+        meridiem = "AM" if value.hour < 12 else "PM"
+        return (
+            f"date {value:%A}, {value:%B} {value.day}, {value.year} "
+            f"at {hour}:{value:%M:%S} {meridiem}"
+        )
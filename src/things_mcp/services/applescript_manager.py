@@ -11,7 +11,7 @@ import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from ..locale_aware_dates import locale_handler
 from ..config import ThingsMCPConfig
@@ -50,7 +50,11 @@ class AppleScriptManager:
         self.auth_token = self._load_auth_token()
 
         # Initialize specialized modules
-        self.executor = AppleScriptExecutor(timeout=timeout, retry_count=retry_count)
+        self.executor = AppleScriptExecutor(
+            timeout=timeout,
+            retry_count=retry_count,
+            use_osakit=self.config.use_osakit_bridge,
+        )
         self.formatters = AppleScriptFormatters()
         self.queries = AppleScriptQueries()
 
@@ -110,6 +114,22 @@ class AppleScriptManager:
         """
         return await self.executor.execute_script(script)
 
+    async def execute_applescript_handler(self, script: str, handler: str, arguments: Sequence[Any] = ()) -> Dict[str, Any]:
+        """Call a handler defined in an AppleScript with positional arguments.
+
+        Keeping the script source constant lets the executor compile it once per
+        manager (OSAKit bridge) and pass only the arguments on each call.
+
+        Args:
+            script: AppleScript source defining the handler
+            handler: Handler name (lowercase)
+            arguments: Positional handler arguments (str or int)
+
+        Returns:
+            Dict with success status, output, and error information
+        """
+        return await self.executor.execute_handler(script, handler, arguments)
+
     async def execute_url_scheme(self, action: str, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Execute a Things URL scheme command.
 
@@ -140,6 +140,10 @@ class ThingsTools:
         """Get a specific todo by ID directly from database."""
         return await self.read_ops.get_todo_by_id(todo_id=todo_id)
 
+    async def get_todos_by_ids(self, todo_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several todos by ID in one database pass, keyed by ID."""
+        return await self.read_ops.get_todos_by_ids(todo_ids=todo_ids)
+
     async def get_due_in_days(self, days: int) -> List[Dict[str, Any]]:
         """Get todos due within specified days."""
         return await self.read_ops.get_due_in_days(days=days)
@@ -219,3 +223,7 @@ class ThingsTools:
     async def bulk_update_todos(self, todo_ids: List[str], **kwargs) -> Dict[str, Any]:
         """Update multiple todos with the same changes in a single operation."""
         return await self.bulk_ops.bulk_update_todos(todo_ids=todo_ids, **kwargs)
+
+    async def bulk_add_todos(self, specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create several todos (title and optional notes) in a single operation."""
+        return await self.bulk_ops.bulk_add_todos(specs=specs)
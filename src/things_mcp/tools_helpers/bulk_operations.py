@@ -1,8 +1,10 @@
 """Bulk operations for Things 3 - efficient batch updates via AppleScript."""
 
+import functools
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from string import Template
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from ..services.applescript_manager import AppleScriptManager
 from ..pure_applescript_scheduler import PureAppleScriptScheduler
@@ -13,6 +15,50 @@ from .helpers import ToolsHelpers
 
 logger = logging.getLogger(__name__)
 
+# Per-field lines of the bulk update loop body, in the order they are applied
+_BULK_UPDATE_FIELD_LINES = {
+    'status': '            set status of targetTodo to $status\n',
+    'title': '            set name of targetTodo to "$title"\n',
+    'notes': '            set notes of targetTodo to "$notes"\n',
+    'deadline': (
+        '            set deadlineDate to (current date)\n'
+        '            set time of deadlineDate to 0\n'
+        '            set day of deadlineDate to 1\n'
+        '            set year of deadlineDate to $year\n'
+        '            set month of deadlineDate to $month\n'
+        '            set day of deadlineDate to $day\n'
+        '            set due date of targetTodo to deadlineDate\n'
+    ),
+    'tags': '            set tag names of targetTodo to "$tags"\n',
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _bulk_update_template(fields: FrozenSet[str]) -> Template:
+    """Bulk update script skeleton for a given set of fields.
+
+    The same changes apply to every todo, so they appear once inside a
+    ``repeat`` over the ID list rather than once per todo.
+    """
+    updates = ''.join(line for field, line in _BULK_UPDATE_FIELD_LINES.items() if field in fields)
+    return Template(
+        'tell application "Things3"\n'
+        '    set successCount to 0\n'
+        '    set errorMessages to {}\n'
+        '    repeat with todoRef in {$id_list}\n'
+        '        set todoId to contents of todoRef\n'
+        '        try\n'
+        '            set targetTodo to to do id todoId\n'
+        + updates +
+        '            set successCount to successCount + 1\n'
+        '        on error errMsg\n'
+        '            set end of errorMessages to "ID " & todoId & ": " & errMsg\n'
+        '        end try\n'
+        '    end repeat\n'
+        '    return {successCount:successCount, errors:errorMessages}\n'
+        'end tell'
+    )
+
 
 class BulkOperations:
     """Bulk operations for efficient batch updates."""
@@ -64,8 +110,12 @@ class BulkOperations:
         Raises:
             ValidationError: If validation fails
         """
-        # Validate todo IDs
+        # Validate todo IDs, dropping duplicates so no todo is updated twice
         todo_ids = ParameterValidator.validate_id_list(todo_ids, 'todo_ids')
+        unique_ids = list(dict.fromkeys(todo_ids))
+        if len(unique_ids) < len(todo_ids):
+            logger.warning(f"Ignoring {len(todo_ids) - len(unique_ids)} duplicate todo IDs in bulk update")
+        todo_ids = unique_ids
 
         # Validate update parameters
         validated_params = ParameterValidator.validate_update_params(**kwargs)
@@ -96,6 +146,9 @@ class BulkOperations:
     def _build_bulk_update_script(self, todo_ids: List[str], kwargs: dict) -> str:
         """Build AppleScript for bulk update operation.
 
+        The script skeleton depends only on which fields are being set, so it
+        comes from a cached template and only the values are substituted here.
+
         Args:
             todo_ids: List of todo IDs to update
             kwargs: Update parameters (without 'when')
@@ -103,69 +156,40 @@ class BulkOperations:
         Returns:
             AppleScript code
         """
-        script = 'tell application "Things3"\n'
-        script += '    set successCount to 0\n'
-        script += '    set errorMessages to {}\n'
-
-        for todo_id in todo_ids:
-            script += f'    try\n'
-            script += f'        set targetTodo to to do id "{todo_id}"\n'
-
-            # Handle status updates with proper precedence (canceled takes priority)
-            if 'canceled' in kwargs and kwargs['canceled'] is not None:
-                if kwargs['canceled']:
-                    script += f'        set status of targetTodo to canceled\n'
-                else:
-                    script += f'        set status of targetTodo to open\n'
-            elif 'completed' in kwargs and kwargs['completed'] is not None:
-                if kwargs['completed']:
-                    script += f'        set status of targetTodo to completed\n'
-                else:
-                    script += f'        set status of targetTodo to open\n'
-
-            if 'title' in kwargs and kwargs['title'] is not None:
-                escaped_title = ToolsHelpers.escape_applescript_string(kwargs['title']).strip('"')
-                script += f'        set name of targetTodo to "{escaped_title}"\n'
-
-            if 'notes' in kwargs and kwargs['notes'] is not None:
-                escaped_notes = ToolsHelpers.escape_applescript_string(kwargs['notes']).strip('"')
-                script += f'        set notes of targetTodo to "{escaped_notes}"\n'
-
-            if 'deadline' in kwargs:
-                deadline = kwargs['deadline']
-                if deadline:
-                    date_components = locale_handler.normalize_date_input(deadline)
-                    if date_components:
-                        year, month, day = date_components
-                        script += f'''        set deadlineDate to (current date)
-        set time of deadlineDate to 0
-        set day of deadlineDate to 1
-        set year of deadlineDate to {year}
-        set month of deadlineDate to {month}
-        set day of deadlineDate to {day}
-        set due date of targetTodo to deadlineDate
-'''
-
-            if 'tags' in kwargs and kwargs['tags']:
-                tags_value = kwargs['tags']
-                if isinstance(tags_value, str):
-                    tags_value = [t.strip() for t in tags_value.split(",")] if tags_value else []
-                # Filter out None and empty strings
-                tags_value = [t for t in tags_value if t]
-                if tags_value:
-                    escaped_tags = [ToolsHelpers.escape_applescript_string(t).strip('"') for t in tags_value]
-                    tag_string = ', '.join(escaped_tags)
-                    script += f'        set tag names of targetTodo to "{tag_string}"\n'
-
-            script += '        set successCount to successCount + 1\n'
-            script += '    on error errMsg\n'
-            script += f'        set end of errorMessages to "ID {todo_id}: " & errMsg\n'
-            script += '    end try\n'
-
-        script += '    return {successCount:successCount, errors:errorMessages}\n'
-        script += 'end tell'
-
-        return script
+        values = {'id_list': ', '.join(f'"{todo_id}"' for todo_id in todo_ids)}
+
+        # Handle status updates with proper precedence (canceled takes priority)
+        if 'canceled' in kwargs and kwargs['canceled'] is not None:
+            values['status'] = 'canceled' if kwargs['canceled'] else 'open'
+        elif 'completed' in kwargs and kwargs['completed'] is not None:
+            values['status'] = 'completed' if kwargs['completed'] else 'open'
+
+        if 'title' in kwargs and kwargs['title'] is not None:
+            values['title'] = ToolsHelpers.escape_applescript_string(kwargs['title']).strip('"')
+
+        if 'notes' in kwargs and kwargs['notes'] is not None:
+            values['notes'] = ToolsHelpers.escape_applescript_string(kwargs['notes']).strip('"')
+
+        if 'deadline' in kwargs:
+            deadline = kwargs['deadline']
+            if deadline:
+                date_components = locale_handler.normalize_date_input(deadline)
+                if date_components:
+                    values['year'], values['month'], values['day'] = date_components
+                    values['deadline'] = True
+
+        if 'tags' in kwargs and kwargs['tags']:
+            tags_value = kwargs['tags']
+            if isinstance(tags_value, str):
+                tags_value = [t.strip() for t in tags_value.split(",")] if tags_value else []
+            # Filter out None and empty strings
+            tags_value = [t for t in tags_value if t]
+            if tags_value:
+                escaped_tags = [ToolsHelpers.escape_applescript_string(t).strip('"') for t in tags_value]
+                values['tags'] = ', '.join(escaped_tags)
+
+        fields = frozenset(field for field in _BULK_UPDATE_FIELD_LINES if field in values)
+        return _bulk_update_template(fields).substitute(values)
 
     async def _parse_bulk_results(self, result: dict, todo_ids: List[str],
                                   when_value: Optional[str], tag_validation: Optional[dict]) -> Dict[str, Any]:
@@ -280,3 +304,96 @@ class BulkOperations:
                 "message": "Failed to perform bulk update",
                 "updated_count": 0
             }
+
+    def _build_bulk_add_script(self, specs: List[Dict[str, Any]]) -> str:
+        """Build AppleScript that creates every todo in ``specs`` and returns their IDs.
+
+        Args:
+            specs: Validated todo specs with 'title' and optional 'notes'
+
+        Returns:
+            AppleScript code returning the IDs of the todos actually created
+            as comma-separated text
+        """
+        script = 'tell application "Things3"\n'
+        script += '    set newIds to {}\n'
+
+        for spec in specs:
+            properties = f'name:{ToolsHelpers.escape_applescript_string(spec["title"])}'
+            if spec.get('notes'):
+                properties += f', notes:{ToolsHelpers.escape_applescript_string(spec["notes"])}'
+            # A failed create is skipped so the IDs of the todos that were made still come back
+            script += '    try\n'
+            script += f'        set end of newIds to id of (make new to do with properties {{{properties}}})\n'
+            script += '    end try\n'
+
+        script += '    set AppleScript\'s text item delimiters to ","\n'
+        script += '    set idText to newIds as text\n'
+        script += '    set AppleScript\'s text item delimiters to ""\n'
+        script += '    return idText\n'
+        script += 'end tell'
+
+        return script
+
+    async def bulk_add_todos(self, specs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create several todos in a single AppleScript call.
+
+        Args:
+            specs: List of dicts with 'title' and optional 'notes'
+
+        Returns:
+            Dict with success status, the created todo IDs and their count
+        """
+        try:
+            if not specs:
+                return {
+                    "success": False,
+                    "error": "No todos provided",
+                    "todo_ids": [],
+                    "created_count": 0
+                }
+
+            specs = [
+                {
+                    'title': ParameterValidator.validate_non_empty_string(spec.get('title'), 'title'),
+                    'notes': spec.get('notes') or ''
+                }
+                for spec in specs
+            ]
+
+            script = self._build_bulk_add_script(specs)
+            result = await self.applescript.execute_applescript(script)
+
+            if not result.get('success'):
+                return {
+                    "success": False,
+                    "error": result.get('error', 'Unknown error'),
+                    "message": "Failed to create todos",
+                    "todo_ids": [],
+                    "created_count": 0
+                }
+
+            todo_ids = [todo_id.strip() for todo_id in result.get('output', '').split(',') if todo_id.strip()]
+            return {
+                "success": len(todo_ids) == len(specs),
+                "message": f"Bulk add completed: {len(todo_ids)}/{len(specs)} todos created",
+                "todo_ids": todo_ids,
+                "created_count": len(todo_ids)
+            }
+
+        except ValidationError as e:
+            logger.error(f"Validation error in bulk_add_todos: {e}")
+            return {
+                **create_validation_error_response(e),
+                "todo_ids": [],
+                "created_count": 0
+            }
+        except Exception as e:
+            logger.error(f"Error in bulk add: {e}")
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Failed to create todos",
+                "todo_ids": [],
+                "created_count": 0
+            }
@@ -452,6 +452,19 @@ class ReadOperations:
             logger.error(f"Error in _get_tagged_items_sync: {e}")
             return []
 
+    def _convert_todo_with_checklist(self, todo: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a things.py todo and attach its checklist items."""
+        todo_id = todo.get('uuid')
+        converted = ToolsHelpers.convert_todo(todo)
+
+        try:
+            items = things.checklist_items(todo_id)
+            converted['checklist'] = [{'title': i['title'], 'status': i['status']} for i in items]
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Could not fetch checklist items for todo {todo_id}: {e}")
+
+        return converted
+
     async def get_todo_by_id(self, todo_id: str) -> Dict[str, Any]:
         """Get a specific todo by ID."""
         loop = asyncio.get_event_loop()
@@ -468,15 +481,7 @@ class ReadOperations:
 
             for todo in all_todos:
                 if todo.get('uuid') == todo_id:
-                    converted = ToolsHelpers.convert_todo(todo)
-
-                    try:
-                        items = things.checklist_items(todo_id)
-                        converted['checklist'] = [{'title': i['title'], 'status': i['status']} for i in items]
-                    except (KeyError, TypeError) as e:
-                        logger.warning(f"Could not fetch checklist items for todo {todo_id}: {e}")
-
-                    return converted
+                    return self._convert_todo_with_checklist(todo)
 
             raise ValueError(f"Todo not found: {todo_id}")
 
@@ -484,6 +489,32 @@ class ReadOperations:
             logger.error(f"Error in _get_todo_by_id_sync: {e}")
             raise
 
+    async def get_todos_by_ids(self, todo_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several todos by ID with a single pass over the database."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._get_todos_by_ids_sync, todo_ids)
+
+    def _get_todos_by_ids_sync(self, todo_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Synchronous implementation; IDs that are not found are omitted."""
+        try:
+            wanted = set(todo_ids)
+            found = {}
+
+            for status in ('incomplete', 'completed', 'canceled'):
+                # Skip the remaining statuses once every ID has been found
+                if len(found) == len(wanted):
+                    break
+                for todo in things.todos(status=status):
+                    todo_id = todo.get('uuid')
+                    if todo_id in wanted and todo_id not in found:
+                        found[todo_id] = self._convert_todo_with_checklist(todo)
+
+            return found
+
+        except Exception as e:
+            logger.error(f"Error in _get_todos_by_ids_sync: {e}")
+            raise
+
     async def get_due_in_days(self, days: int) -> List[Dict[str, Any]]:
         """Get todos due within specified number of days.
 
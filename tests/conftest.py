@@ -7,130 +7,182 @@ Things 3 installation.
 """
 
 import asyncio
+import copy
+import functools
+import itertools
 import json
+import logging
+import sys
+import time
 import pytest
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from unittest.mock import MagicMock
+
+from pytest_factoryboy import register
 
 from things_mcp.models import Todo, Project, Area, Tag, TodoResult
 from things_mcp.config import ThingsMCPConfig
 from things_mcp.server import ThingsMCPServer
 from things_mcp.services.applescript_manager import AppleScriptManager
+from things_mcp.tools import ThingsTools
+
+from fixtures.factories import ProjectFactory, TodoFactory
+
+logger = logging.getLogger(__name__)
 
 
 # Test Data Fixtures
-@pytest.fixture
+# Sample data is built once per session and shared as read-only
+# MappingProxyType views. Tests that need to modify sample data use the
+# mutable_* fixtures.
+register(TodoFactory)
+register(ProjectFactory)
+
+
+@pytest.fixture(scope="session")
 def sample_todo_data():
     """Sample todo data for testing."""
-    return {
-        "id": "todo-123",
-        "name": "Sample Todo",
-        "notes": "This is a test todo item",
-        "status": "open",
-        "creation_date": datetime.now() - timedelta(days=1),
-        "modification_date": datetime.now(),
-        "due_date": None,
-        "activation_date": None,
-        "completion_date": None,
-        "cancellation_date": None,
-        "tag_names": ["urgent", "work"],
-        "area_name": "Personal",
-        "project_name": None,
-        "contact_name": None
-    }
+    return MappingProxyType(TodoFactory(id="todo-123"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_data():
     """Sample project data for testing."""
-    return {
-        "id": "project-456",
-        "name": "Sample Project",
-        "notes": "This is a test project",
-        "status": "open",
-        "creation_date": datetime.now() - timedelta(days=5),
-        "modification_date": datetime.now(),
-        "due_date": (datetime.now() + timedelta(days=30)).date(),
-        "activation_date": datetime.now(),
-        "completion_date": None,
-        "cancellation_date": None,
-        "tag_names": ["work", "important"],
-        "area_name": "Work",
-        "project_name": None,
-        "contact_name": None
-    }
+    return MappingProxyType(ProjectFactory(id="project-456"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_area_data():
     """Sample area data for testing."""
-    return {
+    return MappingProxyType({
         "id": "area-789",
         "name": "Work Area",
         "collapsed": False,
         "tag_names": ["work"]
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tag_data():
     """Sample tag data for testing."""
-    return {
+    return MappingProxyType({
         "id": "tag-101",
         "name": "urgent",
         "keyboard_shortcut": "u",
         "parent_tag_name": None
-    }
+    })
 
 
 @pytest.fixture
-def multiple_todos_data(sample_todo_data):
-    """Multiple todos for list testing."""
-    todos = []
-    for i in range(5):
-        todo = sample_todo_data.copy()
-        todo["id"] = f"todo-{i+1}"
-        todo["name"] = f"Todo {i+1}"
-        todo["status"] = "completed" if i % 2 == 0 else "open"
-        todos.append(todo)
-    return todos
+def mutable_sample_todo_data(sample_todo_data):
+    """Per-test deep copy of the sample todo data, safe to modify."""
+    return copy.deepcopy(dict(sample_todo_data))
 
 
 @pytest.fixture
-def multiple_projects_data(sample_project_data):
+def mutable_sample_project_data(sample_project_data):
+    """Per-test deep copy of the sample project data, safe to modify."""
+    return copy.deepcopy(dict(sample_project_data))
+
+
+@pytest.fixture(scope="session")
+def multiple_projects_data():
     """Multiple projects for list testing."""
-    projects = []
-    for i in range(3):
-        project = sample_project_data.copy()
-        project["id"] = f"project-{i+1}"
-        project["name"] = f"Project {i+1}"
-        projects.append(project)
-    return projects
+    return tuple(
+        MappingProxyType(ProjectFactory.build(id=f"project-{i+1}", name=f"Project {i+1}"))
+        for i in range(3)
+    )
+
+
+@pytest.fixture
+def mutable_multiple_projects_data(multiple_projects_data):
+    """Per-test deep copy of the multiple projects data, safe to modify."""
+    return [copy.deepcopy(dict(project)) for project in multiple_projects_data]
+
+
+@pytest.fixture(
+    params=[(1, "completed"), (2, "open"), (3, "completed"), (4, "open"), (5, "completed")],
+    ids=lambda p: f"todo-{p[0]}-{p[1]}",
+)
+def todo_case(request):
+    """One synthetic todo per parametrized test case."""
+    i, status = request.param
+    return TodoFactory.build(id=f"todo-{i}", name=f"Todo {i}", status=status)
+
+
+@pytest.fixture(params=range(3), ids=lambda i: f"project-{i+1}")
+def single_project_data(request, multiple_projects_data):
+    """Each entry of multiple_projects_data as its own parametrized test case."""
+    return multiple_projects_data[request.param]
 
 
 # Mock AppleScript Manager
+class ExecutionCall(NamedTuple):
+    """An AppleScript execution recorded by MockAppleScriptManager."""
+    seq: int
+    script: str
+    script_name: Optional[str]
+    cache_key: Optional[str]
+
+
+class URLSchemeCall(NamedTuple):
+    """A URL scheme execution recorded by MockAppleScriptManager."""
+    seq: int
+    action: str
+    parameters: Dict[str, Any]
+    cache_key: Optional[str]
+
+
+# Number of recent calls MockAppleScriptManager keeps in execution_calls/url_scheme_calls
+_CALL_HISTORY_SIZE = 64
+
+
 class MockAppleScriptManager:
     """Mock AppleScript manager for testing without Things 3 dependency."""
     
+    # Data methods expected by tests, answered from mock_responses keyed by
+    # method name. List methods return just the data array, not the wrapper.
+    _LIST_METHODS = frozenset({
+        "get_todos", "get_projects", "get_areas", "get_todos_due_in_days",
+        "get_todos_activating_in_days", "get_todos_upcoming_in_days",
+    })
+    _DATA_METHODS = _LIST_METHODS | {"add_todo", "update_todo", "delete_todo", "update_project_direct"}
+
+    # Tests may override a data method on an instance; reset() removes overrides
+    __slots__ = (
+        "config", "error_handler", "cache_manager",
+        "execution_calls", "url_scheme_calls", "_applescript_count", "_url_scheme_count",
+        "mock_responses", "_url_responses", "should_fail", "failure_error", "_seq",
+        "execute_applescript", "execute_url_scheme",
+        *sorted(_DATA_METHODS),
+    )
+    
     def __init__(self, config=None, error_handler=None, cache_manager=None):
         self.config = config
         self.error_handler = error_handler
         self.cache_manager = cache_manager
-        self.execution_calls = []
-        self.url_scheme_calls = []
+        # Only the most recent calls are kept; the counters cover every call
+        self.execution_calls = deque(maxlen=_CALL_HISTORY_SIZE)
+        self.url_scheme_calls = deque(maxlen=_CALL_HISTORY_SIZE)
+        self._applescript_count = 0
+        self._url_scheme_count = 0
         self.mock_responses = {}
+        # URL scheme responses keyed by raw action ("url_add" -> "add")
+        self._url_responses = {}
         self.should_fail = False
         self.failure_error = "Mock failure"
+        # Sequence numbers give recorded calls a cheap, ordered "timestamp"
+        self._seq = itertools.count(1)
+        # Held in slots so tests can patch.object() them on the shared instance
+        self.execute_applescript = self._execute_applescript
+        self.execute_url_scheme = self._execute_url_scheme
         
-    async def execute_applescript(self, script: str, script_name: Optional[str] = None, cache_key: Optional[str] = None):
+    async def _execute_applescript(self, script: str, script_name: Optional[str] = None, cache_key: Optional[str] = None):
         """Mock AppleScript execution."""
-        self.execution_calls.append({
-            "script": script,
-            "script_name": script_name,
-            "cache_key": cache_key,
-            "timestamp": datetime.now()
-        })
+        self._applescript_count += 1
+        self.execution_calls.append(ExecutionCall(next(self._seq), script, script_name, cache_key))
         
         if self.should_fail:
             return {
@@ -152,14 +204,14 @@ class MockAppleScriptManager:
             "method": "applescript"
         }
     
-    async def execute_url_scheme(self, action: str, parameters: Optional[Dict[str, Any]] = None, cache_key: Optional[str] = None):
+    async def execute_applescript_handler(self, script: str, handler: str, arguments=()):
+        """Mock AppleScript handler call (recorded as a script named after the handler)."""
+        return await self.execute_applescript(script, script_name=handler)
+
+    async def _execute_url_scheme(self, action: str, parameters: Optional[Dict[str, Any]] = None, cache_key: Optional[str] = None):
         """Mock URL scheme execution."""
-        self.url_scheme_calls.append({
-            "action": action,
-            "parameters": parameters or {},
-            "cache_key": cache_key,
-            "timestamp": datetime.now()
-        })
+        self._url_scheme_count += 1
+        self.url_scheme_calls.append(URLSchemeCall(next(self._seq), action, parameters or {}, cache_key))
         
         if self.should_fail:
             return {
@@ -169,9 +221,8 @@ class MockAppleScriptManager:
             }
         
         # Return predefined mock response or default success
-        mock_key = f"url_{action}"
-        if mock_key in self.mock_responses:
-            return self.mock_responses[mock_key]
+        if action in self._url_responses:
+            return self._url_responses[action]
         
         return {
             "success": True,
@@ -197,9 +248,9 @@ class MockAppleScriptManager:
     async def get_execution_stats(self):
         """Mock execution statistics."""
         return {
-            "total_executions": len(self.execution_calls) + len(self.url_scheme_calls),
-            "applescript_executions": len(self.execution_calls),
-            "url_scheme_executions": len(self.url_scheme_calls),
+            "total_executions": self._applescript_count + self._url_scheme_count,
+            "applescript_executions": self._applescript_count,
+            "url_scheme_executions": self._url_scheme_count,
             "cache_hits": 0,
             "cache_misses": 0,
             "average_execution_time": 0.1,
@@ -209,6 +260,15 @@ class MockAppleScriptManager:
     def set_mock_response(self, key: str, response: Dict[str, Any]):
         """Set a mock response for specific operations."""
         self.mock_responses[key] = response
+        if key.startswith("url_"):
+            self._url_responses[key[4:]] = response
+    
+    def load_mock_responses(self, responses: Dict[str, Dict[str, Any]]):
+        """Replace all mock responses with a copy of a prebuilt mapping."""
+        self.mock_responses = dict(responses)
+        self._url_responses = {
+            key[4:]: response for key, response in responses.items() if key.startswith("url_")
+        }
     
     def set_failure_mode(self, should_fail: bool, error: str = "Mock failure"):
         """Set failure mode for testing error conditions."""
@@ -219,136 +279,106 @@ class MockAppleScriptManager:
         """Reset call tracking."""
         self.execution_calls.clear()
         self.url_scheme_calls.clear()
+        self._applescript_count = 0
+        self._url_scheme_count = 0
     
-    # Add missing methods expected by tests
-    async def get_todos(self, project_uuid=None, **kwargs):
-        """Mock get_todos method."""
-        response = self.mock_responses.get("get_todos", {
+    def reset(self):
+        """Restore the freshly constructed state so one instance can be reused across tests."""
+        self.reset_calls()
+        self.mock_responses = {}
+        self._url_responses = {}
+        self.should_fail = False
+        self.failure_error = "Mock failure"
+        self._seq = itertools.count(1)
+        for name in self._DATA_METHODS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+        self.execute_applescript = self._execute_applescript
+        self.execute_url_scheme = self._execute_url_scheme
+    
+    @staticmethod
+    def _default_data_response(name: str, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Response a data method returns when no mock response is set."""
+        if name == "add_todo":
+            data = {"id": "new-todo-123"}
+        elif name == "update_todo":
+            data = {"id": kwargs.get("id", "todo-123"), "updated": True}
+        elif name == "delete_todo":
+            data = {"deleted": True}
+        elif name == "update_project_direct":
+            data = {"id": args[0] if args else kwargs.get("project_id"), "updated": True}
+        else:
+            data = []
+        return {"success": True, "data": data, "error": None}
+
+    def __getattr__(self, name: str):
+        """Synthesize the mock data methods listed in _DATA_METHODS."""
+        if name not in MockAppleScriptManager._DATA_METHODS:
+            raise AttributeError(name)
+
+        async def _data_method(*args, **kwargs):
+            response = self.mock_responses.get(name)
+            if response is None:
+                response = self._default_data_response(name, args, kwargs)
+            if name in MockAppleScriptManager._LIST_METHODS:
+                return response.get("data", [])
+            return response
+
+        _data_method.__name__ = name
+        return _data_method
+
+
+@pytest.fixture(scope="session")
+def _mock_applescript_manager_template():
+    """Mock AppleScript manager shared across the session, reset for each test."""
+    return MockAppleScriptManager()
+
+
+@pytest.fixture
+def mock_applescript_manager(_mock_applescript_manager_template):
+    """Fixture providing mock AppleScript manager."""
+    _mock_applescript_manager_template.reset()
+    return _mock_applescript_manager_template
+
+
+@pytest.fixture(scope="session")
+def _default_mock_responses(sample_todo_data, sample_project_data, sample_area_data):
+    """Sample data responses for mock AppleScript managers, built once per session."""
+    return MappingProxyType({
+        "get_todos": {
             "success": True,
-            "data": [],
+            "data": [dict(sample_todo_data)],
             "error": None
-        })
-        # Return just the data array, not the wrapper
-        return response.get("data", [])
-    
-    async def get_projects(self, **kwargs):
-        """Mock get_projects method."""
-        response = self.mock_responses.get("get_projects", {
+        },
+        "get_projects": {
             "success": True,
-            "data": [],
+            "data": [dict(sample_project_data)],
             "error": None
-        })
-        return response.get("data", [])
-    
-    async def get_areas(self, **kwargs):
-        """Mock get_areas method.""" 
-        response = self.mock_responses.get("get_areas", {
+        },
+        "get_areas": {
             "success": True,
-            "data": [],
+            "data": [dict(sample_area_data)],
             "error": None
-        })
-        return response.get("data", [])
-    
-    async def add_todo(self, **kwargs):
-        """Mock add_todo method."""
-        return self.mock_responses.get("add_todo", {
+        },
+        "url_add": {
             "success": True,
             "data": {"id": "new-todo-123"},
-            "error": None
-        })
-    
-    async def update_todo(self, **kwargs):
-        """Mock update_todo method."""
-        return self.mock_responses.get("update_todo", {
-            "success": True,
-            "data": {"id": kwargs.get("id", "todo-123"), "updated": True},
-            "error": None
-        })
-    
-    async def delete_todo(self, **kwargs):
-        """Mock delete_todo method."""
-        return self.mock_responses.get("delete_todo", {
-            "success": True,
-            "data": {"deleted": True},
-            "error": None
-        })
-    
-    async def update_project_direct(self, project_id, **kwargs):
-        """Mock update_project_direct method."""
-        return self.mock_responses.get("update_project_direct", {
-            "success": True,
-            "data": {"id": project_id, "updated": True},
-            "error": None
-        })
-    
-    async def get_todos_due_in_days(self, days, **kwargs):
-        """Mock get_todos_due_in_days method."""
-        response = self.mock_responses.get("get_todos_due_in_days", {
-            "success": True,
-            "data": [],
-            "error": None
-        })
-        return response.get("data", [])
-    
-    async def get_todos_activating_in_days(self, days, **kwargs):
-        """Mock get_todos_activating_in_days method."""
-        response = self.mock_responses.get("get_todos_activating_in_days", {
-            "success": True,
-            "data": [],
-            "error": None
-        })
-        return response.get("data", [])
-    
-    async def get_todos_upcoming_in_days(self, days, **kwargs):
-        """Mock get_todos_upcoming_in_days method.""" 
-        response = self.mock_responses.get("get_todos_upcoming_in_days", {
+            "method": "url_scheme"
+        },
+        "url_update": {
             "success": True,
-            "data": [],
-            "error": None
-        })
-        return response.get("data", [])
-
-
-@pytest.fixture
-def mock_applescript_manager():
-    """Fixture providing mock AppleScript manager."""
-    return MockAppleScriptManager()
+            "data": {"id": "todo-123", "updated": True},
+            "method": "url_scheme"
+        },
+    })
 
 
 @pytest.fixture
-def mock_applescript_manager_with_data(mock_applescript_manager, sample_todo_data, sample_project_data, sample_area_data):
+def mock_applescript_manager_with_data(mock_applescript_manager, _default_mock_responses):
     """Mock AppleScript manager pre-configured with sample data."""
-    # Configure mock responses for common operations
-    mock_applescript_manager.set_mock_response("get_todos", {
-        "success": True,
-        "data": [sample_todo_data],
-        "error": None
-    })
-    
-    mock_applescript_manager.set_mock_response("get_projects", {
-        "success": True,
-        "data": [sample_project_data],
-        "error": None
-    })
-    
-    mock_applescript_manager.set_mock_response("get_areas", {
-        "success": True,
-        "data": [sample_area_data],
-        "error": None
-    })
-    
-    mock_applescript_manager.set_mock_response("url_add", {
-        "success": True,
-        "data": {"id": "new-todo-123"},
-        "method": "url_scheme"
-    })
-    
-    mock_applescript_manager.set_mock_response("url_update", {
-        "success": True,
-        "data": {"id": "todo-123", "updated": True},
-        "method": "url_scheme"
-    })
-    
+    mock_applescript_manager.load_mock_responses(_default_mock_responses)
     return mock_applescript_manager
 
 
@@ -356,59 +386,81 @@ def mock_applescript_manager_with_data(mock_applescript_manager, sample_todo_dat
 class MockErrorHandler:
     """Mock error handler for testing."""
     
+    __slots__ = ("enable_detailed_logging", "errors", "_seq")
+    
     def __init__(self, enable_detailed_logging=False):
         self.enable_detailed_logging = enable_detailed_logging
-        self.errors = []
+        # Only the most recent errors are kept; _seq counts every error handled
+        self.errors = deque(maxlen=100)
+        self._seq = 0
     
     async def handle_error(self, error: Exception, context: str = ""):
         """Mock error handling."""
+        self._seq += 1
         self.errors.append({
             "error": str(error),
             "context": context,
-            "timestamp": datetime.now()
+            "timestamp": self._seq
         })
     
     async def get_error_statistics(self):
         """Mock error statistics."""
         return {
-            "total_errors": len(self.errors),
-            "recent_errors": self.errors[-10:] if self.errors else [],
+            "total_errors": self._seq,
+            "recent_errors": list(self.errors)[-10:],
             "error_rate": 0.1 if self.errors else 0.0
         }
     
     async def reset_statistics(self):
         """Reset error statistics."""
         self.errors.clear()
+        self._seq = 0
+
+
+# Sentinel for cache misses, so cached None values still count as hits
+_MISS = object()
 
 
 class MockCacheManager:
     """Mock cache manager for testing."""
     
+    __slots__ = ("max_size", "default_ttl", "cache", "stats", "_bytes")
+    
     def __init__(self, max_size=1000, default_ttl=300):
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.cache = {}
         self.stats = {"hits": 0, "misses": 0}
+        # Running estimate of cached bytes, maintained by set/delete/clear
+        self._bytes = 0
     
     async def get(self, key: str):
         """Mock cache get."""
-        if key in self.cache:
-            self.stats["hits"] += 1
-            return self.cache[key]
-        self.stats["misses"] += 1
-        return None
+        value = self.cache.get(key, _MISS)
+        if value is _MISS:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return value
     
     async def set(self, key: str, value: Any, ttl: Optional[int] = None):
         """Mock cache set."""
+        if key in self.cache:
+            self._bytes -= sys.getsizeof(self.cache[key])
+        else:
+            self._bytes += sys.getsizeof(key)
         self.cache[key] = value
+        self._bytes += sys.getsizeof(value)
     
     async def delete(self, key: str):
         """Mock cache delete."""
-        self.cache.pop(key, None)
+        if key in self.cache:
+            self._bytes -= sys.getsizeof(key) + sys.getsizeof(self.cache.pop(key))
     
     async def clear(self):
         """Mock cache clear."""
         self.cache.clear()
+        self._bytes = 0
         return True
     
     async def size(self):
@@ -416,42 +468,47 @@ class MockCacheManager:
         return len(self.cache)
     
     async def get_memory_usage(self):
-        """Mock memory usage."""
-        return len(str(self.cache)) * 8  # Rough estimate
+        """Mock memory usage (shallow size of cached keys and values)."""
+        return self._bytes
     
     async def initialize(self):
         """Mock initialization."""
         pass
 
 
+_TODO_REQUIRED_FIELDS = ("title",)
+_PROJECT_REQUIRED_FIELDS = ("title",)
+_NO_VALIDATION_ERRORS: Tuple[str, ...] = ()
+
+
 class MockValidationService:
     """Mock validation service for testing."""
     
+    __slots__ = ("config", "validation_errors")
+    
     def __init__(self, config=None):
         self.config = config
         self.validation_errors = []
     
     def validate_todo_data(self, data: Dict[str, Any]) -> bool:
         """Mock todo validation."""
-        required_fields = ["title"]
-        for field in required_fields:
-            if field not in data or not data[field]:
+        for field in _TODO_REQUIRED_FIELDS:
+            if not data.get(field):
                 self.validation_errors.append(f"Missing required field: {field}")
                 return False
         return True
     
     def validate_project_data(self, data: Dict[str, Any]) -> bool:
         """Mock project validation."""
-        required_fields = ["title"]
-        for field in required_fields:
-            if field not in data or not data[field]:
+        for field in _PROJECT_REQUIRED_FIELDS:
+            if not data.get(field):
                 self.validation_errors.append(f"Missing required field: {field}")
                 return False
         return True
     
-    def get_validation_errors(self) -> List[str]:
-        """Get validation errors."""
-        return self.validation_errors.copy()
+    def get_validation_errors(self) -> Tuple[str, ...]:
+        """Get validation errors (read-only snapshot)."""
+        return tuple(self.validation_errors) if self.validation_errors else _NO_VALIDATION_ERRORS
     
     def clear_errors(self):
         """Clear validation errors."""
@@ -477,169 +534,170 @@ def mock_validation_service():
 
 
 # Server Configuration
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config():
-    """Test configuration for Things MCP server."""
+    """Test configuration for Things MCP server (shared; do not modify)."""
     return ThingsMCPConfig(
         applescript_timeout=5,
         applescript_retry_count=1,
         cache_max_size=100,
         cache_default_ttl=60,
-        enable_caching=True,
-        enable_detailed_logging=True,
-        enable_debug_logging=False
+        enable_caching=True
     )
 
 
 @pytest.fixture
-async def mock_server(test_config, mock_applescript_manager_with_data, mock_error_handler, mock_cache_manager, mock_validation_service):
-    """Fixture providing fully mocked Things MCP server."""
-    with patch('things_mcp.server.AppleScriptManager') as mock_asm_class, \
-         patch('things_mcp.server.ErrorHandler') as mock_eh_class, \
-         patch('things_mcp.server.CacheManager') as mock_cm_class, \
-         patch('things_mcp.server.ValidationService') as mock_vs_class:
-        
-        # Configure the mocked classes to return our mock instances
-        mock_asm_class.return_value = mock_applescript_manager_with_data
-        mock_eh_class.return_value = mock_error_handler
-        mock_cm_class.return_value = mock_cache_manager
-        mock_vs_class.return_value = mock_validation_service
-        
-        # Create server instance
-        server = ThingsMCPServer(config=test_config)
-        
-        # Store references to mocks for test access
-        server._mock_applescript_manager = mock_applescript_manager_with_data
-        server._mock_error_handler = mock_error_handler
-        server._mock_cache_manager = mock_cache_manager
-        server._mock_validation_service = mock_validation_service
-        
-        yield server
+def mutable_test_config(test_config):
+    """Per-test copy of the test configuration, safe to modify."""
+    return test_config.model_copy(deep=True)
 
 
-# Test Utilities
-@pytest.fixture
-def assert_todo_structure():
-    """Fixture providing todo structure assertion helper."""
-    def _assert_todo_structure(todo_dict: Dict[str, Any]):
-        """Assert that a dictionary has the expected todo structure."""
-        required_fields = ["id", "title", "status"]
-        optional_fields = ["notes", "tags", "creation_date", "modification_date", 
-                          "due_date", "project_uuid", "area_name"]
-        
-        # Check required fields
-        for field in required_fields:
-            assert field in todo_dict, f"Missing required field: {field}"
-            assert todo_dict[field] is not None, f"Required field {field} is None"
-        
-        # Check that optional fields exist (can be None)
-        for field in optional_fields:
-            assert field in todo_dict, f"Missing optional field: {field}"
-        
-        # Check data types
-        assert isinstance(todo_dict["id"], str), "ID should be string"
-        assert isinstance(todo_dict["title"], str), "Title should be string"
-        assert todo_dict["status"] in ["open", "completed", "canceled"], "Invalid status"
-        
-        if todo_dict["tags"]:
-            assert isinstance(todo_dict["tags"], list), "Tags should be list"
-    
-    return _assert_todo_structure
+def _build_mock_server(config, applescript_manager, error_handler, cache_manager, validation_service):
+    """Construct a ThingsMCPServer wired to the given mock services.
 
+    The patches are only needed while the server is constructed; afterwards
+    the server holds direct references to the mocks.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('things_mcp.server.load_config_from_env', lambda *args, **kwargs: config)
+        mp.setattr('things_mcp.server.AppleScriptManager', lambda *args, **kwargs: applescript_manager)
+        # Keep pytest's logging handlers in place
+        mp.setattr(ThingsMCPServer, '_configure_logging', lambda self: None)
+        server = ThingsMCPServer()
 
-@pytest.fixture
-def assert_project_structure():
-    """Fixture providing project structure assertion helper."""
-    def _assert_project_structure(project_dict: Dict[str, Any]):
-        """Assert that a dictionary has the expected project structure."""
-        required_fields = ["id", "title", "status"]
-        optional_fields = ["notes", "tags", "creation_date", "modification_date", 
-                          "due_date", "area_name", "todos"]
-        
-        # Check required fields
-        for field in required_fields:
-            assert field in project_dict, f"Missing required field: {field}"
-            assert project_dict[field] is not None, f"Required field {field} is None"
-        
-        # Check that optional fields exist (can be None)
-        for field in optional_fields:
-            assert field in project_dict, f"Missing optional field: {field}"
-        
-        # Check data types
-        assert isinstance(project_dict["id"], str), "ID should be string"
-        assert isinstance(project_dict["title"], str), "Title should be string"
-        assert project_dict["status"] in ["open", "completed", "canceled"], "Invalid status"
-        
-        if project_dict["todos"]:
-            assert isinstance(project_dict["todos"], list), "Todos should be list"
-    
-    return _assert_project_structure
+    # Store references to mocks for test access
+    server._mock_applescript_manager = applescript_manager
+    server._mock_error_handler = error_handler
+    server._mock_cache_manager = cache_manager
+    server._mock_validation_service = validation_service
+    return server
 
 
-# Event Loop Configuration
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def _session_mock_server(test_config, _default_mock_responses):
+    """Mocked Things MCP server built once per session (or xdist worker)."""
+    applescript_manager = MockAppleScriptManager()
+    applescript_manager.load_mock_responses(_default_mock_responses)
+    return _build_mock_server(
+        test_config,
+        applescript_manager,
+        MockErrorHandler(),
+        MockCacheManager(),
+        MockValidationService(),
+    )
 
 
-# Async Test Markers
-pytestmark = pytest.mark.asyncio
+@pytest.fixture
+async def reset_mocks(_session_mock_server, _default_mock_responses):
+    """Restore the shared server mocks: calls, responses, errors, cache and validation state."""
+    server = _session_mock_server
+    server._mock_applescript_manager.reset()
+    server._mock_applescript_manager.load_mock_responses(_default_mock_responses)
+    await server._mock_error_handler.reset_statistics()
+    await server._mock_cache_manager.clear()
+    server._mock_cache_manager.stats = {"hits": 0, "misses": 0}
+    server._mock_validation_service.clear_errors()
 
 
+@pytest.fixture
+def mock_server(_session_mock_server, reset_mocks):
+    """Fixture providing fully mocked Things MCP server.
+
+    The server is shared across the session; its mocks are reset before each
+    test.
+    """
+    return _session_mock_server
+
+
+# Test Utilities
+# Structure assertion helpers live in fixtures/assertions.py
 @pytest.fixture
 def tools_fixture(mock_applescript_manager):
     """Create a ThingsTools instance with mocked AppleScript manager for testing."""
-    from things_mcp.tools import ThingsTools
     return ThingsTools(mock_applescript_manager)
 
 
 # Mock Response Builders
+# Responses without caller-specific data are shared read-only mappings.
+_APPLESCRIPT_SUCCESS_DEFAULT = MappingProxyType({
+    "success": True,
+    "output": "success",
+    "error": None,
+    "method": "applescript",
+    "execution_time": 0.1
+})
+
+_URL_SCHEME_SUCCESS_DEFAULT = MappingProxyType({
+    "success": True,
+    "data": MappingProxyType({"result": "success"}),
+    "error": None,
+    "method": "url_scheme"
+})
+
+
 def build_applescript_success_response(data: Any = None):
-    """Build a successful AppleScript response."""
+    """Build a successful AppleScript response (read-only when data is empty)."""
+    if not data:
+        return _APPLESCRIPT_SUCCESS_DEFAULT
     return {
         "success": True,
-        "output": json.dumps(data) if data else "success",
+        "output": json.dumps(data),
         "error": None,
         "method": "applescript",
         "execution_time": 0.1
     }
 
 
+@functools.lru_cache(maxsize=None)
 def build_applescript_error_response(error: str = "Mock error"):
-    """Build an error AppleScript response."""
-    return {
+    """Build a read-only error AppleScript response."""
+    return MappingProxyType({
         "success": False,
         "output": None,
         "error": error,
         "method": "applescript",
         "execution_time": 0.0
-    }
+    })
 
 
 def build_url_scheme_success_response(data: Any = None):
-    """Build a successful URL scheme response."""
+    """Build a successful URL scheme response (read-only when data is empty)."""
+    if not data:
+        return _URL_SCHEME_SUCCESS_DEFAULT
     return {
         "success": True,
-        "data": data or {"result": "success"},
+        "data": data,
         "error": None,
         "method": "url_scheme"
     }
 
 
+@functools.lru_cache(maxsize=None)
 def build_url_scheme_error_response(error: str = "Mock URL scheme error"):
-    """Build an error URL scheme response."""
-    return {
+    """Build a read-only error URL scheme response."""
+    return MappingProxyType({
         "success": False,
         "data": None,
         "error": error,
         "method": "url_scheme"
-    }
+    })
 
 
 # Integration Test Cleanup Fixture
+async def _gather_cleanup(coros, limit: int = 4):
+    """Run cleanup coroutines concurrently, at most ``limit`` at a time.
+
+    Returns results in input order; exceptions are returned, not raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _limited(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_limited(coro) for coro in coros), return_exceptions=True)
+
+
 @pytest.fixture
 async def cleanup_test_todos():
     """Fixture to track and clean up test todos created during integration tests.
@@ -663,10 +721,6 @@ async def cleanup_test_todos():
             'project_ids': list to track created project IDs
         }
     """
-    import time
-    from things_mcp.services.applescript_manager import AppleScriptManager
-    from things_mcp.tools import ThingsTools
-
     # Create unique tag for this test run
     test_tag = f"test-integration-{int(time.time())}"
     todo_ids = []
@@ -684,17 +738,19 @@ async def cleanup_test_todos():
     tools = ThingsTools(manager)
 
     # Delete todos
-    for todo_id in todo_ids:
-        try:
-            await tools.delete_todo(todo_id)
+    results = await _gather_cleanup(tools.delete_todo(todo_id) for todo_id in todo_ids)
+    for todo_id, result in zip(todo_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to cleanup todo {todo_id}: {result}")
+        else:
             logger.debug(f"Cleaned up test todo: {todo_id}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup todo {todo_id}: {e}")
 
     # Cancel projects (safer than delete)
-    for project_id in project_ids:
-        try:
-            await tools.update_project(project_id=project_id, canceled="true")
+    results = await _gather_cleanup(
+        tools.update_project(project_id=project_id, canceled="true") for project_id in project_ids
+    )
+    for project_id, result in zip(project_ids, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to cleanup project {project_id}: {result}")
+        else:
             logger.debug(f"Cleaned up test project: {project_id}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup project {project_id}: {e}")
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Structure assertion helpers for Things 3 MCP server tests.
+
+Plain functions rather than fixtures, since they hold no per-test state:
+
+    from fixtures.assertions import assert_todo_structure
+"""
+
+from typing import Any, Dict
+
+
+# Field sets checked by the structure assertion helpers
+_TODO_REQUIRED = frozenset({"id", "title", "status"})
+_TODO_OPTIONAL = frozenset({"notes", "tags", "creation_date", "modification_date",
+                            "due_date", "project_uuid", "area_name"})
+_PROJECT_REQUIRED = frozenset({"id", "title", "status"})
+_PROJECT_OPTIONAL = frozenset({"notes", "tags", "creation_date", "modification_date",
+                               "due_date", "area_name", "todos"})
+_VALID_STATUSES = frozenset({"open", "completed", "canceled"})
+
+
+def assert_todo_structure(todo_dict: Dict[str, Any]):
+    """Assert that a dictionary has the expected todo structure."""
+    # Check required fields
+    missing = _TODO_REQUIRED - todo_dict.keys()
+    assert not missing, f"Missing required fields: {sorted(missing)}"
+    none_fields = [field for field in _TODO_REQUIRED if todo_dict[field] is None]
+    assert not none_fields, f"Required fields are None: {sorted(none_fields)}"
+
+    # Check that optional fields exist (can be None)
+    missing = _TODO_OPTIONAL - todo_dict.keys()
+    assert not missing, f"Missing optional fields: {sorted(missing)}"
+
+    # Check data types
+    assert isinstance(todo_dict["id"], str), "ID should be string"
+    assert isinstance(todo_dict["title"], str), "Title should be string"
+    assert todo_dict["status"] in _VALID_STATUSES, "Invalid status"
+
+    if todo_dict["tags"]:
+        assert isinstance(todo_dict["tags"], list), "Tags should be list"
+
+
+def assert_project_structure(project_dict: Dict[str, Any]):
+    """Assert that a dictionary has the expected project structure."""
+    # Check required fields
+    missing = _PROJECT_REQUIRED - project_dict.keys()
+    assert not missing, f"Missing required fields: {sorted(missing)}"
+    none_fields = [field for field in _PROJECT_REQUIRED if project_dict[field] is None]
+    assert not none_fields, f"Required fields are None: {sorted(none_fields)}"
+
+    # Check that optional fields exist (can be None)
+    missing = _PROJECT_OPTIONAL - project_dict.keys()
+    assert not missing, f"Missing optional fields: {sorted(missing)}"
+
+    # Check data types
+    assert isinstance(project_dict["id"], str), "ID should be string"
+    assert isinstance(project_dict["title"], str), "Title should be string"
+    assert project_dict["status"] in _VALID_STATUSES, "Invalid status"
+
+    if project_dict["todos"]:
+        assert isinstance(project_dict["todos"], list), "Todos should be list"
@@ -0,0 +1,22 @@
+"""
+Cleanup helpers for integration tests that create data in real Things 3.
+
+Shared by tests/integration/conftest.py and test modules with their own
+data fixtures:
+
+    from fixtures.cleanup import build_bulk_delete_script
+"""
+
+from typing import List
+
+
+def build_bulk_delete_script(ids: List[str]) -> str:
+    """AppleScript deleting every id in one pass; already-deleted items are skipped."""
+    id_list = ', '.join(f'"{item_id}"' for item_id in ids)
+    return f'''tell application "Things3"
+    repeat with itemRef in {{{id_list}}}
+        try
+            delete to do id (contents of itemRef)
+        end try
+    end repeat
+end tell'''
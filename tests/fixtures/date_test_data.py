@@ -5,12 +5,14 @@ This module contains comprehensive test data for validating date parsing,
 formatting, and conversion functionality.
 """
 
+from __future__ import annotations
+
+import functools
 from datetime import datetime, date, timedelta
-from typing import List, Tuple, Dict, Any
 
 
 # ISO Date Formats
-ISO_DATES_VALID = [
+ISO_DATES_VALID = (
     ("2025-01-15", (2025, 1, 15)),
     ("2025-12-31", (2025, 12, 31)),
     ("2025-02-28", (2025, 2, 28)),
@@ -21,9 +23,9 @@ ISO_DATES_VALID = [
     ("2025-06-15", (2025, 6, 15)),
     ("2025-07-04", (2025, 7, 4)),
     ("2025-11-23", (2025, 11, 23)),
-]
+)
 
-ISO_DATES_INVALID = [
+ISO_DATES_INVALID = (
     "2025-13-01",      # Invalid month (13)
     "2025-02-30",      # Invalid day for February
     "2025-04-31",      # Invalid day for April (only 30 days)
@@ -38,29 +40,29 @@ ISO_DATES_INVALID = [
     "2025-01-xy",      # Non-numeric day
     "",                # Empty string
     "not-a-date",      # Complete garbage
-]
+)
 
 # Natural Language Keywords
-NATURAL_LANGUAGE_DATES = [
+NATURAL_LANGUAGE_DATES = (
     ("today", 0),
     ("tomorrow", 1),
     ("yesterday", -1),
     ("Today", 0),          # Case variation
     ("TOMORROW", 1),       # Case variation
     ("YeStErDaY", -1),     # Case variation
-]
+)
 
 # Things 3 specific keywords
-THINGS_KEYWORDS = [
+THINGS_KEYWORDS = (
     "someday",
     "anytime",
     "evening",
     "Someday",
     "ANYTIME",
-]
+)
 
 # Relative Date Offsets
-RELATIVE_OFFSETS_DAYS = [
+RELATIVE_OFFSETS_DAYS = (
     ("+1d", 1),
     ("+7d", 7),
     ("+30d", 30),
@@ -71,9 +73,9 @@ RELATIVE_OFFSETS_DAYS = [
     ("-3 days", -3),
     ("+0d", 0),
     ("1d", 1),  # Implicit positive
-]
+)
 
-RELATIVE_OFFSETS_WEEKS = [
+RELATIVE_OFFSETS_WEEKS = (
     ("+1w", 7),
     ("+4w", 28),
     ("-1w", -7),
@@ -81,9 +83,9 @@ RELATIVE_OFFSETS_WEEKS = [
     ("+2 weeks", 14),
     ("-2 weeks", -14),
     ("1w", 7),  # Implicit positive
-]
+)
 
-RELATIVE_OFFSETS_MONTHS = [
+RELATIVE_OFFSETS_MONTHS = (
     ("+1m", 1),
     ("+6m", 6),
     ("+12m", 12),
@@ -93,19 +95,19 @@ RELATIVE_OFFSETS_MONTHS = [
     ("+3 months", 3),
     ("-2 months", -2),
     ("1m", 1),  # Implicit positive
-]
+)
 
-RELATIVE_OFFSETS_INVALID = [
+RELATIVE_OFFSETS_INVALID = (
     "+d",       # Missing amount
     "+1x",      # Invalid unit
     "++1d",     # Double sign
     "+1.5d",    # Decimal not supported
     "1 d",      # Space in wrong place
     "d+1",      # Reversed order
-]
+)
 
 # Month Names
-MONTH_NAMES_FULL = [
+MONTH_NAMES_FULL = (
     ("january", 1),
     ("february", 2),
     ("march", 3),
@@ -118,9 +120,9 @@ MONTH_NAMES_FULL = [
     ("october", 10),
     ("november", 11),
     ("december", 12),
-]
+)
 
-MONTH_NAMES_ABBREVIATED = [
+MONTH_NAMES_ABBREVIATED = (
     ("jan", 1),
     ("feb", 2),
     ("mar", 3),
@@ -134,19 +136,26 @@ MONTH_NAMES_ABBREVIATED = [
     ("oct", 10),
     ("nov", 11),
     ("dec", 12),
-]
+)
 
-MONTH_NAMES_CASE_VARIATIONS = [
+MONTH_NAMES_CASE_VARIATIONS = (
     ("JANUARY", 1),
     ("January", 1),
     ("JaNuArY", 1),
     ("DECEMBER", 12),
     ("December", 12),
     ("DeCeMbEr", 12),
-]
+)
+
+# Case-insensitive month name -> number, merged from the tables above
+MONTH_LOOKUP = {
+    name.lower(): num
+    for table in (MONTH_NAMES_FULL, MONTH_NAMES_ABBREVIATED, MONTH_NAMES_CASE_VARIATIONS)
+    for name, num in table
+}
 
 # Natural Language Date Patterns
-NATURAL_DATES_VALID = [
+NATURAL_DATES_VALID = (
     ("January 15, 2025", (2025, 1, 15)),
     ("Jan 15 2025", (2025, 1, 15)),
     ("15 January 2025", (2025, 1, 15)),
@@ -154,10 +163,10 @@ NATURAL_DATES_VALID = [
     ("March 31, 2025", (2025, 3, 31)),
     ("December 25, 2024", (2024, 12, 25)),
     ("Feb 29, 2024", (2024, 2, 29)),  # Leap year
-]
+)
 
 # AppleScript Output Samples
-APPLESCRIPT_OUTPUTS = [
+APPLESCRIPT_OUTPUTS = (
     ('date "Wednesday, January 15, 2025 at 12:00:00 AM"', (2025, 1, 15)),
     ('date "Tuesday, December 31, 2024 at 11:59:59 PM"', (2024, 12, 31)),
     ('date "Thursday, February 29, 2024 at 3:30:00 PM"', (2024, 2, 29)),
@@ -166,19 +175,19 @@ APPLESCRIPT_OUTPUTS = [
     ("15.01.2025", (2025, 1, 15)),  # EU format
     ("year: 2025 month: 1 day: 15", (2025, 1, 15)),  # Property format
     ("January 15, 2025", (2025, 1, 15)),  # Natural language
-]
+)
 
-APPLESCRIPT_OUTPUTS_INVALID = [
+APPLESCRIPT_OUTPUTS_INVALID = (
     "missing value",
     "",
     "   ",
     None,
     "invalid date string",
     "date \"not a real date\"",
-]
+)
 
 # Edge Cases
-EDGE_CASES_DATES = [
+EDGE_CASES_DATES = (
     # Leap years
     ("2024-02-29", (2024, 2, 29), True),   # Valid leap year
     ("2023-02-29", None, False),            # Invalid - not a leap year
@@ -197,10 +206,10 @@ EDGE_CASES_DATES = [
     ("2099-12-31", (2099, 12, 31), True),  # Maximum year
     ("1899-12-31", None, False),            # Before minimum
     ("2100-01-01", None, False),            # After maximum
-]
+)
 
 # Month Overflow Cases (for relative month arithmetic)
-MONTH_OVERFLOW_CASES = [
+MONTH_OVERFLOW_CASES = (
     # Starting from Jan 31, adding 1 month should give Feb 28/29 (last day of Feb)
     ((2025, 1, 31), 1, (2025, 2, 28)),
     ((2024, 1, 31), 1, (2024, 2, 29)),  # Leap year
@@ -215,33 +224,33 @@ MONTH_OVERFLOW_CASES = [
     # Multiple month overflow
     ((2025, 1, 31), 3, (2025, 4, 30)),  # Jan 31 + 3 months = Apr 30
     ((2025, 10, 31), 4, (2026, 2, 28)), # Oct 31 + 4 months = Feb 28
-]
+)
 
 # US Date Formats
-US_DATES_VALID = [
+US_DATES_VALID = (
     ("1/15/2025", (2025, 1, 15)),
     ("12/31/2025", (2025, 12, 31)),
     ("2/29/2024", (2024, 2, 29)),
     ("06/15/2025", (2025, 6, 15)),
-]
+)
 
 # European Date Formats
-EU_DATES_VALID = [
+EU_DATES_VALID = (
     ("15.1.2025", (2025, 1, 15)),
     ("31.12.2025", (2025, 12, 31)),
     ("29.2.2024", (2024, 2, 29)),
     ("15.06.2025", (2025, 6, 15)),
-]
+)
 
 # Timezone Handling (should be stripped/ignored)
-DATES_WITH_TIMEZONES = [
+DATES_WITH_TIMEZONES = (
     ("2025-01-15T14:30:00Z", (2025, 1, 15)),
     ("2025-01-15T14:30:00-08:00", (2025, 1, 15)),
     ("2025-01-15T14:30:00+05:30", (2025, 1, 15)),
-]
+)
 
 # Empty/Null Cases
-EMPTY_NULL_CASES = [
+EMPTY_NULL_CASES = frozenset({
     None,
     "",
     "   ",
@@ -249,28 +258,42 @@ EMPTY_NULL_CASES = [
     "null",
     "None",
     "NULL",
-]
+})
 
 # Ambiguous Dates (could be interpreted multiple ways)
-AMBIGUOUS_DATES = [
+AMBIGUOUS_DATES = (
     "01-02-2025",  # Could be Jan 2 or Feb 1
     "03/04/2025",  # Could be Mar 4 or Apr 3
     "12/12/2025",  # Month and day are same
-]
+)
 
 
-def get_current_date_components() -> Tuple[int, int, int]:
+def get_current_date_components() -> tuple[int, int, int]:
     """Get current date as components tuple."""
     today = datetime.now().date()
     return (today.year, today.month, today.day)
 
 
-def calculate_relative_date(days_offset: int) -> Tuple[int, int, int]:
+def calculate_relative_date(days_offset: int) -> tuple[int, int, int]:
     """Calculate date components for relative offset from today."""
     target = datetime.now().date() + timedelta(days=days_offset)
     return (target.year, target.month, target.day)
 
 
+@functools.lru_cache(maxsize=512)
 def is_leap_year(year: int) -> bool:
-    """Check if year is a leap year."""
-    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+    """Check if year is a leap year.
+
+    Divisible by 4, and if divisible by 25 (i.e. a century year) also by 16,
+    which together is equivalent to the usual %4/%100/%400 rule.
+    """
+    return not (year & 3) and (year % 25 != 0 or not (year & 15))
+
+
+# Days per month in a common year, indexed 1-12
+_MDAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def last_day_of_month(year: int, month: int) -> int:
+    """Last day of the given month, e.g. for clamping Jan 31 + 1 month."""
+    return _MDAYS[month] + (month == 2 and is_leap_year(year))
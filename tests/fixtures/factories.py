@@ -0,0 +1,67 @@
+"""
+factory_boy factories for Things 3 test data.
+
+Factories build plain dictionaries shaped like the data returned by the
+AppleScript layer. They are registered in conftest.py, which exposes
+``todo``/``todo_factory`` and ``project``/``project_factory`` fixtures;
+variants are requested declaratively, e.g. ``@pytest.mark.parametrize(
+"todo__status", ["completed"])``.
+"""
+
+from datetime import datetime, timedelta
+
+import factory
+from pytest_factoryboy import named_model
+
+
+# Fixed reference time so generated data is deterministic
+NOW = datetime(2024, 6, 15, 12, 0, 0)
+
+
+class ThingsItemFactory(factory.Factory):
+    """Fields shared by todos and projects."""
+
+    class Meta:
+        abstract = True
+
+    notes = ""
+    status = "open"
+    modification_date = NOW
+    due_date = None
+    activation_date = None
+    completion_date = None
+    cancellation_date = None
+    tag_names = factory.LazyFunction(list)
+    area_name = None
+    project_name = None
+    contact_name = None
+
+
+class TodoFactory(ThingsItemFactory):
+    """Todo dictionaries; defaults match the sample_todo_data fixture."""
+
+    class Meta:
+        model = named_model(dict, "Todo")
+
+    id = factory.Sequence(lambda n: f"todo-{n}")
+    name = "Sample Todo"
+    notes = "This is a test todo item"
+    creation_date = NOW - timedelta(days=1)
+    tag_names = factory.LazyFunction(lambda: ["urgent", "work"])
+    area_name = "Personal"
+
+
+class ProjectFactory(ThingsItemFactory):
+    """Project dictionaries; defaults match the sample_project_data fixture."""
+
+    class Meta:
+        model = named_model(dict, "Project")
+
+    id = factory.Sequence(lambda n: f"project-{n}")
+    name = "Sample Project"
+    notes = "This is a test project"
+    creation_date = NOW - timedelta(days=5)
+    due_date = (NOW + timedelta(days=30)).date()
+    activation_date = NOW
+    tag_names = factory.LazyFunction(lambda: ["work", "important"])
+    area_name = "Work"
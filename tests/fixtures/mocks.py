@@ -0,0 +1,23 @@
+"""
+Helpers for configuring mocked AppleScript managers in unit tests.
+
+Plain functions rather than fixtures, since test modules build their own
+manager mocks:
+
+    from fixtures.mocks import forward_handler_calls
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock
+
+
+def forward_handler_calls(manager: Any) -> None:
+    """Route manager.execute_applescript_handler() through manager.execute_applescript().
+
+    Tests then only need to stub execute_applescript, whether the code under
+    test runs a plain script or calls a handler in a compiled one.
+    """
+    async def execute_handler(script, handler, arguments=()):
+        return await manager.execute_applescript(script)
+
+    manager.execute_applescript_handler = AsyncMock(side_effect=execute_handler)
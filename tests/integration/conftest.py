@@ -5,16 +5,19 @@ Provides cleanup fixtures and utilities for integration tests that interact
 with real Things 3 database.
 """
 
+import os
 import pytest
-import asyncio
-from datetime import datetime
-from typing import List, Dict
+import time
 from things_mcp.tools import ThingsTools
 from things_mcp.services.applescript_manager import AppleScriptManager
+from fixtures.cleanup import build_bulk_delete_script
+
+# pytest-xdist worker name, so test tags stay unique when running with -n
+_WORKER = os.getenv("PYTEST_XDIST_WORKER", "gw0")
 
 
 @pytest.fixture
-async def cleanup_test_todos():
+async def cleanup_test_todos(things_tools, applescript_manager):
     """
     Fixture that provides test data tracking and cleanup.
 
@@ -38,7 +41,7 @@ async def cleanup_test_todos():
         dict: Contains 'tag' (unique test identifier) and 'ids' (list to track created items)
     """
     # Create unique tag for this test run
-    test_tag = f"test_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+    test_tag = f"test_{_WORKER}_{time.time_ns():x}"
     todo_ids = []
     project_ids = []
 
@@ -52,54 +55,47 @@ async def cleanup_test_todos():
 
     # Cleanup phase - runs after test completes (even if it fails)
     if todo_ids or project_ids:
+        ids = todo_ids + project_ids
+
+        # Also pick up anything created with the test tag
         try:
-            manager = AppleScriptManager()
-            tools = ThingsTools(manager)
-
-            # Delete all tracked todos
-            for todo_id in todo_ids:
-                try:
-                    await tools.delete_todo(todo_id=todo_id)
-                except Exception as e:
-                    print(f"Warning: Failed to cleanup todo {todo_id}: {e}")
-
-            # Delete all tracked projects
-            for project_id in project_ids:
-                try:
-                    # Delete project using update with canceled=true
-                    await tools.update_project(id=project_id, canceled="true")
-                    await tools.delete_todo(todo_id=project_id)
-                except Exception as e:
-                    print(f"Warning: Failed to cleanup project {project_id}: {e}")
-
-            # Also try to find and delete by tag
-            try:
-                tagged_items = await tools.get_tagged_items(tag=test_tag)
-                for item in tagged_items:
-                    try:
-                        await tools.delete_todo(todo_id=item['id'])
-                    except Exception as e:
-                        print(f"Warning: Failed to cleanup tagged item {item['id']}: {e}")
-            except Exception as e:
-                print(f"Warning: Failed to cleanup by tag: {e}")
+            tagged_items = await things_tools.get_tagged_items(tag=test_tag)
+            ids += [item['id'] for item in tagged_items if item['id'] not in ids]
+        except Exception as e:
+            print(f"Warning: Failed to find items by tag: {e}")
 
+        # Delete todos and projects with a single osascript invocation
+        try:
+            result = await applescript_manager.execute_applescript(build_bulk_delete_script(ids))
+            if not result.get('success'):
+                print(f"Warning: Bulk cleanup failed: {result.get('error')}")
         except Exception as e:
             print(f"Error during test cleanup: {e}")
 
 
-@pytest.fixture
-async def real_things_tools():
+@pytest.fixture(scope="session")
+def applescript_manager():
+    """Real AppleScript manager shared by all integration tests."""
+    return AppleScriptManager()
+
+
+@pytest.fixture(scope="session")
+def things_tools(applescript_manager):
+    """ThingsTools over the shared real AppleScript manager."""
+    return ThingsTools(applescript_manager)
+
+
+@pytest.fixture(scope="session")
+def real_things_tools(things_tools):
     """
     Fixture providing ThingsTools with real AppleScript manager.
 
     Use this for integration tests that need to interact with actual Things 3.
     """
-    manager = AppleScriptManager()
-    tools = ThingsTools(manager)
-    yield tools
+    return things_tools
 
 
 @pytest.fixture
 def unique_test_id():
     """Generate a unique test identifier."""
-    return f"test_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+    return f"test_{_WORKER}_{time.time_ns():x}"
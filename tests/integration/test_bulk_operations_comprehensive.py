@@ -20,68 +20,74 @@ Focus areas:
 
 import pytest
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 
-from things_mcp.services.applescript_manager import AppleScriptManager
-from things_mcp.tools import ThingsTools
 from things_mcp.move_operations import MoveOperationsTools
 from things_mcp.services.validation_service import ValidationService
+from fixtures.cleanup import build_bulk_delete_script
+
+
+# Deadline dates are computed once per run rather than in every test body
+_TODAY = datetime.now().date()
+_DEADLINE_7 = (_TODAY + timedelta(days=7)).isoformat()
+_DEADLINE_14 = (_TODAY + timedelta(days=14)).isoformat()
+_DEADLINE_21 = (_TODAY + timedelta(days=21)).isoformat()
+_DEADLINE_30 = (_TODAY + timedelta(days=30)).isoformat()
 
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def applescript_manager():
-    """Create AppleScript manager instance."""
-    return AppleScriptManager()
-
-
-@pytest.fixture
-def things_tools(applescript_manager):
-    """Create ThingsTools instance."""
-    return ThingsTools(applescript_manager)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def move_operations(applescript_manager):
     """Create MoveOperationsTools instance."""
     validation_service = ValidationService(applescript_manager)
     return MoveOperationsTools(applescript_manager, validation_service)
 
 
+def _created_todo_ids(results) -> List[str]:
+    """IDs of successfully created todos from gathered add_todo results."""
+    # add_todo returns 'todo_id', not 'id'
+    return [
+        result['todo_id'] for result in results
+        if not isinstance(result, BaseException) and result.get('success')
+    ]
+
+
 @pytest.fixture
-async def test_todos(things_tools) -> List[str]:
+async def test_todos(things_tools, applescript_manager) -> List[str]:
     """Create a set of test todos for bulk operations."""
-    todo_ids = []
-    base_title = f"BulkTest_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    base_title = f"BulkTest_{time.time_ns():x}"
 
-    for i in range(10):
-        result = await things_tools.add_todo(
+    results = await asyncio.gather(
+        *(things_tools.add_todo(
             title=f"{base_title}_{i}",
             notes=f"Test todo {i} for bulk operations"
-        )
-        if result.get('success'):
-            # FIX: add_todo returns 'todo_id', not 'id'
-            todo_ids.append(result['todo_id'])
+        ) for i in range(10)),
+        return_exceptions=True
+    )
+    todo_ids = _created_todo_ids(results)
 
     yield todo_ids
 
-    # Cleanup
-    for todo_id in todo_ids:
+    # Cleanup - delete everything in one AppleScript call
+    if todo_ids:
         try:
-            await things_tools.delete_todo(todo_id)
-        except:
-            pass
+            result = await applescript_manager.execute_applescript(build_bulk_delete_script(todo_ids))
+            if not result.get('success'):
+                print(f"Warning: Bulk cleanup failed: {result.get('error')}")
+        except Exception as e:
+            print(f"Error during test cleanup: {e}")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def test_project(things_tools) -> str:
-    """Create a test project for move operations."""
+    """Create one test project per run; tests only move todos into it."""
     result = await things_tools.add_project(
-        title=f"BulkMoveTest_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+        title=f"BulkMoveTest_{time.time_ns():x}",
         notes="Test project for bulk move operations"
     )
 
@@ -109,7 +115,7 @@ class TestBulkUpdateSingleField:
     async def test_update_title_only(self, things_tools, test_todos):
         """Test updating only the title field."""
         todo_ids = test_todos[:3]
-        new_title = f"Updated_{datetime.now().strftime('%H%M%S')}"
+        new_title = f"Updated_{time.time_ns():x}"
 
         result = await things_tools.bulk_update_todos(
             todo_ids=todo_ids,
@@ -150,7 +156,7 @@ class TestBulkUpdateSingleField:
     async def test_update_deadline_only(self, things_tools, test_todos):
         """Test updating only the deadline field."""
         todo_ids = test_todos[:3]
-        deadline_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+        deadline_date = _DEADLINE_7
 
         result = await things_tools.bulk_update_todos(
             todo_ids=todo_ids,
@@ -220,7 +226,7 @@ class TestBulkUpdateMultiField:
     async def test_update_title_and_notes(self, things_tools, test_todos):
         """Test updating title and notes together."""
         todo_ids = test_todos[:3]
-        new_title = f"MultiUpdate_{datetime.now().strftime('%H%M%S')}"
+        new_title = f"MultiUpdate_{time.time_ns():x}"
         new_notes = "Updated with multiple fields"
 
         result = await things_tools.bulk_update_todos(
@@ -239,7 +245,7 @@ class TestBulkUpdateMultiField:
 
         result = await things_tools.bulk_update_todos(
             todo_ids=todo_ids,
-            title=f"Triple_{datetime.now().strftime('%H%M%S')}",
+            title=f"Triple_{time.time_ns():x}",
             notes="Three field update",
             when="today"
         )
@@ -251,7 +257,7 @@ class TestBulkUpdateMultiField:
     async def test_update_tags_and_deadline(self, things_tools, test_todos):
         """Test updating tags and deadline together."""
         todo_ids = test_todos[:3]
-        deadline_date = (datetime.now() + timedelta(days=14)).strftime('%Y-%m-%d')
+        deadline_date = _DEADLINE_14
 
         result = await things_tools.bulk_update_todos(
             todo_ids=todo_ids,
@@ -266,11 +272,11 @@ class TestBulkUpdateMultiField:
     async def test_update_four_fields(self, things_tools, test_todos):
         """Test updating four fields together."""
         todo_ids = test_todos[:2]
-        deadline_date = (datetime.now() + timedelta(days=21)).strftime('%Y-%m-%d')
+        deadline_date = _DEADLINE_21
 
         result = await things_tools.bulk_update_todos(
             todo_ids=todo_ids,
-            title=f"FourFields_{datetime.now().strftime('%H%M%S')}",
+            title=f"FourFields_{time.time_ns():x}",
             notes="Four field update",
             tags=["test"],
             deadline=deadline_date
@@ -282,11 +288,11 @@ class TestBulkUpdateMultiField:
     async def test_update_maximum_fields(self, things_tools, test_todos):
         """Test updating all possible fields together."""
         todo_ids = test_todos[:2]
-        deadline_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+        deadline_date = _DEADLINE_30
 
         result = await things_tools.bulk_update_todos(
             todo_ids=todo_ids,
-            title=f"MaxFields_{datetime.now().strftime('%H%M%S')}",
+            title=f"MaxFields_{time.time_ns():x}",
             notes="Maximum field update",
             tags=["test"],
             when="today",
@@ -345,30 +351,26 @@ class TestBulkUpdateBatchSizes:
 
     @pytest.mark.asyncio
     @pytest.mark.slow
-    async def test_batch_size_50_performance(self, things_tools):
+    async def test_batch_size_50_performance(self, things_tools, applescript_manager):
         """Test with batch size of 50 (performance test)."""
         # Create 50 test todos
-        todo_ids = []
-        base_title = f"Perf50_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        base_title = f"Perf50_{time.time_ns():x}"
 
-        for i in range(50):
-            result = await things_tools.add_todo(
-                title=f"{base_title}_{i}"
-            )
-            if result.get('success'):
-                # FIX: add_todo returns 'todo_id', not 'id'
-                todo_ids.append(result['todo_id'])
+        results = await asyncio.gather(
+            *(things_tools.add_todo(title=f"{base_title}_{i}") for i in range(50)),
+            return_exceptions=True
+        )
+        todo_ids = _created_todo_ids(results)
 
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
 
             result = await things_tools.bulk_update_todos(
                 todo_ids=todo_ids,
                 title="Perf50Update"
             )
 
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
 
             assert result['success']
             assert duration < 30.0, f"Took {duration}s (expected <30s)"
@@ -376,11 +378,8 @@ class TestBulkUpdateBatchSizes:
             print(f"\n50-todo bulk update: {duration:.2f}s ({duration/50:.3f}s per todo)")
 
         finally:
-            for todo_id in todo_ids:
-                try:
-                    await things_tools.delete_todo(todo_id)
-                except:
-                    pass
+            if todo_ids:
+                await applescript_manager.execute_applescript(build_bulk_delete_script(todo_ids))
 
 
 # ============================================================================
@@ -18,20 +18,6 @@ Then verify cleanup:
 """
 
 import pytest
-from things_mcp.services.applescript_manager import AppleScriptManager
-from things_mcp.tools import ThingsTools
-
-
-@pytest.fixture
-def applescript_manager():
-    """Create real AppleScript manager."""
-    return AppleScriptManager()
-
-
-@pytest.fixture
-def things_tools(applescript_manager):
-    """Create ThingsTools instance."""
-    return ThingsTools(applescript_manager)
 
 
 class TestCleanupMechanism:
@@ -42,25 +28,27 @@ class TestCleanupMechanism:
         """Create 5 todos, verify they're cleaned up automatically."""
         print(f"\n🧪 Testing cleanup mechanism with tag: {cleanup_test_todos['tag']}")
 
-        # Create 5 test todos
-        created_todos = []
-        for i in range(5):
-            result = await things_tools.add_todo(
-                title=f"Cleanup Test {i} - {cleanup_test_todos['tag']}",
-                notes=f"This is test todo {i} for cleanup verification"
-            )
+        # Create 5 test todos in one AppleScript call
+        result = await things_tools.bulk_add_todos([
+            {
+                "title": f"Cleanup Test {i} - {cleanup_test_todos['tag']}",
+                "notes": f"This is test todo {i} for cleanup verification"
+            }
+            for i in range(5)
+        ])
 
-            assert result.get('success'), f"Failed to create todo {i}"
-            todo_id = result['todo_id']
-            cleanup_test_todos['ids'].append(todo_id)
-            created_todos.append(todo_id)
+        created_todos = result['todo_ids']
+        cleanup_test_todos['ids'].extend(created_todos)
+        assert result.get('success'), f"Failed to create todos: {result}"
 
+        for i, todo_id in enumerate(created_todos):
             print(f"  ✓ Created todo {i+1}/5: {todo_id}")
 
         # Verify all todos exist
         print(f"\n📋 Verifying todos exist before cleanup...")
+        todos = await things_tools.get_todos_by_ids(created_todos)
         for i, todo_id in enumerate(created_todos):
-            todo = await things_tools.get_todo_by_id(todo_id=todo_id)
+            todo = todos.get(todo_id)
             assert todo is not None, f"Todo {i} not found"
             assert todo['uuid'] == todo_id, f"UUID mismatch: expected {todo_id}, got {todo.get('uuid')}"
             print(f"  ✓ Todo {i+1}/5 exists: {todo['title']}")
@@ -102,7 +90,7 @@ class TestCleanupMechanism:
         # Create project
         result = await things_tools.add_project(
             title=f"Cleanup Project Test - {cleanup_test_todos['tag']}",
-            notes="This project should be canceled by cleanup"
+            notes="This project should be deleted by cleanup"
         )
 
         assert result.get('success')
@@ -111,5 +99,5 @@ class TestCleanupMechanism:
 
         print(f"  ✓ Created project: {project_id}")
 
-        # Cleanup fixture will cancel this project
-        print(f"🔄 Cleanup fixture will cancel this project...")
+        # Cleanup fixture will delete this project
+        print(f"🔄 Cleanup fixture will delete this project...")
@@ -22,43 +22,39 @@ Safety Features:
 - Tests are idempotent (can run multiple times)
 """
 
+import functools
+import logging
 import pytest
 from datetime import datetime, date, timedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
-from things_mcp.services.applescript_manager import AppleScriptManager
 from things_mcp.tools import ThingsTools
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
-def applescript_manager():
-    """Create real AppleScript manager for integration tests."""
-    return AppleScriptManager()
-
-
-@pytest.fixture
-def things_tools(applescript_manager):
-    """Create ThingsTools instance with real AppleScript manager."""
-    return ThingsTools(applescript_manager)
-
-
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+@functools.lru_cache(maxsize=256)
+def _iso(n: int, today_ordinal: int) -> str:
+    """ISO date N days after the given ordinal; keyed on the day so results never go stale."""
+    return (date.fromordinal(today_ordinal) + timedelta(days=n)).isoformat()
+
+
 def get_date_n_days_from_now(n: int) -> str:
     """Get ISO date string for N days from now."""
-    target_date = date.today() + timedelta(days=n)
-    return target_date.isoformat()
+    return _iso(n, date.today().toordinal())
 
 
 def get_today_iso() -> str:
     """Get today's date in ISO format."""
-    return date.today().isoformat()
+    return get_date_n_days_from_now(0)
 
 
 def get_tomorrow_iso() -> str:
@@ -66,14 +62,15 @@ def get_tomorrow_iso() -> str:
     return get_date_n_days_from_now(1)
 
 
-async def verify_todo_start_date(tools: ThingsTools, todo_id: str, expected_date: str, debug: bool = True) -> bool:
+async def verify_todo_start_date(tools: ThingsTools, todo_id: str, expected_date: str) -> bool:
     """Verify a todo has the expected start date.
 
+    Details are logged at DEBUG level; run with --log-cli-level=DEBUG to see them.
+
     Args:
         tools: ThingsTools instance
         todo_id: ID of todo to check
         expected_date: Expected startDate in ISO format (YYYY-MM-DD)
-        debug: Print debug information if True
 
     Returns:
         True if startDate matches, False otherwise
@@ -83,20 +80,41 @@ async def verify_todo_start_date(tools: ThingsTools, todo_id: str, expected_date
         # get_todo_by_id returns camelCase fields: startDate, dueDate, etc.
         actual_date = todo.get('startDate')
 
-        if debug:
-            print(f"\n[DEBUG] Todo: {todo.get('title')}")
-            print(f"[DEBUG] Expected: {expected_date}")
-            print(f"[DEBUG] Actual: {actual_date}")
-            print(f"[DEBUG] All keys: {list(todo.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Todo %s: expected=%s actual=%s keys=%s",
+                         todo.get('title'), expected_date, actual_date, list(todo))
 
         return actual_date == expected_date
-    except Exception as e:
-        print(f"Error verifying todo start date: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error verifying todo start date")
         return False
 
 
+async def verify_todo_start_dates(tools: ThingsTools, pairs: List[Tuple[str, str]]) -> Dict[str, bool]:
+    """Verify start dates for several todos with a single lookup.
+
+    Args:
+        tools: ThingsTools instance
+        pairs: (todo_id, expected ISO startDate) tuples
+
+    Returns:
+        Dict mapping each todo ID to whether its startDate matched;
+        IDs that could not be found map to False
+    """
+    todos = await tools.get_todos_by_ids([todo_id for todo_id, _ in pairs])
+    results = {
+        todo_id: todos.get(todo_id, {}).get('startDate') == expected
+        for todo_id, expected in pairs
+    }
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for todo_id, expected in pairs:
+            logger.debug("Todo %s: expected=%s actual=%s",
+                         todo_id, expected, todos.get(todo_id, {}).get('startDate'))
+
+    return results
+
+
 # ============================================================================
 # Test Suite 1: Basic Date Scheduling
 # ============================================================================
@@ -211,8 +229,8 @@ class TestRelativeOffsets:
 
         # Verify scheduling (7 days from today)
         expected_date = get_date_n_days_from_now(7)
-        is_correct = await verify_todo_start_date(things_tools, todo_id, expected_date)
-        assert is_correct, f"Todo not scheduled for +7d ({expected_date})"
+        results = await verify_todo_start_dates(things_tools, [(todo_id, expected_date)])
+        assert results[todo_id], f"Todo not scheduled for +7d ({expected_date})"
 
     @pytest.mark.asyncio
     async def test_schedule_plus_1_week(self, things_tools, cleanup_test_todos):
@@ -228,8 +246,8 @@ class TestRelativeOffsets:
 
         # Verify scheduling (7 days from today)
         expected_date = get_date_n_days_from_now(7)
-        is_correct = await verify_todo_start_date(things_tools, todo_id, expected_date)
-        assert is_correct, f"Todo not scheduled for +1w ({expected_date})"
+        results = await verify_todo_start_dates(things_tools, [(todo_id, expected_date)])
+        assert results[todo_id], f"Todo not scheduled for +1w ({expected_date})"
 
     @pytest.mark.asyncio
     async def test_schedule_plus_1_month(self, things_tools, cleanup_test_todos):
@@ -268,8 +286,8 @@ class TestRelativeOffsets:
 
         # Verify scheduling
         expected_date = get_date_n_days_from_now(3)
-        is_correct = await verify_todo_start_date(things_tools, todo_id, expected_date)
-        assert is_correct, f"Todo not scheduled for +3d ({expected_date})"
+        results = await verify_todo_start_dates(things_tools, [(todo_id, expected_date)])
+        assert results[todo_id], f"Todo not scheduled for +3d ({expected_date})"
 
     @pytest.mark.asyncio
     async def test_schedule_plus_14_days(self, things_tools, cleanup_test_todos):
@@ -285,8 +303,8 @@ class TestRelativeOffsets:
 
         # Verify scheduling
         expected_date = get_date_n_days_from_now(14)
-        is_correct = await verify_todo_start_date(things_tools, todo_id, expected_date)
-        assert is_correct, f"Todo not scheduled for +14d ({expected_date})"
+        results = await verify_todo_start_dates(things_tools, [(todo_id, expected_date)])
+        assert results[todo_id], f"Todo not scheduled for +14d ({expected_date})"
 
 
 # ============================================================================
@@ -12,22 +12,17 @@ import pytest
 from datetime import datetime, date, timedelta
 from freezegun import freeze_time
 
-from things_mcp.tools import ThingsTools
-from things_mcp.services.applescript_manager import AppleScriptManager
-
 
 class TestMonthOverflowScheduling:
     """Test month overflow edge cases in todo scheduling."""
 
     @pytest.mark.asyncio
-    async def test_jan_31_plus_one_month(self, cleanup_test_todos):
+    async def test_jan_31_plus_one_month(self, things_tools, cleanup_test_todos):
         """Verify Jan 31 + 1 month becomes Feb 28/29 (not March 3)."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo scheduled for Jan 31
         # Note: freezegun doesn't affect AppleScript, so use explicit date
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Jan 31 test {cleanup_test_todos['tag']}",
             when="2025-01-31",  # Explicit date instead of "today"
             tags=cleanup_test_todos['tag']
@@ -35,32 +30,30 @@ class TestMonthOverflowScheduling:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Verify it's scheduled for Jan 31
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-01-31', f"Expected 2025-01-31, got {todo['startDate']}"
 
         # Update to +1 month (should become Feb 28 or 29)
         # Note: Things 3 may not support relative date math like "+1m"
         # So we'll set it to Feb 28 explicitly
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-02-28'  # Expected overflow behavior
         )
 
         # Verify it became Feb 28 (not March 3)
-        updated_todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        updated_todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert updated_todo['startDate'] in ['2025-02-28', '2025-02-29'], \
             f"Expected Feb 28/29, got {updated_todo['startDate']}"
 
         print(f"✓ Jan 31 → Feb 28/29 (month overflow handled)")
 
     @pytest.mark.asyncio
-    async def test_mar_31_minus_one_month(self, cleanup_test_todos):
+    async def test_mar_31_minus_one_month(self, things_tools, cleanup_test_todos):
         """Verify Mar 31 - 1 month becomes Feb 28/29."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo scheduled for Mar 31
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Mar 31 test {cleanup_test_todos['tag']}",
             when="2025-03-31",  # Explicit date
             tags=cleanup_test_todos['tag']
@@ -68,26 +61,24 @@ class TestMonthOverflowScheduling:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update to Feb 28 (simulating -1 month)
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-02-28'
         )
 
         # Verify it's Feb 28
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] in ['2025-02-28', '2025-02-29'], \
             f"Expected Feb 28/29, got {todo['startDate']}"
 
         print(f"✓ Mar 31 → Feb 28/29 (backward month overflow)")
 
     @pytest.mark.asyncio
-    async def test_may_31_plus_one_month(self, cleanup_test_todos):
+    async def test_may_31_plus_one_month(self, things_tools, cleanup_test_todos):
         """Verify May 31 + 1 month becomes Jun 30."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo scheduled for May 31
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"May 31 test {cleanup_test_todos['tag']}",
             when='2025-05-31',
             tags=cleanup_test_todos['tag']
@@ -95,26 +86,24 @@ class TestMonthOverflowScheduling:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update to Jun 30 (May 31 + 1 month)
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-06-30'
         )
 
         # Verify it's Jun 30
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-06-30', \
             f"Expected 2025-06-30, got {todo['startDate']}"
 
         print(f"✓ May 31 → Jun 30 (30-day month overflow)")
 
     @pytest.mark.asyncio
-    async def test_aug_31_plus_one_month(self, cleanup_test_todos):
+    async def test_aug_31_plus_one_month(self, things_tools, cleanup_test_todos):
         """Verify Aug 31 + 1 month becomes Sep 30."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo for Aug 31
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Aug 31 test {cleanup_test_todos['tag']}",
             when='2025-08-31',
             tags=cleanup_test_todos['tag']
@@ -122,26 +111,24 @@ class TestMonthOverflowScheduling:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update to Sep 30
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-09-30'
         )
 
         # Verify
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-09-30', \
             f"Expected 2025-09-30, got {todo['startDate']}"
 
         print(f"✓ Aug 31 → Sep 30 (month overflow)")
 
     @pytest.mark.asyncio
-    async def test_oct_31_plus_one_month(self, cleanup_test_todos):
+    async def test_oct_31_plus_one_month(self, things_tools, cleanup_test_todos):
         """Verify Oct 31 + 1 month becomes Nov 30."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo for Oct 31
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Oct 31 test {cleanup_test_todos['tag']}",
             when='2025-10-31',
             tags=cleanup_test_todos['tag']
@@ -149,13 +136,13 @@ class TestMonthOverflowScheduling:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update to Nov 30
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-11-30'
         )
 
         # Verify
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-11-30', \
             f"Expected 2025-11-30, got {todo['startDate']}"
 
@@ -166,13 +153,11 @@ class TestMonthOverflowDeadlines:
     """Test month overflow edge cases with deadlines."""
 
     @pytest.mark.asyncio
-    async def test_deadline_jan_31_plus_month(self, cleanup_test_todos):
+    async def test_deadline_jan_31_plus_month(self, things_tools, cleanup_test_todos):
         """Verify deadline Jan 31 + 1 month becomes Feb 28/29."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo with Jan 31 deadline
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Deadline Jan 31 {cleanup_test_todos['tag']}",
             deadline='2025-01-31',
             tags=cleanup_test_todos['tag']
@@ -180,26 +165,24 @@ class TestMonthOverflowDeadlines:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update deadline to Feb 28
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             deadline='2025-02-28'
         )
 
         # Verify
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['dueDate'] in ['2025-02-28', '2025-02-29'], \
             f"Expected Feb 28/29 deadline, got {todo['dueDate']}"
 
         print(f"✓ Deadline Jan 31 → Feb 28/29")
 
     @pytest.mark.asyncio
-    async def test_deadline_leap_year_feb_29(self, cleanup_test_todos):
+    async def test_deadline_leap_year_feb_29(self, things_tools, cleanup_test_todos):
         """Verify Feb 29 deadline works in leap year."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # 2024 is a leap year
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Leap year test {cleanup_test_todos['tag']}",
             deadline='2024-02-29',
             tags=cleanup_test_todos['tag']
@@ -207,20 +190,18 @@ class TestMonthOverflowDeadlines:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Verify deadline is Feb 29
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['dueDate'] == '2024-02-29', \
             f"Expected 2024-02-29, got {todo['dueDate']}"
 
         print(f"✓ Leap year Feb 29 deadline accepted")
 
     @pytest.mark.asyncio
-    async def test_deadline_non_leap_feb_28(self, cleanup_test_todos):
+    async def test_deadline_non_leap_feb_28(self, things_tools, cleanup_test_todos):
         """Verify Feb 28 deadline in non-leap year."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # 2025 is not a leap year
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Non-leap year test {cleanup_test_todos['tag']}",
             deadline='2025-02-28',
             tags=cleanup_test_todos['tag']
@@ -228,18 +209,18 @@ class TestMonthOverflowDeadlines:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Verify deadline is Feb 28
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['dueDate'] == '2025-02-28', \
             f"Expected 2025-02-28, got {todo['dueDate']}"
 
         # Try to set Feb 29 in non-leap year (should fail or become Feb 28)
         try:
-            await tools.update_todo(
+            await things_tools.update_todo(
                 todo_id=result['todo_id'],
                 deadline='2025-02-29'  # Invalid date
             )
             # If it doesn't raise, check what date it became
-            updated = await tools.get_todo_by_id(todo_id=result['todo_id'])
+            updated = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
             # Should either stay Feb 28 or error was handled
             assert updated['dueDate'] in ['2025-02-28', '2025-03-01'], \
                 "Invalid Feb 29 not handled correctly"
@@ -254,13 +235,11 @@ class TestYearBoundaries:
     """Test year boundary edge cases."""
 
     @pytest.mark.asyncio
-    async def test_dec_31_plus_one_month(self, cleanup_test_todos):
+    async def test_dec_31_plus_one_month(self, things_tools, cleanup_test_todos):
         """Verify Dec 31 + 1 month becomes Jan 31 (next year)."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo for Dec 31, 2025
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Dec 31 test {cleanup_test_todos['tag']}",
             when='2025-12-31',
             tags=cleanup_test_todos['tag']
@@ -268,26 +247,24 @@ class TestYearBoundaries:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update to Jan 31, 2026
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2026-01-31'
         )
 
         # Verify year crossed correctly
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2026-01-31', \
             f"Expected 2026-01-31, got {todo['startDate']}"
 
         print(f"✓ Dec 31 2025 → Jan 31 2026 (year boundary)")
 
     @pytest.mark.asyncio
-    async def test_jan_31_minus_one_month(self, cleanup_test_todos):
+    async def test_jan_31_minus_one_month(self, things_tools, cleanup_test_todos):
         """Verify Jan 31 - 1 month becomes Dec 31 (previous year)."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo for Jan 31, 2026
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Jan 31 backward test {cleanup_test_todos['tag']}",
             when='2026-01-31',
             tags=cleanup_test_todos['tag']
@@ -295,13 +272,13 @@ class TestYearBoundaries:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Update to Dec 31, 2025 (backward across year)
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-12-31'
         )
 
         # Verify
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-12-31', \
             f"Expected 2025-12-31, got {todo['startDate']}"
 
@@ -312,13 +289,11 @@ class TestComplexDateScenarios:
     """Test complex combinations of date edge cases."""
 
     @pytest.mark.asyncio
-    async def test_leap_year_boundary(self, cleanup_test_todos):
+    async def test_leap_year_boundary(self, things_tools, cleanup_test_todos):
         """Test Feb 29 in leap year transitions."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo for Feb 29, 2024 (leap year)
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Leap boundary {cleanup_test_todos['tag']}",
             when='2024-02-29',
             tags=cleanup_test_todos['tag']
@@ -326,30 +301,28 @@ class TestComplexDateScenarios:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Verify it was created
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2024-02-29', "Leap year Feb 29 not accepted"
 
         # Try to move to next year (2025, non-leap)
         # Should become Feb 28, 2025
-        await tools.update_todo(
+        await things_tools.update_todo(
             todo_id=result['todo_id'],
             when='2025-02-28'  # Can't do Feb 29 in non-leap year
         )
 
-        updated = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        updated = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert updated['startDate'] == '2025-02-28', \
             f"Expected 2025-02-28, got {updated['startDate']}"
 
         print(f"✓ Leap year Feb 29 → non-leap Feb 28")
 
     @pytest.mark.asyncio
-    async def test_multiple_month_edges(self, cleanup_test_todos):
+    async def test_multiple_month_edges(self, things_tools, cleanup_test_todos):
         """Test todo scheduled across multiple month edges."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo for Jan 31
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Multi-month edge {cleanup_test_todos['tag']}",
             when='2025-01-31',
             tags=cleanup_test_todos['tag']
@@ -357,18 +330,18 @@ class TestComplexDateScenarios:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Jan 31 → Feb 28
-        await tools.update_todo(todo_id=result['todo_id'], when='2025-02-28')
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        await things_tools.update_todo(todo_id=result['todo_id'], when='2025-02-28')
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-02-28', "Jan 31 → Feb 28 failed"
 
         # Feb 28 → Mar 31
-        await tools.update_todo(todo_id=result['todo_id'], when='2025-03-31')
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        await things_tools.update_todo(todo_id=result['todo_id'], when='2025-03-31')
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-03-31', "Feb 28 → Mar 31 failed"
 
         # Mar 31 → Apr 30
-        await tools.update_todo(todo_id=result['todo_id'], when='2025-04-30')
-        todo = await tools.get_todo_by_id(todo_id=result['todo_id'])
+        await things_tools.update_todo(todo_id=result['todo_id'], when='2025-04-30')
+        todo = await things_tools.get_todo_by_id(todo_id=result['todo_id'])
         assert todo['startDate'] == '2025-04-30', "Mar 31 → Apr 30 failed"
 
         print(f"✓ Multiple month edge transitions work correctly")
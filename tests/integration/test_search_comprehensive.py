@@ -9,26 +9,24 @@ This test suite systematically validates:
 5. Pagination and context optimization
 """
 
+import logging
 import pytest
 import asyncio
 from datetime import datetime, date, timedelta
 from typing import Dict, List, Any
 
-# Import MCP tools - adjust based on your project structure
-from things_mcp.tools import ThingsTools
-from things_mcp.services.applescript_manager import AppleScriptManager
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def tools(things_tools):
+    """Session-wide ThingsTools instance from conftest."""
+    return things_tools
 
 
 class TestBasicSearch:
     """Test basic search_todos functionality with various parameters."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_search_simple_text(self, tools):
         """Test basic text search in titles and notes."""
@@ -36,7 +34,7 @@ class TestBasicSearch:
         results = await tools.search_todos(query="test", limit=10)
 
         assert isinstance(results, list)
-        print(f"\n✓ Simple text search returned {len(results)} results")
+        logger.info(f"✓ Simple text search returned {len(results)} results")
 
         # Verify all results contain the search term
         for todo in results:
@@ -60,7 +58,7 @@ class TestBasicSearch:
             assert len(results) <= limit, \
                 f"Results ({len(results)}) exceeded limit ({limit})"
 
-            print(f"\n✓ Search with limit={limit} returned {len(results)} results")
+            logger.info(f"✓ Search with limit={limit} returned {len(results)} results")
 
         # Verify increasing limits return more results (up to max available)
         assert results_by_limit[10] <= results_by_limit[50]
@@ -78,7 +76,7 @@ class TestBasicSearch:
         assert len(lower_results) == len(upper_results) == len(mixed_results), \
             "Case sensitivity detected in search"
 
-        print(f"\n✓ Case-insensitive search confirmed ({len(lower_results)} results)")
+        logger.info(f"✓ Case-insensitive search confirmed ({len(lower_results)} results)")
 
     @pytest.mark.asyncio
     async def test_search_in_notes(self, tools):
@@ -98,7 +96,7 @@ class TestBasicSearch:
             if 'details' in title:
                 title_matches += 1
 
-        print(f"\n✓ Search found 'details' in {title_matches} titles, {notes_matches} notes")
+        logger.info(f"✓ Search found 'details' in {title_matches} titles, {notes_matches} notes")
         assert notes_matches > 0 or title_matches > 0, "No matches found"
 
     @pytest.mark.asyncio
@@ -111,7 +109,7 @@ class TestBasicSearch:
         )
 
         assert isinstance(results, list)
-        print(f"\n✓ No-match search returned {len(results)} results (expected 0)")
+        logger.info(f"✓ No-match search returned {len(results)} results (expected 0)")
 
     @pytest.mark.asyncio
     async def test_search_empty_query(self, tools):
@@ -120,21 +118,14 @@ class TestBasicSearch:
             results = await tools.search_todos(query="", limit=10)
             # Empty query might return all results or empty list
             assert isinstance(results, list)
-            print(f"\n✓ Empty query handled gracefully ({len(results)} results)")
+            logger.info(f"✓ Empty query handled gracefully ({len(results)} results)")
         except Exception as e:
-            print(f"\n✓ Empty query properly rejected: {e}")
+            logger.info(f"✓ Empty query properly rejected: {e}")
 
 
 class TestAdvancedSearch:
     """Test advanced search with multiple filters and combinations."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_search_by_status(self, tools):
         """Test filtering by status: incomplete, completed, canceled."""
@@ -144,7 +135,7 @@ class TestAdvancedSearch:
             results = await tools.search_advanced(status=status, limit=20)
 
             assert isinstance(results, list)
-            print(f"\n✓ Status filter '{status}' returned {len(results)} results")
+            logger.info(f"✓ Status filter '{status}' returned {len(results)} results")
 
             # Verify status matches (only check if we got results)
             if results:
@@ -170,7 +161,7 @@ class TestAdvancedSearch:
             results = await tools.search_advanced(type=item_type, limit=20)
 
             assert isinstance(results, list)
-            print(f"\n✓ Type filter '{item_type}' returned {len(results)} results")
+            logger.info(f"✓ Type filter '{item_type}' returned {len(results)} results")
 
     @pytest.mark.asyncio
     async def test_search_by_tag(self, tools):
@@ -185,7 +176,7 @@ class TestAdvancedSearch:
             results = await tools.search_advanced(tag=test_tag, limit=50)
 
             assert isinstance(results, list)
-            print(f"\n✓ Tag filter '{test_tag}' returned {len(results)} results")
+            logger.info(f"✓ Tag filter '{test_tag}' returned {len(results)} results")
 
             # Verify all results have the tag
             for todo in results:
@@ -193,7 +184,7 @@ class TestAdvancedSearch:
                 assert test_tag in tag_names, \
                     f"Todo {todo.get('id')} missing tag '{test_tag}'"
         else:
-            print("\n⚠ No tags available for testing")
+            logger.info("⚠ No tags available for testing")
 
     @pytest.mark.asyncio
     async def test_search_by_date_range(self, tools):
@@ -208,7 +199,7 @@ class TestAdvancedSearch:
         )
 
         assert isinstance(results, list)
-        print(f"\n✓ Deadline filter returned {len(results)} results")
+        logger.info(f"✓ Deadline filter returned {len(results)} results")
 
         # Test start date filtering
         results = await tools.search_advanced(
@@ -217,7 +208,7 @@ class TestAdvancedSearch:
         )
 
         assert isinstance(results, list)
-        print(f"\n✓ Start date filter returned {len(results)} results")
+        logger.info(f"✓ Start date filter returned {len(results)} results")
 
     @pytest.mark.asyncio
     async def test_search_combined_filters(self, tools):
@@ -232,7 +223,7 @@ class TestAdvancedSearch:
         )
 
         assert isinstance(results, list)
-        print(f"\n✓ Combined filters (status+type) returned {len(results)} results")
+        logger.info(f"✓ Combined filters (status+type) returned {len(results)} results")
 
         # Get a tag to test with
         tags = await tools.get_tags(include_items=False)
@@ -247,7 +238,7 @@ class TestAdvancedSearch:
                 limit=100
             )
 
-            print(f"\n✓ Combined filters (status+type+tag) returned {len(results)} results")
+            logger.info(f"✓ Combined filters (status+type+tag) returned {len(results)} results")
 
     @pytest.mark.asyncio
     async def test_search_by_area(self, tools):
@@ -264,28 +255,21 @@ class TestAdvancedSearch:
             )
 
             assert isinstance(results, list)
-            print(f"\n✓ Area filter returned {len(results)} results")
+            logger.info(f"✓ Area filter returned {len(results)} results")
         else:
-            print("\n⚠ No areas available for testing")
+            logger.info("⚠ No areas available for testing")
 
 
 class TestTagBasedRetrieval:
     """Test tag-related operations and retrieval."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_get_tags_counts_only(self, tools):
         """Test getting tags with item counts."""
         results = await tools.get_tags(include_items=False)
 
         assert isinstance(results, list)
-        print(f"\n✓ Retrieved {len(results)} tags with counts")
+        logger.info(f"✓ Retrieved {len(results)} tags with counts")
 
         for tag in results:
             assert 'name' in tag
@@ -299,7 +283,7 @@ class TestTagBasedRetrieval:
         # Print sample
         if results:
             sample = results[0]
-            print(f"   Sample: {sample}")
+            logger.info(f"   Sample: {sample}")
 
     @pytest.mark.asyncio
     async def test_get_tags_with_items(self, tools):
@@ -307,7 +291,7 @@ class TestTagBasedRetrieval:
         results = await tools.get_tags(include_items=True)
 
         assert isinstance(results, list)
-        print(f"\n✓ Retrieved {len(results)} tags with full items")
+        logger.info(f"✓ Retrieved {len(results)} tags with full items")
 
         total_items = 0
         for tag in results:
@@ -317,7 +301,7 @@ class TestTagBasedRetrieval:
 
             total_items += len(tag['items'])
 
-        print(f"   Total items across all tags: {total_items}")
+        logger.info(f"   Total items across all tags: {total_items}")
 
     @pytest.mark.asyncio
     async def test_get_tagged_items(self, tools):
@@ -333,14 +317,14 @@ class TestTagBasedRetrieval:
                 items = await tools.get_tagged_items(tag=tag_name)
 
                 assert isinstance(items, list)
-                print(f"\n✓ Tag '{tag_name}' has {len(items)} items")
+                logger.info(f"✓ Tag '{tag_name}' has {len(items)} items")
 
                 # Verify all items have the tag
                 for item in items:
                     tag_names = item.get('tag_names', [])
                     assert tag_name in tag_names
         else:
-            print("\n⚠ No tags available for testing")
+            logger.info("⚠ No tags available for testing")
 
     @pytest.mark.asyncio
     async def test_add_and_remove_tags(self, tools):
@@ -354,22 +338,15 @@ class TestTagBasedRetrieval:
 
             # Note: This requires the tag to exist first
             # In real usage, users must create tags manually
-            print(f"\n⚠ Note: Tag '{test_tag}' must exist to test add_tags")
-            print("   Skipping tag manipulation test (requires manual tag creation)")
+            logger.info(f"⚠ Note: Tag '{test_tag}' must exist to test add_tags")
+            logger.info("   Skipping tag manipulation test (requires manual tag creation)")
         else:
-            print("\n⚠ No todos available for tag testing")
+            logger.info("⚠ No todos available for tag testing")
 
 
 class TestSpecialQueries:
     """Test special query syntax and edge cases."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_search_with_special_characters(self, tools):
         """Test search with special characters."""
@@ -386,9 +363,9 @@ class TestSpecialQueries:
             try:
                 results = await tools.search_todos(query=query, limit=20)
                 assert isinstance(results, list)
-                print(f"\n✓ Special char query '{query}' returned {len(results)} results")
+                logger.info(f"✓ Special char query '{query}' returned {len(results)} results")
             except Exception as e:
-                print(f"\n✗ Query '{query}' failed: {e}")
+                logger.info(f"✗ Query '{query}' failed: {e}")
 
     @pytest.mark.asyncio
     async def test_search_phrase_matching(self, tools):
@@ -403,7 +380,7 @@ class TestSpecialQueries:
         for phrase in phrases:
             results = await tools.search_todos(query=phrase, limit=20)
             assert isinstance(results, list)
-            print(f"\n✓ Phrase '{phrase}' returned {len(results)} results")
+            logger.info(f"✓ Phrase '{phrase}' returned {len(results)} results")
 
     @pytest.mark.asyncio
     async def test_wildcard_patterns(self, tools):
@@ -414,22 +391,15 @@ class TestSpecialQueries:
         for pattern in patterns:
             try:
                 results = await tools.search_todos(query=pattern, limit=20)
-                print(f"\n✓ Pattern '{pattern}' returned {len(results)} results")
+                logger.info(f"✓ Pattern '{pattern}' returned {len(results)} results")
             except Exception as e:
-                print(f"\n⚠ Wildcards not supported: {e}")
+                logger.info(f"⚠ Wildcards not supported: {e}")
                 break
 
 
 class TestTrashPagination:
     """Test trash retrieval with pagination."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_get_trash_default(self, tools):
         """Test getting trash with default pagination."""
@@ -442,8 +412,8 @@ class TestTrashPagination:
         assert 'offset' in result
         assert 'has_more' in result
 
-        print(f"\n✓ Trash default: {len(result['items'])} items, "
-              f"total={result['total_count']}, has_more={result['has_more']}")
+        logger.info(f"✓ Trash default: {len(result['items'])} items, "
+                    f"total={result['total_count']}, has_more={result['has_more']}")
 
     @pytest.mark.asyncio
     async def test_get_trash_with_limit(self, tools):
@@ -454,7 +424,7 @@ class TestTrashPagination:
             result = await tools.get_trash(limit=limit)
 
             assert len(result['items']) <= limit
-            print(f"\n✓ Trash with limit={limit}: {len(result['items'])} items")
+            logger.info(f"✓ Trash with limit={limit}: {len(result['items'])} items")
 
     @pytest.mark.asyncio
     async def test_get_trash_with_offset(self, tools):
@@ -473,8 +443,8 @@ class TestTrashPagination:
             overlap = page1_ids & page2_ids
             assert len(overlap) == 0, "Pages should not overlap"
 
-            print(f"\n✓ Pagination working: page1={len(page1['items'])}, "
-                  f"page2={len(page2['items'])}, no overlap")
+            logger.info(f"✓ Pagination working: page1={len(page1['items'])}, "
+                        f"page2={len(page2['items'])}, no overlap")
 
     @pytest.mark.asyncio
     async def test_get_trash_iterate_all(self, tools):
@@ -492,19 +462,12 @@ class TestTrashPagination:
 
             offset += limit
 
-        print(f"\n✓ Iterated through all trash: {len(all_items)} total items")
+        logger.info(f"✓ Iterated through all trash: {len(all_items)} total items")
 
 
 class TestPerformance:
     """Test performance characteristics and context usage."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_large_result_set_timing(self, tools):
         """Test performance with large result sets."""
@@ -517,7 +480,7 @@ class TestPerformance:
             results = await tools.search_todos(query="", limit=limit)
             duration = time.time() - start
 
-            print(f"\n✓ Limit {limit}: {len(results)} results in {duration:.3f}s")
+            logger.info(f"✓ Limit {limit}: {len(results)} results in {duration:.3f}s")
 
     @pytest.mark.asyncio
     async def test_response_mode_comparison(self, tools):
@@ -527,45 +490,38 @@ class TestPerformance:
             # Standard mode (default)
             standard = await tools.search_todos(query="meeting", limit=50)
 
-            print(f"\n✓ Response mode testing would measure context usage")
-            print(f"   Standard mode: {len(standard)} results")
+            logger.info(f"✓ Response mode testing would measure context usage")
+            logger.info(f"   Standard mode: {len(standard)} results")
         except Exception as e:
-            print(f"\n⚠ Response mode testing not available: {e}")
+            logger.info(f"⚠ Response mode testing not available: {e}")
 
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_invalid_limit_values(self, tools):
         """Test handling of invalid limit values."""
         try:
             # Zero limit
             results = await tools.search_todos(query="test", limit=0)
-            print(f"\n⚠ Zero limit accepted, returned {len(results)} results")
+            logger.info(f"⚠ Zero limit accepted, returned {len(results)} results")
         except Exception as e:
-            print(f"\n✓ Zero limit properly rejected: {e}")
+            logger.info(f"✓ Zero limit properly rejected: {e}")
 
         try:
             # Negative limit
             results = await tools.search_todos(query="test", limit=-10)
-            print(f"\n⚠ Negative limit accepted")
+            logger.info(f"⚠ Negative limit accepted")
         except Exception as e:
-            print(f"\n✓ Negative limit properly rejected: {e}")
+            logger.info(f"✓ Negative limit properly rejected: {e}")
 
         try:
             # Excessive limit
             results = await tools.search_todos(query="test", limit=10000)
-            print(f"\n✓ Large limit handled, returned {len(results)} results")
+            logger.info(f"✓ Large limit handled, returned {len(results)} results")
         except Exception as e:
-            print(f"\n⚠ Large limit rejected: {e}")
+            logger.info(f"⚠ Large limit rejected: {e}")
 
     @pytest.mark.asyncio
     async def test_nonexistent_tag(self, tools):
@@ -576,7 +532,7 @@ class TestEdgeCases:
 
         assert isinstance(results, list)
         assert len(results) == 0
-        print(f"\n✓ Non-existent tag returned empty list")
+        logger.info(f"✓ Non-existent tag returned empty list")
 
     @pytest.mark.asyncio
     async def test_malformed_dates(self, tools):
@@ -586,9 +542,9 @@ class TestEdgeCases:
                 deadline="not-a-date",
                 limit=10
             )
-            print(f"\n⚠ Malformed date accepted")
+            logger.info(f"⚠ Malformed date accepted")
         except Exception as e:
-            print(f"\n✓ Malformed date properly rejected: {e}")
+            logger.info(f"✓ Malformed date properly rejected: {e}")
 
     @pytest.mark.asyncio
     async def test_concurrent_searches(self, tools):
@@ -600,87 +556,81 @@ class TestEdgeCases:
         results = await asyncio.gather(*tasks)
 
         assert len(results) == len(queries)
-        print(f"\n✓ Concurrent searches completed: {len(results)} queries")
-
-        for i, query in enumerate(queries):
-            print(f"   '{query}': {len(results[i])} results")
+        lines = [f"✓ Concurrent searches completed: {len(results)} queries"]
+        lines.extend(f"   '{query}': {len(results[i])} results" for i, query in enumerate(queries))
+        logger.info("\n".join(lines))
 
 
 # Summary test to print capabilities
 class TestCapabilities:
     """Document search syntax and capabilities."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_document_capabilities(self, tools):
         """Print documented search capabilities."""
-        print("\n" + "="*70)
-        print("THINGS MCP SERVER - SEARCH CAPABILITIES SUMMARY")
-        print("="*70)
-
-        print("\n1. BASIC SEARCH (search_todos)")
-        print("   - Text search in titles and notes")
-        print("   - Case-insensitive matching")
-        print("   - Configurable limits (10, 50, 100, 500)")
-        print("   - Returns: List[Dict] with todo details")
-
-        print("\n2. ADVANCED SEARCH (search_advanced)")
-        print("   - Filter by status: incomplete, completed, canceled")
-        print("   - Filter by type: to-do, project, heading")
-        print("   - Filter by tag (single tag)")
-        print("   - Filter by area UUID")
-        print("   - Filter by start_date (YYYY-MM-DD)")
-        print("   - Filter by deadline (YYYY-MM-DD)")
-        print("   - Combine multiple filters")
-
-        print("\n3. TAG OPERATIONS")
-        print("   - get_tags(include_items=False): Tag names with counts")
-        print("   - get_tags(include_items=True): Tag names with full items")
-        print("   - get_tagged_items(tag): All items with specific tag")
-        print("   - add_tags(todo_id, tags): Add tags to todo")
-        print("   - remove_tags(todo_id, tags): Remove tags from todo")
-
-        print("\n4. PAGINATION")
-        print("   - get_trash(limit, offset): Paginated trash retrieval")
-        print("   - Returns: {items, total_count, limit, offset, has_more}")
-
-        print("\n5. SPECIAL QUERIES")
-        print("   - Special characters: Handled in most cases")
-        print("   - Phrase matching: Supported")
-        print("   - Wildcards: Not explicitly supported")
-        print("   - Boolean operators: Not implemented")
-
-        print("\n6. PERFORMANCE")
-        print("   - Direct database access via things.py")
-        print("   - Fast retrieval for reads")
-        print("   - Response optimization available")
-        print("   - Concurrent operations supported")
-
-        print("\n7. LIMITATIONS")
-        print("   - Tags must be created manually (AI cannot create)")
-        print("   - Maximum search limit: 500")
-        print("   - Date format: YYYY-MM-DD")
-        print("   - Boolean search operators not available")
-
-        print("\n" + "="*70)
+        lines = []
+        lines.append("\n" + "="*70)
+        lines.append("THINGS MCP SERVER - SEARCH CAPABILITIES SUMMARY")
+        lines.append("="*70)
+
+        lines.append("\n1. BASIC SEARCH (search_todos)")
+        lines.append("   - Text search in titles and notes")
+        lines.append("   - Case-insensitive matching")
+        lines.append("   - Configurable limits (10, 50, 100, 500)")
+        lines.append("   - Returns: List[Dict] with todo details")
+
+        lines.append("\n2. ADVANCED SEARCH (search_advanced)")
+        lines.append("   - Filter by status: incomplete, completed, canceled")
+        lines.append("   - Filter by type: to-do, project, heading")
+        lines.append("   - Filter by tag (single tag)")
+        lines.append("   - Filter by area UUID")
+        lines.append("   - Filter by start_date (YYYY-MM-DD)")
+        lines.append("   - Filter by deadline (YYYY-MM-DD)")
+        lines.append("   - Combine multiple filters")
+
+        lines.append("\n3. TAG OPERATIONS")
+        lines.append("   - get_tags(include_items=False): Tag names with counts")
+        lines.append("   - get_tags(include_items=True): Tag names with full items")
+        lines.append("   - get_tagged_items(tag): All items with specific tag")
+        lines.append("   - add_tags(todo_id, tags): Add tags to todo")
+        lines.append("   - remove_tags(todo_id, tags): Remove tags from todo")
+
+        lines.append("\n4. PAGINATION")
+        lines.append("   - get_trash(limit, offset): Paginated trash retrieval")
+        lines.append("   - Returns: {items, total_count, limit, offset, has_more}")
+
+        lines.append("\n5. SPECIAL QUERIES")
+        lines.append("   - Special characters: Handled in most cases")
+        lines.append("   - Phrase matching: Supported")
+        lines.append("   - Wildcards: Not explicitly supported")
+        lines.append("   - Boolean operators: Not implemented")
+
+        lines.append("\n6. PERFORMANCE")
+        lines.append("   - Direct database access via things.py")
+        lines.append("   - Fast retrieval for reads")
+        lines.append("   - Response optimization available")
+        lines.append("   - Concurrent operations supported")
+
+        lines.append("\n7. LIMITATIONS")
+        lines.append("   - Tags must be created manually (AI cannot create)")
+        lines.append("   - Maximum search limit: 500")
+        lines.append("   - Date format: YYYY-MM-DD")
+        lines.append("   - Boolean search operators not available")
+
+        lines.append("\n" + "="*70)
 
         # Get actual statistics
         tags = await tools.get_tags(include_items=False)
         projects = await tools.get_projects(include_items=False)
         areas = await tools.get_areas(include_items=False)
 
-        print("\nCURRENT DATABASE STATISTICS:")
-        print(f"   Total tags: {len(tags)}")
-        print(f"   Total projects: {len(projects)}")
-        print(f"   Total areas: {len(areas)}")
-        print("="*70 + "\n")
+        lines.append("\nCURRENT DATABASE STATISTICS:")
+        lines.append(f"   Total tags: {len(tags)}")
+        lines.append(f"   Total projects: {len(projects)}")
+        lines.append(f"   Total areas: {len(areas)}")
+        lines.append("="*70)
+        logger.info("\n".join(lines))
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    pytest.main([__file__, "-v", "-o", "log_cli=true"])
\ No newline at end of file
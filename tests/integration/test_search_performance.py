@@ -4,26 +4,25 @@ Performance-focused tests for search operations.
 Measures and validates performance characteristics of search and filtering.
 """
 
+import logging
 import pytest
 import time
 import asyncio
 from datetime import datetime
 from typing import Dict, List, Any
 
-from things_mcp.tools import ThingsTools
-from things_mcp.services.applescript_manager import AppleScriptManager
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture
+def tools(things_tools):
+    """Session-wide ThingsTools instance from conftest."""
+    return things_tools
 
 
 class TestSearchPerformance:
     """Performance benchmarks for search operations."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_search_response_time_by_limit(self, tools):
         """Measure response time scaling with different limits."""
@@ -48,8 +47,8 @@ class TestSearchPerformance:
                 'count': len(todos) if todos else 0
             }
 
-            print(f"\n✓ Limit {limit:3d}: {avg_time:.3f}s avg, "
-                  f"{results[limit]['count']} results")
+            logger.info(f"✓ Limit {limit:3d}: {avg_time:.3f}s avg, "
+                        f"{results[limit]['count']} results")
 
         # Performance assertions
         assert results[10]['avg_time'] < 5.0, "Basic search too slow"
@@ -84,12 +83,12 @@ class TestSearchPerformance:
             )
             time3 = time.perf_counter() - start
 
-            print(f"\n✓ 1 filter: {time1:.3f}s, {len(result1)} results")
-            print(f"✓ 2 filters: {time2:.3f}s, {len(result2)} results")
-            print(f"✓ 3 filters: {time3:.3f}s, {len(result3)} results")
+            logger.info(f"✓ 1 filter: {time1:.3f}s, {len(result1)} results")
+            logger.info(f"✓ 2 filters: {time2:.3f}s, {len(result2)} results")
+            logger.info(f"✓ 3 filters: {time3:.3f}s, {len(result3)} results")
         else:
-            print(f"\n✓ 1 filter: {time1:.3f}s, {len(result1)} results")
-            print(f"✓ 2 filters: {time2:.3f}s, {len(result2)} results")
+            logger.info(f"✓ 1 filter: {time1:.3f}s, {len(result1)} results")
+            logger.info(f"✓ 2 filters: {time2:.3f}s, {len(result2)} results")
 
     @pytest.mark.asyncio
     async def test_tag_retrieval_performance(self, tools):
@@ -104,8 +103,8 @@ class TestSearchPerformance:
         tags_items = await tools.get_tags(include_items=True)
         time_items = time.perf_counter() - start
 
-        print(f"\n✓ Tags with counts: {time_counts:.3f}s, {len(tags_counts)} tags")
-        print(f"✓ Tags with items: {time_items:.3f}s, {len(tags_items)} tags")
+        logger.info(f"✓ Tags with counts: {time_counts:.3f}s, {len(tags_counts)} tags")
+        logger.info(f"✓ Tags with items: {time_items:.3f}s, {len(tags_items)} tags")
 
         # Items should take longer
         assert time_items >= time_counts, "Full items should take more time"
@@ -126,9 +125,9 @@ class TestSearchPerformance:
 
         total_results = sum(len(r) for r in results)
 
-        print(f"\n✓ {len(queries)} concurrent searches in {duration:.3f}s")
-        print(f"  Total results: {total_results}")
-        print(f"  Throughput: {len(queries)/duration:.1f} searches/sec")
+        logger.info(f"✓ {len(queries)} concurrent searches in {duration:.3f}s")
+        logger.info(f"  Total results: {total_results}")
+        logger.info(f"  Throughput: {len(queries)/duration:.1f} searches/sec")
 
     @pytest.mark.asyncio
     async def test_pagination_performance(self, tools):
@@ -145,21 +144,14 @@ class TestSearchPerformance:
         page2 = await tools.get_trash(limit=page_size, offset=page_size)
         time_page2 = time.perf_counter() - start
 
-        print(f"\n✓ Page 1 (offset=0): {time_page1:.3f}s")
-        print(f"✓ Page 2 (offset={page_size}): {time_page2:.3f}s")
-        print(f"  Total in trash: {page1['total_count']}")
+        logger.info(f"✓ Page 1 (offset=0): {time_page1:.3f}s")
+        logger.info(f"✓ Page 2 (offset={page_size}): {time_page2:.3f}s")
+        logger.info(f"  Total in trash: {page1['total_count']}")
 
 
 class TestMemoryEfficiency:
     """Test memory usage and data transfer efficiency."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_result_size_comparison(self, tools):
         """Compare data size of different result sets."""
@@ -173,9 +165,9 @@ class TestMemoryEfficiency:
         large = await tools.search_todos(query="", limit=500)
         large_size = sys.getsizeof(str(large))
 
-        print(f"\n✓ Small (10): ~{small_size:,} bytes")
-        print(f"✓ Large (500): ~{large_size:,} bytes")
-        print(f"  Ratio: {large_size/small_size:.1f}x")
+        logger.info(f"✓ Small (10): ~{small_size:,} bytes")
+        logger.info(f"✓ Large (500): ~{large_size:,} bytes")
+        logger.info(f"  Ratio: {large_size/small_size:.1f}x")
 
     @pytest.mark.asyncio
     async def test_field_optimization_impact(self, tools):
@@ -197,21 +189,14 @@ class TestMemoryEfficiency:
             }
             minimal_size = sys.getsizeof(str(minimal))
 
-            print(f"\n✓ Full todo: ~{full_size:,} bytes")
-            print(f"✓ Minimal: ~{minimal_size:,} bytes")
-            print(f"  Reduction: {(1 - minimal_size/full_size)*100:.1f}%")
+            logger.info(f"✓ Full todo: ~{full_size:,} bytes")
+            logger.info(f"✓ Minimal: ~{minimal_size:,} bytes")
+            logger.info(f"  Reduction: {(1 - minimal_size/full_size)*100:.1f}%")
 
 
 class TestScalability:
     """Test system behavior under load."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_sequential_search_stability(self, tools):
         """Test stability of repeated sequential searches."""
@@ -230,11 +215,11 @@ class TestScalability:
         max_time = max(timings)
         min_time = min(timings)
 
-        print(f"\n✓ {iterations} sequential searches:")
-        print(f"  Avg: {avg_time:.3f}s")
-        print(f"  Min: {min_time:.3f}s")
-        print(f"  Max: {max_time:.3f}s")
-        print(f"  Variance: {max_time - min_time:.3f}s")
+        logger.info(f"✓ {iterations} sequential searches:")
+        logger.info(f"  Avg: {avg_time:.3f}s")
+        logger.info(f"  Min: {min_time:.3f}s")
+        logger.info(f"  Max: {max_time:.3f}s")
+        logger.info(f"  Variance: {max_time - min_time:.3f}s")
 
         # Check stability (max should not be more than 2x avg)
         assert max_time < avg_time * 2, "Unstable performance detected"
@@ -253,20 +238,13 @@ class TestScalability:
 
         duration = time.perf_counter() - start
 
-        print(f"\n✓ 5 mixed operations in {duration:.3f}s")
-        print(f"  Avg per operation: {duration/5:.3f}s")
+        logger.info(f"✓ 5 mixed operations in {duration:.3f}s")
+        logger.info(f"  Avg per operation: {duration/5:.3f}s")
 
 
 class TestCacheEffects:
     """Test caching behavior and effects on performance."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_repeated_query_performance(self, tools):
         """Test if repeated queries show cache effects."""
@@ -288,9 +266,9 @@ class TestCacheEffects:
         result3 = await tools.search_todos(query=query, limit=50)
         time3 = time.perf_counter() - start
 
-        print(f"\n✓ Query 1 (cold): {time1:.3f}s, {len(result1)} results")
-        print(f"✓ Query 2 (immediate): {time2:.3f}s, {len(result2)} results")
-        print(f"✓ Query 3 (after delay): {time3:.3f}s, {len(result3)} results")
+        logger.info(f"✓ Query 1 (cold): {time1:.3f}s, {len(result1)} results")
+        logger.info(f"✓ Query 2 (immediate): {time2:.3f}s, {len(result2)} results")
+        logger.info(f"✓ Query 3 (after delay): {time3:.3f}s, {len(result3)} results")
 
         # Results should be consistent
         assert len(result1) == len(result2) == len(result3)
@@ -299,49 +277,43 @@ class TestCacheEffects:
 class TestPerformanceSummary:
     """Generate comprehensive performance report."""
 
-    @pytest.fixture
-    async def tools(self):
-        """Create ThingsTools instance for testing."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
-        yield tools
-
     @pytest.mark.asyncio
     async def test_generate_performance_report(self, tools):
         """Generate comprehensive performance summary."""
-        print("\n" + "="*70)
-        print("SEARCH & FILTER PERFORMANCE REPORT")
-        print("="*70)
+        lines = []
+        lines.append("\n" + "="*70)
+        lines.append("SEARCH & FILTER PERFORMANCE REPORT")
+        lines.append("="*70)
 
         # Test 1: Basic search across limits
-        print("\n1. BASIC SEARCH PERFORMANCE")
+        lines.append("\n1. BASIC SEARCH PERFORMANCE")
         for limit in [10, 50, 100, 500]:
             start = time.perf_counter()
             results = await tools.search_todos(query="test", limit=limit)
             duration = time.perf_counter() - start
-            print(f"   Limit {limit:3d}: {duration:.3f}s ({len(results)} results)")
+            lines.append(f"   Limit {limit:3d}: {duration:.3f}s ({len(results)} results)")
 
         # Test 2: Advanced search
-        print("\n2. ADVANCED SEARCH PERFORMANCE")
+        lines.append("\n2. ADVANCED SEARCH PERFORMANCE")
         start = time.perf_counter()
         results = await tools.search_advanced(status='incomplete', limit=100)
         duration = time.perf_counter() - start
-        print(f"   Status filter: {duration:.3f}s ({len(results)} results)")
+        lines.append(f"   Status filter: {duration:.3f}s ({len(results)} results)")
 
         # Test 3: Tag operations
-        print("\n3. TAG OPERATIONS PERFORMANCE")
+        lines.append("\n3. TAG OPERATIONS PERFORMANCE")
         start = time.perf_counter()
         tags = await tools.get_tags(include_items=False)
         duration = time.perf_counter() - start
-        print(f"   Get tags (counts): {duration:.3f}s ({len(tags)} tags)")
+        lines.append(f"   Get tags (counts): {duration:.3f}s ({len(tags)} tags)")
 
         start = time.perf_counter()
         tags_full = await tools.get_tags(include_items=True)
         duration = time.perf_counter() - start
-        print(f"   Get tags (items): {duration:.3f}s ({len(tags_full)} tags)")
+        lines.append(f"   Get tags (items): {duration:.3f}s ({len(tags_full)} tags)")
 
         # Test 4: List operations
-        print("\n4. LIST OPERATIONS PERFORMANCE")
+        lines.append("\n4. LIST OPERATIONS PERFORMANCE")
         for list_name, list_func in [
             ('Today', tools.get_today),
             ('Inbox', tools.get_inbox),
@@ -351,29 +323,30 @@ class TestPerformanceSummary:
             start = time.perf_counter()
             results = await list_func()
             duration = time.perf_counter() - start
-            print(f"   {list_name:12s}: {duration:.3f}s ({len(results)} items)")
+            lines.append(f"   {list_name:12s}: {duration:.3f}s ({len(results)} items)")
 
         # Test 5: Concurrent throughput
-        print("\n5. CONCURRENT OPERATIONS")
+        lines.append("\n5. CONCURRENT OPERATIONS")
         queries = ["test", "meeting", "project", "work", "call"]
         start = time.perf_counter()
         tasks = [tools.search_todos(query=q, limit=20) for q in queries]
         results = await asyncio.gather(*tasks)
         duration = time.perf_counter() - start
         total = sum(len(r) for r in results)
-        print(f"   {len(queries)} parallel searches: {duration:.3f}s "
-              f"({total} total results)")
-        print(f"   Throughput: {len(queries)/duration:.1f} operations/sec")
+        lines.append(f"   {len(queries)} parallel searches: {duration:.3f}s "
+                     f"({total} total results)")
+        lines.append(f"   Throughput: {len(queries)/duration:.1f} operations/sec")
 
-        print("\n" + "="*70)
-        print("PERFORMANCE CHARACTERISTICS:")
-        print("  - Direct database access via things.py")
-        print("  - Read operations are fast (typically < 1s)")
-        print("  - Scales well with result set size")
-        print("  - Good concurrent operation support")
-        print("  - Tag operations optimized for counts")
-        print("="*70 + "\n")
+        lines.append("\n" + "="*70)
+        lines.append("PERFORMANCE CHARACTERISTICS:")
+        lines.append("  - Direct database access via things.py")
+        lines.append("  - Read operations are fast (typically < 1s)")
+        lines.append("  - Scales well with result set size")
+        lines.append("  - Good concurrent operation support")
+        lines.append("  - Tag operations optimized for counts")
+        lines.append("="*70)
+        logger.info("\n".join(lines))
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-s"])
\ No newline at end of file
+    pytest.main([__file__, "-v", "-o", "log_cli=true"])
\ No newline at end of file
@@ -12,23 +12,18 @@ import pytest
 from datetime import datetime, date, timedelta
 from freezegun import freeze_time
 
-from things_mcp.tools import ThingsTools
-from things_mcp.services.applescript_manager import AppleScriptManager
-
 
 class TestTodayQueries:
     """Test queries for todos scheduled for today."""
 
     @pytest.mark.asyncio
-    async def test_get_today_returns_today_todos(self, cleanup_test_todos):
+    async def test_get_today_returns_today_todos(self, things_tools, cleanup_test_todos):
         """Verify get_today() returns todos scheduled for today."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create 3 todos scheduled for today
         todo_ids = []
         for i in range(3):
-            result = await tools.add_todo(
+            result = await things_tools.add_todo(
                 title=f"Today todo {i} {cleanup_test_todos['tag']}",
                 when="today",
                 tags=cleanup_test_todos['tag']
@@ -37,7 +32,7 @@ class TestTodayQueries:
             todo_ids.append(result['todo_id'])
 
         # Query today's todos
-        today_todos = await tools.get_today()
+        today_todos = await things_tools.get_today()
 
         # Verify our todos are in the results
         today_ids = [todo['uuid'] for todo in today_todos]
@@ -47,13 +42,11 @@ class TestTodayQueries:
         print(f"✓ Created 3 todos, found in get_today() results")
 
     @pytest.mark.asyncio
-    async def test_get_today_excludes_tomorrow(self, cleanup_test_todos):
+    async def test_get_today_excludes_tomorrow(self, things_tools, cleanup_test_todos):
         """Verify get_today() excludes todos scheduled for tomorrow."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create one todo for today
-        today_result = await tools.add_todo(
+        today_result = await things_tools.add_todo(
             title=f"Today {cleanup_test_todos['tag']}",
             when="today",
             tags=cleanup_test_todos['tag']
@@ -61,7 +54,7 @@ class TestTodayQueries:
         cleanup_test_todos['ids'].append(today_result['todo_id'])
 
         # Create one todo for tomorrow
-        tomorrow_result = await tools.add_todo(
+        tomorrow_result = await things_tools.add_todo(
             title=f"Tomorrow {cleanup_test_todos['tag']}",
             when="tomorrow",
             tags=cleanup_test_todos['tag']
@@ -69,7 +62,7 @@ class TestTodayQueries:
         cleanup_test_todos['ids'].append(tomorrow_result['todo_id'])
 
         # Query today's todos
-        today_todos = await tools.get_today()
+        today_todos = await things_tools.get_today()
         today_ids = [todo['uuid'] for todo in today_todos]
 
         # Verify today's todo is included
@@ -85,10 +78,8 @@ class TestUpcomingQueries:
     """Test queries for upcoming todos."""
 
     @pytest.mark.asyncio
-    async def test_get_upcoming_in_7_days(self, cleanup_test_todos):
+    async def test_get_upcoming_in_7_days(self, things_tools, cleanup_test_todos):
         """Verify get_upcoming(7) returns todos within 7 days."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todos for various future dates
         today = date.today()
@@ -97,7 +88,7 @@ class TestUpcomingQueries:
         # Day 1, 3, 5 (within 7 days)
         for day_offset in [1, 3, 5]:
             future_date = today + timedelta(days=day_offset)
-            result = await tools.add_todo(
+            result = await things_tools.add_todo(
                 title=f"Day {day_offset} {cleanup_test_todos['tag']}",
                 when=future_date.strftime('%Y-%m-%d'),
                 tags=cleanup_test_todos['tag']
@@ -108,7 +99,7 @@ class TestUpcomingQueries:
         # Day 10, 15 (beyond 7 days)
         for day_offset in [10, 15]:
             future_date = today + timedelta(days=day_offset)
-            result = await tools.add_todo(
+            result = await things_tools.add_todo(
                 title=f"Day {day_offset} {cleanup_test_todos['tag']}",
                 when=future_date.strftime('%Y-%m-%d'),
                 tags=cleanup_test_todos['tag']
@@ -117,7 +108,7 @@ class TestUpcomingQueries:
             test_todos.append((day_offset, result['todo_id']))
 
         # Query upcoming in 7 days
-        upcoming = await tools.get_upcoming(days=7)
+        upcoming = await things_tools.get_upcoming(days=7)
         upcoming_ids = [todo['uuid'] for todo in upcoming]
 
         # Verify days 1-7 are included
@@ -131,10 +122,8 @@ class TestUpcomingQueries:
         print(f"✓ get_upcoming(7) returned correct todos")
 
     @pytest.mark.asyncio
-    async def test_get_upcoming_in_30_days(self, cleanup_test_todos):
+    async def test_get_upcoming_in_30_days(self, things_tools, cleanup_test_todos):
         """Verify get_upcoming(30) returns todos within 30 days."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todos at various intervals
         today = date.today()
@@ -142,7 +131,7 @@ class TestUpcomingQueries:
 
         for day_offset in test_dates:
             future_date = today + timedelta(days=day_offset)
-            result = await tools.add_todo(
+            result = await things_tools.add_todo(
                 title=f"Day {day_offset} {cleanup_test_todos['tag']}",
                 when=future_date.strftime('%Y-%m-%d'),
                 tags=cleanup_test_todos['tag']
@@ -150,7 +139,7 @@ class TestUpcomingQueries:
             cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Query upcoming in 30 days
-        upcoming = await tools.get_upcoming(days=30)
+        upcoming = await things_tools.get_upcoming(days=30)
         upcoming_ids = [todo['uuid'] for todo in upcoming]
 
         # Should have at least our test todos
@@ -159,14 +148,12 @@ class TestUpcomingQueries:
         print(f"✓ get_upcoming(30) returned {len(upcoming_ids)} todos")
 
     @pytest.mark.asyncio
-    async def test_get_upcoming_excludes_past(self, cleanup_test_todos):
+    async def test_get_upcoming_excludes_past(self, things_tools, cleanup_test_todos):
         """Verify get_upcoming() excludes past todos."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create a past todo (yesterday)
         yesterday = date.today() - timedelta(days=1)
-        past_result = await tools.add_todo(
+        past_result = await things_tools.add_todo(
             title=f"Past {cleanup_test_todos['tag']}",
             when=yesterday.strftime('%Y-%m-%d'),
             tags=cleanup_test_todos['tag']
@@ -175,7 +162,7 @@ class TestUpcomingQueries:
 
         # Create a future todo
         tomorrow = date.today() + timedelta(days=1)
-        future_result = await tools.add_todo(
+        future_result = await things_tools.add_todo(
             title=f"Future {cleanup_test_todos['tag']}",
             when=tomorrow.strftime('%Y-%m-%d'),
             tags=cleanup_test_todos['tag']
@@ -183,7 +170,7 @@ class TestUpcomingQueries:
         cleanup_test_todos['ids'].append(future_result['todo_id'])
 
         # Query upcoming
-        upcoming = await tools.get_upcoming(days=7)
+        upcoming = await things_tools.get_upcoming(days=7)
         upcoming_ids = [todo['uuid'] for todo in upcoming]
 
         # Past todo should be excluded
@@ -199,14 +186,12 @@ class TestDeadlineQueries:
     """Test queries for todos with deadlines."""
 
     @pytest.mark.asyncio
-    async def test_search_by_deadline(self, cleanup_test_todos):
+    async def test_search_by_deadline(self, things_tools, cleanup_test_todos):
         """Verify searching by specific deadline date."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todo with specific deadline
         target_date = date.today() + timedelta(days=14)
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Deadline test {cleanup_test_todos['tag']}",
             deadline=target_date.strftime('%Y-%m-%d'),
             tags=cleanup_test_todos['tag']
@@ -214,7 +199,7 @@ class TestDeadlineQueries:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Search by deadline
-        search_results = await tools.search_advanced(
+        search_results = await things_tools.search_advanced(
             deadline=target_date.strftime('%Y-%m-%d'),
             limit=100
         )
@@ -226,10 +211,8 @@ class TestDeadlineQueries:
         print(f"✓ Search by deadline found todo")
 
     @pytest.mark.asyncio
-    async def test_get_due_in_7_days(self, cleanup_test_todos):
+    async def test_get_due_in_7_days(self, things_tools, cleanup_test_todos):
         """Verify get_due_in_days(7) returns todos with deadlines within 7 days."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create todos with various deadlines
         today = date.today()
@@ -237,7 +220,7 @@ class TestDeadlineQueries:
         # Within 7 days
         for day_offset in [3, 5, 7]:
             future_date = today + timedelta(days=day_offset)
-            result = await tools.add_todo(
+            result = await things_tools.add_todo(
                 title=f"Due day {day_offset} {cleanup_test_todos['tag']}",
                 deadline=future_date.strftime('%Y-%m-%d'),
                 tags=cleanup_test_todos['tag']
@@ -246,7 +229,7 @@ class TestDeadlineQueries:
 
         # Beyond 7 days
         far_date = today + timedelta(days=20)
-        far_result = await tools.add_todo(
+        far_result = await things_tools.add_todo(
             title=f"Due day 20 {cleanup_test_todos['tag']}",
             deadline=far_date.strftime('%Y-%m-%d'),
             tags=cleanup_test_todos['tag']
@@ -254,7 +237,7 @@ class TestDeadlineQueries:
         cleanup_test_todos['ids'].append(far_result['todo_id'])
 
         # Query due in 7 days
-        due_soon = await tools.get_due_in_days(days=7)
+        due_soon = await things_tools.get_due_in_days(days=7)
         due_ids = [todo['uuid'] for todo in due_soon]
 
         # Should have at least 3 todos
@@ -264,17 +247,15 @@ class TestDeadlineQueries:
         print(f"✓ get_due_in_days(7) returned {len(due_soon)} todos")
 
     @pytest.mark.asyncio
-    async def test_deadline_and_start_date_separate(self, cleanup_test_todos):
+    async def test_deadline_and_start_date_separate(self, things_tools, cleanup_test_todos):
         """Verify deadline search doesn't mix with start_date."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         today = date.today()
         start_date = today + timedelta(days=5)
         deadline_date = today + timedelta(days=10)
 
         # Create todo with both start date and deadline
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"Both dates {cleanup_test_todos['tag']}",
             when=start_date.strftime('%Y-%m-%d'),
             deadline=deadline_date.strftime('%Y-%m-%d'),
@@ -283,7 +264,7 @@ class TestDeadlineQueries:
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Search by deadline
-        deadline_results = await tools.search_advanced(
+        deadline_results = await things_tools.search_advanced(
             deadline=deadline_date.strftime('%Y-%m-%d'),
             limit=100
         )
@@ -291,7 +272,7 @@ class TestDeadlineQueries:
         assert result['todo_id'] in deadline_ids, "Todo not found when searching by deadline"
 
         # Search by start_date
-        start_results = await tools.search_advanced(
+        start_results = await things_tools.search_advanced(
             start_date=start_date.strftime('%Y-%m-%d'),
             limit=100
         )
@@ -305,23 +286,21 @@ class TestLogbookQueries:
     """Test queries for completed todos in logbook."""
 
     @pytest.mark.asyncio
-    async def test_logbook_by_period(self, cleanup_test_todos):
+    async def test_logbook_by_period(self, things_tools, cleanup_test_todos):
         """Verify get_logbook(period='3d') returns recently completed todos."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create and complete a todo
-        result = await tools.add_todo(
+        result = await things_tools.add_todo(
             title=f"To complete {cleanup_test_todos['tag']}",
             tags=cleanup_test_todos['tag']
         )
         cleanup_test_todos['ids'].append(result['todo_id'])
 
         # Complete it
-        await tools.update_todo(todo_id=result['todo_id'], completed="true")
+        await things_tools.update_todo(todo_id=result['todo_id'], completed="true")
 
         # Query logbook
-        logbook = await tools.get_logbook(period="3d", limit=50)
+        logbook = await things_tools.get_logbook(period="3d", limit=50)
 
         # Verify our completed todo is in logbook
         logbook_ids = [todo['uuid'] for todo in logbook]
@@ -330,28 +309,26 @@ class TestLogbookQueries:
         print(f"✓ Completed todo found in logbook")
 
     @pytest.mark.asyncio
-    async def test_logbook_excludes_incomplete(self, cleanup_test_todos):
+    async def test_logbook_excludes_incomplete(self, things_tools, cleanup_test_todos):
         """Verify logbook only returns completed todos."""
-        manager = AppleScriptManager()
-        tools = ThingsTools(manager)
 
         # Create incomplete todo
-        incomplete_result = await tools.add_todo(
+        incomplete_result = await things_tools.add_todo(
             title=f"Incomplete {cleanup_test_todos['tag']}",
             tags=cleanup_test_todos['tag']
         )
         cleanup_test_todos['ids'].append(incomplete_result['todo_id'])
 
         # Create and complete another todo
-        complete_result = await tools.add_todo(
+        complete_result = await things_tools.add_todo(
             title=f"Complete {cleanup_test_todos['tag']}",
             tags=cleanup_test_todos['tag']
         )
         cleanup_test_todos['ids'].append(complete_result['todo_id'])
-        await tools.update_todo(todo_id=complete_result['todo_id'], completed="true")
+        await things_tools.update_todo(todo_id=complete_result['todo_id'], completed="true")
 
         # Query logbook
-        logbook = await tools.get_logbook(period="7d", limit=50)
+        logbook = await things_tools.get_logbook(period="7d", limit=50)
         logbook_ids = [todo['uuid'] for todo in logbook]
 
         # Incomplete should not be in logbook
@@ -419,3 +419,195 @@ class TestRetryLogic:
             assert sleep_calls[0] == 1  # First retry: 2^0 = 1
 
 
+
+
+class TestOSAKitBridge:
+    """Test in-process AppleScript execution via the OSAKit bridge."""
+
+    @staticmethod
+    def _mock_nsapplescript(descriptor, error_info=None):
+        """Build a mock NSAppleScript class returning the given result."""
+        mock_class = MagicMock()
+        script_instance = mock_class.alloc.return_value.initWithSource_.return_value
+        script_instance.executeAndReturnError_.return_value = (descriptor, error_info)
+        return mock_class
+
+    def test_falls_back_to_osascript_without_pyobjc(self):
+        """Test the bridge is disabled when PyObjC is unavailable."""
+        with patch('things_mcp.services.applescript.executor.NSAppleScript', None):
+            manager = AppleScriptManager(config=ThingsMCPConfig(use_osakit_bridge=True))
+
+        assert manager.executor.use_osakit is False
+
+    @pytest.mark.asyncio
+    async def test_execute_applescript_via_osakit(self):
+        """Test scripts run through NSAppleScript without spawning osascript."""
+        descriptor = MagicMock()
+        descriptor.descriptorType.return_value = int.from_bytes(b"utxt", "big")
+        descriptor.stringValue.return_value = "3.21.15"
+
+        with patch('things_mcp.services.applescript.executor.NSAppleScript',
+                   self._mock_nsapplescript(descriptor)):
+            manager = AppleScriptManager(timeout=5, retry_count=1,
+                                         config=ThingsMCPConfig(use_osakit_bridge=True))
+            with patch('asyncio.create_subprocess_exec') as mock_create:
+                result = await manager.execute_applescript('tell application "Things3" to return version')
+
+        assert result["success"] is True
+        assert result["output"] == "3.21.15"
+        assert "execution_time" in result
+        mock_create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_osakit_error_is_reported(self):
+        """Test NSAppleScript errors surface as failed results."""
+        error_info = {"NSAppleScriptErrorMessage": "syntax error", "NSAppleScriptErrorNumber": -2741}
+
+        with patch('things_mcp.services.applescript.executor.NSAppleScript',
+                   self._mock_nsapplescript(None, error_info)):
+            manager = AppleScriptManager(timeout=5, retry_count=1,
+                                         config=ThingsMCPConfig(use_osakit_bridge=True))
+            result = await manager.execute_applescript('invalid applescript')
+
+        assert result["success"] is False
+        assert "syntax error" in result["error"]
+
+    def test_list_descriptor_matches_osascript_format(self):
+        """Test list results are rendered like osascript's human-readable output."""
+        from things_mcp.services.applescript.executor import AppleScriptExecutor
+
+        def text_descriptor(value):
+            item = MagicMock()
+            item.descriptorType.return_value = int.from_bytes(b"utxt", "big")
+            item.stringValue.return_value = value
+            return item
+
+        items = [text_descriptor("Work"), text_descriptor("Home")]
+        list_descriptor = MagicMock()
+        list_descriptor.descriptorType.return_value = int.from_bytes(b"list", "big")
+        list_descriptor.numberOfItems.return_value = len(items)
+        list_descriptor.descriptorAtIndex_.side_effect = lambda index: items[index - 1]
+
+        assert AppleScriptExecutor._descriptor_to_text(list_descriptor) == "Work, Home"
+
+    def test_record_descriptor_matches_osascript_format(self):
+        """Test record results render as osascript's "key:value, ..." so bulk parsers see them."""
+        from things_mcp.services.applescript.executor import AppleScriptExecutor
+
+        def descriptor(type_code, value=None, items=()):
+            item = MagicMock()
+            item.descriptorType.return_value = int.from_bytes(type_code, "big")
+            item.stringValue.return_value = value
+            item.numberOfItems.return_value = len(items)
+            item.descriptorAtIndex_.side_effect = lambda index: items[index - 1]
+            return item
+
+        user_fields = descriptor(b"list", items=[
+            descriptor(b"utxt", "successCount"), descriptor(b"long", "2"),
+            descriptor(b"utxt", "errors"), descriptor(b"list", items=[descriptor(b"utxt", "ID todo-3: not found")]),
+        ])
+        record = descriptor(b"reco", items=[user_fields])
+        record.keywordForDescriptorAtIndex_.return_value = int.from_bytes(b"usrf", "big")
+
+        assert AppleScriptExecutor._descriptor_to_text(record) == "successCount:2, errors:ID todo-3: not found"
+
+    @pytest.mark.parametrize("type_code, value, expected", [
+        (b"true", True, "true"),
+        (b"fals", False, "false"),
+        (b"bool", True, "true"),
+    ])
+    def test_boolean_descriptor_matches_osascript_format(self, type_code, value, expected):
+        """Test boolean results are spelled out instead of rendering as empty text."""
+        from things_mcp.services.applescript.executor import AppleScriptExecutor
+
+        boolean = MagicMock()
+        boolean.descriptorType.return_value = int.from_bytes(type_code, "big")
+        boolean.booleanValue.return_value = value
+
+        assert AppleScriptExecutor._descriptor_to_text(boolean) == expected
+
+    def test_date_descriptor_matches_osascript_format(self):
+        """Test date results are rendered like osascript's 'date "..."' output."""
+        from datetime import datetime
+        from things_mcp.services.applescript.executor import AppleScriptExecutor
+
+        date_descriptor = MagicMock()
+        date_descriptor.descriptorType.return_value = int.from_bytes(b"ldt ", "big")
+        date_descriptor.dateValue.return_value.timeIntervalSince1970.return_value = \
+            datetime(2025, 1, 15, 15, 30, 0).timestamp()
+
+        assert AppleScriptExecutor._descriptor_to_text(date_descriptor) == \
+            "date Wednesday, January 15, 2025 at 3:30:00 PM"
+
+    @pytest.mark.asyncio
+    async def test_osakit_calls_share_one_thread(self):
+        """Test every NSAppleScript call runs on the executor's single dedicated thread."""
+        import threading
+
+        threads = []
+        descriptor = MagicMock()
+        descriptor.descriptorType.return_value = int.from_bytes(b"utxt", "big")
+        descriptor.stringValue.return_value = "ok"
+
+        def execute(_):
+            threads.append(threading.get_ident())
+            return (descriptor, None)
+
+        mock_class = self._mock_nsapplescript(descriptor)
+        mock_class.alloc.return_value.initWithSource_.return_value.executeAndReturnError_.side_effect = execute
+
+        with patch('things_mcp.services.applescript.executor.NSAppleScript', mock_class):
+            manager = AppleScriptManager(timeout=5, retry_count=1,
+                                         config=ThingsMCPConfig(use_osakit_bridge=True))
+            for index in range(3):
+                await manager.execute_applescript(f'return {index}')
+
+        assert len(threads) == 3
+        assert len(set(threads)) == 1
+        assert threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_handler_call_falls_back_to_osascript(self):
+        """Test handler calls are appended to the script when OSAKit is disabled."""
+        manager = AppleScriptManager(timeout=5, retry_count=1)
+        script = 'on greet(who, times)\n    return who\nend greet'
+
+        with patch('asyncio.create_subprocess_exec') as mock_create:
+            mock_process = AsyncMock()
+            mock_process.communicate.return_value = (b'Things "3"', b"")
+            mock_process.returncode = 0
+            mock_create.return_value = mock_process
+
+            result = await manager.execute_applescript_handler(script, "greet", ('Things "3"', 2))
+
+        assert result["success"] is True
+        executed_script = mock_create.call_args[0][2]
+        assert executed_script.startswith(script)
+        assert executed_script.endswith('return greet("Things \\"3\\"", 2)')
+
+    @pytest.mark.asyncio
+    async def test_handler_script_compiled_once(self):
+        """Test the handler script is compiled once and reused across calls."""
+        descriptor = MagicMock()
+        descriptor.descriptorType.return_value = int.from_bytes(b"utxt", "big")
+        descriptor.stringValue.return_value = "scheduled_objects"
+
+        mock_script_class = MagicMock()
+        script_instance = mock_script_class.alloc.return_value.initWithSource_.return_value
+        script_instance.compileAndReturnError_.return_value = (True, None)
+        script_instance.executeAppleEvent_error_.return_value = (descriptor, None)
+
+        with patch('things_mcp.services.applescript.executor.NSAppleScript', mock_script_class), \
+             patch('things_mcp.services.applescript.executor.NSAppleEventDescriptor', MagicMock()):
+            manager = AppleScriptManager(timeout=5, retry_count=1,
+                                         config=ThingsMCPConfig(use_osakit_bridge=True))
+            for day in (1, 2, 3):
+                result = await manager.execute_applescript_handler(
+                    "on schedule_on_date(a, y, m, d)\nend schedule_on_date",
+                    "schedule_on_date",
+                    ("todo-1", 2025, 7, day),
+                )
+                assert result["output"] == "scheduled_objects"
+
+        assert script_instance.compileAndReturnError_.call_count == 1
+        assert script_instance.executeAppleEvent_error_.call_count == 3
@@ -1,9 +1,9 @@
 """
-Unit tests for bulk_update_todos functionality.
+Unit tests for bulk_update_todos and bulk_add_todos functionality.
 """
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from things_mcp.tools import ThingsTools
 
@@ -47,9 +47,7 @@ class TestBulkUpdateTodos:
             call_args = mock_exec.call_args[0][0]
             assert "tell application \"Things3\"" in call_args
             assert "set status of targetTodo to completed" in call_args
-            assert 'to do id "todo-1"' in call_args
-            assert 'to do id "todo-2"' in call_args
-            assert 'to do id "todo-3"' in call_args
+            assert 'repeat with todoRef in {"todo-1", "todo-2", "todo-3"}' in call_args
 
     @pytest.mark.asyncio
     async def test_bulk_update_todos_partial_success(self, tools_with_mocks):
@@ -88,6 +86,25 @@ class TestBulkUpdateTodos:
         # Note: updated_count may not be present in validation error response
         assert result.get("updated_count", 0) == 0
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_todos_duplicate_ids(self, tools_with_mocks):
+        """Test that duplicate IDs are updated only once."""
+        with patch.object(tools_with_mocks.applescript, 'execute_applescript') as mock_exec:
+            mock_exec.return_value = {
+                "success": True,
+                "output": "successCount:2, errors:{}"
+            }
+
+            result = await tools_with_mocks.bulk_update_todos(
+                todo_ids=["todo-1", "todo-2", "todo-1"],
+                completed=True
+            )
+
+            assert result["success"] is True
+            assert result["total_requested"] == 2
+            call_args = mock_exec.call_args[0][0]
+            assert 'repeat with todoRef in {"todo-1", "todo-2"}' in call_args
+
     @pytest.mark.asyncio
     async def test_bulk_update_todos_with_tags(self, tools_with_mocks):
         """Test bulk update with tags (tags will be filtered if they don't exist)."""
@@ -196,4 +213,133 @@ class TestBulkUpdateTodos:
             # Verify AppleScript was called (v1.2.2: when handled via list move, deadline via property)
             call_args = mock_exec.call_args[0][0]
             # Check for either list move (when) or due date (deadline)
-            assert ("move" in call_args.lower() and "today" in call_args.lower()) or "due date" in call_args.lower()
\ No newline at end of file
+            assert ("move" in call_args.lower() and "today" in call_args.lower()) or "due date" in call_args.lower()
+
+class TestBulkAddTodos:
+    """Test bulk_add_todos functionality."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_todos_single_script(self, tools_with_mocks):
+        """Test that all todos are created with one AppleScript call."""
+        specs = [{"title": f"Todo {i}", "notes": f"Notes {i}"} for i in range(3)]
+
+        with patch.object(tools_with_mocks.applescript, 'execute_applescript') as mock_exec:
+            mock_exec.return_value = {
+                "success": True,
+                "output": "id-0,id-1,id-2"
+            }
+
+            result = await tools_with_mocks.bulk_add_todos(specs)
+
+            assert result["success"] is True
+            assert result["todo_ids"] == ["id-0", "id-1", "id-2"]
+            assert result["created_count"] == 3
+
+            mock_exec.assert_called_once()
+            call_args = mock_exec.call_args[0][0]
+            assert call_args.count("make new to do") == 3
+            assert 'name:"Todo 1", notes:"Notes 1"' in call_args
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_todos_partial_failure(self, tools_with_mocks):
+        """Test the todos created before and after a failed create are still reported."""
+        specs = [{"title": f"Todo {i}"} for i in range(3)]
+
+        with patch.object(tools_with_mocks.applescript, 'execute_applescript') as mock_exec:
+            mock_exec.return_value = {
+                "success": True,
+                "output": "id-0,id-2"
+            }
+
+            result = await tools_with_mocks.bulk_add_todos(specs)
+
+            assert result["success"] is False
+            assert result["todo_ids"] == ["id-0", "id-2"]
+            assert result["created_count"] == 2
+
+            call_args = mock_exec.call_args[0][0]
+            assert call_args.count("    try\n") == 3
+            assert call_args.count("    end try\n") == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_todos_empty_list(self, tools_with_mocks):
+        """Test bulk add with no specs."""
+        with patch.object(tools_with_mocks.applescript, 'execute_applescript') as mock_exec:
+            result = await tools_with_mocks.bulk_add_todos([])
+
+            assert result["success"] is False
+            assert result["created_count"] == 0
+            mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_todos_blank_title(self, tools_with_mocks):
+        """Test a blank title fails validation but keeps the bulk add response shape."""
+        with patch.object(tools_with_mocks.applescript, 'execute_applescript') as mock_exec:
+            result = await tools_with_mocks.bulk_add_todos([{"title": "Todo"}, {"title": "   "}])
+
+            assert result["success"] is False
+            assert result["error"] == "VALIDATION_ERROR"
+            assert result["field"] == "title"
+            assert result["todo_ids"] == []
+            assert result["created_count"] == 0
+            mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_todos_applescript_failure(self, tools_with_mocks):
+        """Test when AppleScript execution fails."""
+        with patch.object(tools_with_mocks.applescript, 'execute_applescript') as mock_exec:
+            mock_exec.return_value = {
+                "success": False,
+                "error": "Things 3 not running"
+            }
+
+            result = await tools_with_mocks.bulk_add_todos([{"title": "Todo"}])
+
+            assert result["success"] is False
+            assert "Things 3 not running" in result["error"]
+            assert result["todo_ids"] == []
+
+
+class TestServerIdListParameters:
+    """Test the MCP tools accept todo_ids as a list or a comma-separated string."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("todo_ids", [
+        [" todo-1 ", "todo-2", ""],
+        " todo-1 , todo-2,",
+    ])
+    async def test_bulk_update_todos_tool_normalizes_ids(self, mock_server, todo_ids):
+        """Test both forms reach bulk_update_todos as the same stripped list."""
+        tool = await mock_server.mcp.get_tool("bulk_update_todos")
+
+        with patch.object(mock_server.tools, 'bulk_update_todos',
+                          AsyncMock(return_value={"success": True})) as mock_update:
+            await tool.run({"todo_ids": todo_ids, "completed": "true"})
+
+        assert mock_update.call_args.kwargs["todo_ids"] == ["todo-1", "todo-2"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("todo_ids", [
+        [" todo-1 ", "todo-2"],
+        "todo-1, todo-2",
+    ])
+    async def test_bulk_move_records_tool_normalizes_ids(self, mock_server, todo_ids):
+        """Test both forms reach bulk_move as the same stripped list."""
+        tool = await mock_server.mcp.get_tool("bulk_move_records")
+
+        with patch.object(mock_server.tools.move_operations, 'bulk_move',
+                          AsyncMock(return_value={"success": True})) as mock_move:
+            await tool.run({"todo_ids": todo_ids, "destination": "today"})
+
+        assert mock_move.call_args.kwargs["todo_ids"] == ["todo-1", "todo-2"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_todos_tool_rejects_blank_ids(self, mock_server):
+        """Test a list of blank IDs is rejected before reaching the tools layer."""
+        tool = await mock_server.mcp.get_tool("bulk_update_todos")
+
+        with patch.object(mock_server.tools, 'bulk_update_todos', AsyncMock()) as mock_update:
+            result = await tool.run({"todo_ids": [" ", ""], "completed": "true"})
+
+        assert result.structured_content["success"] is False
+        mock_update.assert_not_called()
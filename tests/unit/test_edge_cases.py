@@ -34,7 +34,7 @@ class TestBoundaryConditions:
 
         assert result["success"] is True
         # Verify the title was passed through
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
         assert "AAAAAAA" in script  # Should contain part of the long title
 
     @pytest.mark.asyncio
@@ -51,7 +51,7 @@ class TestBoundaryConditions:
         result = await tools_with_mock.add_todo(title="Test", notes=long_notes)
 
         assert result["success"] is True
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
         assert "BBBBBB" in script
 
     @pytest.mark.asyncio
@@ -138,7 +138,7 @@ class TestSpecialCharacters:
 
         assert result["success"] is True
         # Verify quotes were escaped
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
         assert '\\"' in script  # Should have escaped quotes
 
     @pytest.mark.asyncio
@@ -155,7 +155,7 @@ class TestSpecialCharacters:
         result = await tools_with_mock.add_todo(title=title_with_backslash)
 
         assert result["success"] is True
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
         assert '\\\\' in script  # Should have escaped backslashes
 
     @pytest.mark.asyncio
@@ -247,6 +247,38 @@ class TestInvalidInputs:
             with pytest.raises(ValueError, match="Todo not found"):
                 await tools_with_mock.get_todo_by_id("nonexistent-id")
 
+    @pytest.mark.asyncio
+    async def test_get_todos_by_ids_omits_missing(self, tools_with_mock):
+        """Test batch lookup returns found todos keyed by ID and skips unknown IDs."""
+        with patch('things_mcp.tools_helpers.read_operations.things.todos') as mock_todos, \
+             patch('things_mcp.tools_helpers.read_operations.things.checklist_items', return_value=[]):
+            mock_todos.side_effect = lambda status: (
+                [{'uuid': 'todo-1', 'title': 'One', 'status': 'incomplete'},
+                 {'uuid': 'todo-2', 'title': 'Two', 'status': 'incomplete'}]
+                if status == 'incomplete' else []
+            )
+
+            todos = await tools_with_mock.get_todos_by_ids(["todo-1", "nonexistent-id"])
+
+            assert list(todos) == ["todo-1"]
+            assert todos["todo-1"]["title"] == "One"
+            assert mock_todos.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_todos_by_ids_stops_when_all_found(self, tools_with_mock):
+        """Test batch lookup skips the remaining statuses once every ID is found."""
+        with patch('things_mcp.tools_helpers.read_operations.things.todos') as mock_todos, \
+             patch('things_mcp.tools_helpers.read_operations.things.checklist_items', return_value=[]):
+            mock_todos.return_value = [
+                {'uuid': 'todo-1', 'title': 'One', 'status': 'incomplete'},
+                {'uuid': 'todo-2', 'title': 'Two', 'status': 'incomplete'}
+            ]
+
+            todos = await tools_with_mock.get_todos_by_ids(["todo-1", "todo-2"])
+
+            assert sorted(todos) == ["todo-1", "todo-2"]
+            mock_todos.assert_called_once_with(status='incomplete')
+
     @pytest.mark.asyncio
     async def test_invalid_date_format(self, tools_with_mock, mock_applescript_manager):
         """Test creating todo with invalid date format."""
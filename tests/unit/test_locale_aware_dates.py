@@ -45,6 +45,7 @@ from fixtures.date_test_data import (
     MONTH_NAMES_FULL,
     MONTH_NAMES_ABBREVIATED,
     MONTH_NAMES_CASE_VARIATIONS,
+    MONTH_LOOKUP,
     NATURAL_DATES_VALID,
     APPLESCRIPT_OUTPUTS,
     APPLESCRIPT_OUTPUTS_INVALID,
@@ -57,6 +58,7 @@ from fixtures.date_test_data import (
     get_current_date_components,
     calculate_relative_date,
     is_leap_year,
+    last_day_of_month,
 )
 
 
@@ -429,6 +431,15 @@ class TestRelativeDateOffsets:
         expected = (2024, 2, 29)
         assert result == expected
 
+    @pytest.mark.parametrize("start, months, expected", MONTH_OVERFLOW_CASES)
+    def test_month_overflow_cases(self, start, months, expected):
+        """Test +/-Nm clamps the day to the last day of the target month."""
+        with freeze_time(date(*start)):
+            result = LocaleAwareDateHandler().normalize_date_input(f"{months:+d}m")
+
+        assert result == expected
+        assert result[2] == min(start[2], last_day_of_month(result[0], result[1]))
+
     @freeze_time('2025-12-15 10:30:00')
     def test_year_rollover_plus_months(self):
         """Test year rollover with +1m from December."""
@@ -593,6 +604,12 @@ class TestMonthNameParsing:
         result = handler.normalize_date_input("Dec 25, 2024")
         assert result == (2024, 12, 25)
 
+    @pytest.mark.parametrize("month_name, month", sorted(MONTH_LOOKUP.items()))
+    def test_every_month_name(self, month_name, month):
+        """Test every full and abbreviated month name resolves to its month number."""
+        handler = LocaleAwareDateHandler()
+        assert handler.normalize_date_input(f"{month_name} 15, 2025") == (2025, month, 15)
+
     def test_month_name_uppercase(self):
         """Test parsing 'JANUARY 15, 2025'."""
         handler = LocaleAwareDateHandler()
@@ -41,6 +41,14 @@ class TestTodoModel:
         assert todo.modification_date == sample_todo_data["modification_date"]
         assert todo.tag_names == sample_todo_data["tag_names"]
         assert todo.area_name == sample_todo_data["area_name"]
+
+    def test_todo_creation_from_each_sample(self, todo_case):
+        """Test every sample todo in the list data builds a valid Todo."""
+        todo = Todo(**todo_case)
+
+        assert todo.id == todo_case["id"]
+        assert todo.name == todo_case["name"]
+        assert todo.status == todo_case["status"]
     
     def test_todo_validation_empty_name(self):
         """Test todo validation fails with empty name."""
@@ -140,6 +148,13 @@ class TestProjectModel:
         assert project.notes == sample_project_data["notes"]
         assert project.status == sample_project_data["status"]
         assert isinstance(project, Project)  # Type check
+
+    def test_project_creation_from_each_sample(self, single_project_data):
+        """Test every sample project in the list data builds a valid Project."""
+        project = Project(**single_project_data)
+
+        assert project.id == single_project_data["id"]
+        assert project.name == single_project_data["name"]
     
     def test_project_minimal_creation(self):
         """Test creating project with minimal data."""
@@ -292,9 +307,10 @@ class TestTodoResultModel:
         assert result.todo is None
         assert result.todos is None
     
-    def test_todo_result_multiple_todos(self, multiple_todos_data):
+    def test_todo_result_multiple_todos(self, todo_factory):
         """Test todo result with multiple todos."""
-        todos = [Todo(**todo_data) for todo_data in multiple_todos_data]
+        todos_data = todo_factory.build_batch(5)
+        todos = [Todo(**todo_data) for todo_data in todos_data]
         result = TodoResult(
             success=True,
             message="Retrieved todos",
@@ -303,7 +319,7 @@ class TestTodoResultModel:
         
         assert result.success is True
         assert result.todos == todos
-        assert len(result.todos) == len(multiple_todos_data)
+        assert len(result.todos) == len(todos_data)
         assert result.todo is None
     
     def test_todo_result_validation(self):
@@ -72,7 +72,7 @@ class TestMonthOverflowWorkaroundPattern:
         assert 'set day of targetDate to 1' in content
         assert 'set year of targetDate to' in content
         assert 'set month of targetDate to' in content
-        assert 'set day of targetDate to {target_date.day}' in content
+        assert 'set day of targetDate to targetDay' in content
 
         # Verify documentation/comments exist
         assert 'overflow' in content.lower() or 'month' in content.lower()
@@ -251,7 +251,7 @@ class TestMonthOverflowEdgeCases:
 
         # The workaround should be generic (not month-specific)
         # So it handles all months equally
-        assert '{target_date.month}' in content, \
+        assert 'targetMonth' in content, \
             "Should use variable month, not hardcoded values"
 
     def test_february_leap_year_handling(self):
@@ -261,7 +261,7 @@ class TestMonthOverflowEdgeCases:
         content = self._get_file_content("scheduling/strategies.py")
 
         # Should use actual day value, not hardcoded
-        assert '{target_date.day}' in content, \
+        assert 'targetDay' in content, \
             "Should use variable day to handle both Feb 28 and 29"
 
     def test_year_boundary_handling(self):
@@ -275,7 +275,7 @@ class TestMonthOverflowEdgeCases:
 
         # Year should be set before final day
         year_pos = content.find('set year of targetDate')
-        day_pos = content.rfind('set day of targetDate to {target_date.day}')
+        day_pos = content.rfind('set day of targetDate to targetDay')
 
         assert year_pos < day_pos, "Year should be set before final day"
 
@@ -342,7 +342,7 @@ class TestWorkaroundRegressionPrevention:
             day1_pos = content.find('set day of targetDate to 1')
             year_pos = content.find('set year of targetDate to')
             month_pos = content.find('set month of targetDate to')
-            dayN_pos = content.find('set day of targetDate to {target_date.day}')
+            dayN_pos = content.find('set day of targetDate to targetDay')
 
             assert time_pos > 0, "Time reset missing"
             assert day1_pos > time_pos, "Day=1 should come after time reset"
@@ -469,7 +469,7 @@ class TestWorkaroundPerformance:
 
         workaround_section = content[
             content.find('set time of targetDate to 0'):
-            content.find('set day of targetDate to {target_date.day}') + 50
+            content.find('set day of targetDate to targetDay') + 50
         ]
 
         # Count "set" operations in this section
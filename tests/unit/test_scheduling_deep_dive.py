@@ -21,6 +21,8 @@ from things_mcp.tools import ThingsTools
 from things_mcp.pure_applescript_scheduler import PureAppleScriptScheduler
 from things_mcp.services.applescript_manager import AppleScriptManager
 
+from fixtures.mocks import forward_handler_calls
+
 
 # ============================================================================
 # FIXTURES
@@ -32,6 +34,7 @@ def mock_applescript_manager():
     manager = MagicMock(spec=AppleScriptManager)
     manager.execute_applescript = AsyncMock()
     manager.execute_url_scheme = AsyncMock()
+    forward_handler_calls(manager)
     return manager
 
 
@@ -15,6 +15,7 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from things_mcp.tools import ThingsTools
 from things_mcp.services.applescript_manager import AppleScriptManager
+from fixtures.mocks import forward_handler_calls
 
 
 @pytest.fixture
@@ -22,6 +23,7 @@ def mock_applescript_manager():
     """Create a mock AppleScript manager."""
     manager = Mock(spec=AppleScriptManager)
     manager.execute_applescript = AsyncMock()
+    forward_handler_calls(manager)
     return manager
 
 
@@ -471,11 +471,11 @@ class TestAddTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # First call reads current tags
-        first_script = mock_applescript_manager.execution_calls[0]["script"]
+        first_script = mock_applescript_manager.execution_calls[0].script
         assert "return tag names of targetTodo" in first_script
 
         # Second call sets combined tags using comma-separated string format
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         assert 'set tag names of targetTodo to "tags_added, Colin"' in second_script
         assert "return \"tags_added\"" in second_script
 
@@ -505,11 +505,11 @@ class TestAddTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # First call reads current tags
-        first_script = mock_applescript_manager.execution_calls[0]["script"]
+        first_script = mock_applescript_manager.execution_calls[0].script
         assert "return tag names of targetTodo" in first_script
 
         # Second call sets combined tags using comma-separated string format
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         # BUG FIX: Check for comma-separated string, NOT list syntax
         assert 'set tag names of targetTodo to "tags_added, Colin, Anna, Eva"' in second_script
         # BUG FIX: Verify we're NOT using AppleScript list syntax {"tag1", "tag2"}
@@ -540,7 +540,7 @@ class TestAddTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # Second call sets tags with comma-separated string format
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
 
         # Verify tags with spaces are in comma-separated string
         assert 'set tag names of targetTodo to "tags_added, Work Project, High Priority"' in second_script
@@ -584,7 +584,7 @@ class TestAddTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # Second call sets tags with proper escaping
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
 
         # Verify special characters are escaped in the comma-separated string
         assert '\\"' in second_script or 'with' in second_script  # Escaped quotes or the word
@@ -626,11 +626,11 @@ class TestRemoveTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # First call reads current tags
-        first_script = mock_applescript_manager.execution_calls[0]["script"]
+        first_script = mock_applescript_manager.execution_calls[0].script
         assert "return tag names of targetTodo" in first_script
 
         # Second call sets filtered tags (without "test")
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         assert 'set tag names of targetTodo to "other"' in second_script
 
     @pytest.mark.asyncio
@@ -659,11 +659,11 @@ class TestRemoveTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # First call reads current tags
-        first_script = mock_applescript_manager.execution_calls[0]["script"]
+        first_script = mock_applescript_manager.execution_calls[0].script
         assert "return tag names of targetTodo" in first_script
 
         # Second call sets filtered tags (only "Keep" remains)
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         assert 'set tag names of targetTodo to "Keep"' in second_script
         # BUG FIX: Verify we're NOT using AppleScript list syntax
         assert 'tagsToRemove to {' not in second_script
@@ -693,7 +693,7 @@ class TestRemoveTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # Second call sets filtered tags
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         assert 'set tag names of targetTodo to "Keep This"' in second_script
 
     @pytest.mark.asyncio
@@ -720,7 +720,7 @@ class TestRemoveTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # Second call sets filtered tags with proper escaping
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         # Should keep "NormalTag" and properly escape it
         assert 'set tag names of targetTodo to "NormalTag"' in second_script
 
@@ -772,7 +772,7 @@ class TestRemoveTags:
         assert len(mock_applescript_manager.execution_calls) == 2
 
         # Second call sets the same tags (nothing removed)
-        second_script = mock_applescript_manager.execution_calls[1]["script"]
+        second_script = mock_applescript_manager.execution_calls[1].script
         assert 'set tag names of targetTodo to "existing1, existing2"' in second_script
 
 
@@ -807,15 +807,13 @@ class TestBulkUpdateTodos:
 
         # Verify the AppleScript was called
         assert len(mock_applescript_manager.execution_calls) == 1
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
 
-        # Verify all three todos are in the script
-        assert 'to do id "todo-1"' in script
-        assert 'to do id "todo-2"' in script
-        assert 'to do id "todo-3"' in script
+        # Verify all three todos are looped over in the script
+        assert 'repeat with todoRef in {"todo-1", "todo-2", "todo-3"}' in script
 
-        # Verify status is set to completed
-        assert script.count("set status of targetTodo to completed") == 3
+        # Verify status is set to completed once, inside the loop
+        assert script.count("set status of targetTodo to completed") == 1
 
     @pytest.mark.asyncio
     async def test_bulk_update_multi_field_tags_and_when(self, tools_with_mock, mock_applescript_manager):
@@ -860,11 +858,12 @@ class TestBulkUpdateTodos:
         calls = mock_applescript_manager.execution_calls
         assert len(calls) >= 1, "Should have at least the bulk update call"
 
-        bulk_update_script = calls[0]["script"]
+        bulk_update_script = calls[0].script
 
-        # CRITICAL: Verify tags are in the bulk update script
+        # CRITICAL: Verify tags are in the bulk update script, applied inside the per-todo loop
         tag_updates = bulk_update_script.count('set tag names of targetTodo to')
-        assert tag_updates == 2, f"Expected 2 tag updates (one per todo), found {tag_updates}"
+        assert tag_updates == 1, f"Expected 1 tag update inside the loop, found {tag_updates}"
+        assert 'repeat with todoRef in' in bulk_update_script
 
         # CRITICAL: Verify NO activation date in bulk update (handled separately now)
         assert 'set activation date of targetTodo to' not in bulk_update_script, \
@@ -874,7 +873,7 @@ class TestBulkUpdateTodos:
         assert 'set tag names of targetTodo to "urgent, test"' in bulk_update_script
 
         # Verify scheduling happened separately (calls after the first one)
-        scheduling_calls = [c for c in calls[1:] if 'schedule theTodo' in c.get('script', '') or 'move theTodo' in c.get('script', '')]
+        scheduling_calls = [c for c in list(calls)[1:] if 'schedule theTodo' in c.script or 'move theTodo' in c.script]
         assert len(scheduling_calls) > 0, "Should have separate scheduling calls"
 
         # Verify scheduling info in result
@@ -913,7 +912,7 @@ class TestBulkUpdateTodos:
         # The first call is the bulk update (without 'when')
         calls = mock_applescript_manager.execution_calls
         assert len(calls) >= 1
-        bulk_script = calls[0]["script"]
+        bulk_script = calls[0].script
 
         # Verify all fields EXCEPT 'when' are in the bulk update
         assert 'set name of targetTodo to' in bulk_script
@@ -959,7 +958,7 @@ class TestBulkUpdateTodos:
 
         # Verify the AppleScript was called
         assert len(mock_applescript_manager.execution_calls) == 1
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
 
         # Verify canceled status is set (not completed)
         assert 'set status of targetTodo to canceled' in script
@@ -1036,7 +1035,7 @@ class TestBulkUpdateTodos:
 
         # Verify the AppleScript was called
         assert len(mock_applescript_manager.execution_calls) == 1
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
 
         # BUG FIX v1.2.3: Verify tags are in comma-separated string format
         assert 'set tag names of targetTodo to "Work, Urgent"' in script
@@ -1067,14 +1066,15 @@ class TestBulkUpdateTodos:
 
         # Verify the AppleScript was called
         assert len(mock_applescript_manager.execution_calls) == 1
-        script = mock_applescript_manager.execution_calls[0]["script"]
+        script = mock_applescript_manager.execution_calls[0].script
 
-        # CRITICAL: Both fields should be applied to all todos
+        # CRITICAL: Both fields should be applied to all todos via the loop
+        assert 'repeat with todoRef in {"todo-1", "todo-2", "todo-3"}' in script
         notes_updates = script.count('set notes of targetTodo to')
         deadline_updates = script.count('set due date of targetTodo to')
 
-        assert notes_updates == 3, f"Expected 3 notes updates, found {notes_updates}"
-        assert deadline_updates == 3, f"Expected 3 deadline updates, found {deadline_updates}"
+        assert notes_updates == 1, f"Expected 1 notes update inside the loop, found {notes_updates}"
+        assert deadline_updates == 1, f"Expected 1 deadline update inside the loop, found {deadline_updates}"
 
         # Verify values
         assert 'Updated notes for all' in script